@@ -0,0 +1,115 @@
+"""Event store write throughput and player lookups: text log vs SQLite vs memory.
+
+PYTHONPATH=src python benchmarks/bench_event_store.py --dispatches 20000
+"""
+
+from __future__ import annotations
+
+import argparse
+import tempfile
+import time
+from collections.abc import Callable
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+
+from timebank_app.domain.events import Event, ev
+from timebank_app.infra.event_store import EventStore, MemoryEventStore, SqliteEventStore
+from timebank_app.infra.log_reader import iter_log_records
+from timebank_app.infra.logging import LogWriter
+
+PLAYERS = [f"Player {index}" for index in range(10)]
+
+
+def dispatch_batches(dispatches: int) -> list[list[tuple[str, Event]]]:
+    """A tap's worth of events per dispatch, rotating through the table."""
+    batches = []
+    for index in range(dispatches):
+        player = PLAYERS[index % len(PLAYERS)]
+        following = PLAYERS[(index + 1) % len(PLAYERS)]
+        game_id = f"game-{index // 500}"
+        batches.append(
+            [
+                (game_id, ev("RUNTIME_SYNC", player=player, bank_after=512.25, now_mono=index)),
+                (
+                    game_id,
+                    ev(
+                        "TURN_END",
+                        player=player,
+                        bank_after=512.25,
+                        spent_no_cooldown=7.5,
+                        now_mono=float(index),
+                    ),
+                ),
+                (game_id, ev("TURN_START", player=following, phase="cooldown", now_mono=index)),
+            ]
+        )
+    return batches
+
+
+def write(store: EventStore, batches: list[list[tuple[str, Event]]]) -> float:
+    started = time.perf_counter()
+    for batch in batches:
+        store.append_batch(batch)
+    elapsed = time.perf_counter() - started
+    store.close()
+    return elapsed
+
+
+def timed(label: str, runs: int, body: Callable[[], object]) -> None:
+    started = time.perf_counter()
+    found = body()
+    elapsed = time.perf_counter() - started
+    print(f"{label:<34} {elapsed * 1e3 / runs:9.3f} ms/query  ({len(found)} rows)")
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--dispatches", type=int, default=20_000)
+    args = parser.parse_args(argv)
+    batches = dispatch_batches(args.dispatches)
+    events = 3 * len(batches)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        log = root / "events.log"
+        db = root / "events.sqlite3"
+        per_event = LogWriter(root / "per_event.log")
+        started = time.perf_counter()
+        for batch in batches:
+            for game_id, event in batch:
+                per_event.append(game_id, event)
+        rows = [
+            ("log, append per event", time.perf_counter() - started),
+            ("log, append_batch", write(LogWriter(log), batches)),
+            ("sqlite WAL, append_batch", write(SqliteEventStore(db), batches)),
+            ("memory, append_batch", write(MemoryEventStore(), batches)),
+        ]
+        print(f"{args.dispatches} dispatches, {events} events")
+        for label, elapsed in rows:
+            print(f"{label:<34} {events / elapsed:>10,.0f} events/s")
+
+        now = datetime.now(tz=UTC)
+        since = (now - timedelta(days=30)).isoformat(timespec="milliseconds")
+        store = SqliteEventStore(db)
+
+        def scan_log() -> list:
+            return [
+                record
+                for record in iter_log_records(log, event_types={"TURN_END"})
+                if record.fields.get("player") == "Player 3" and record.stamp >= since
+            ]
+
+        def sqlite_lookup() -> list:
+            return store.query(
+                event_types=["TURN_END"], player="Player 3", since=now - timedelta(days=30)
+            )
+
+        print("TURN_END for one player in the last 30 days:")
+        timed("log scan", 1, scan_log)
+        timed("sqlite index", 1, sqlite_lookup)
+        store.close()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,77 @@
+"""Log line encoding cost: ``utc_stamp`` + ``format_line`` vs ``StampClock`` + ``LineEncoder``.
+
+PYTHONPATH=src python benchmarks/bench_log_encoder.py --events 60000
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import time
+from collections.abc import Callable
+
+from timebank_app.domain.events import Event, ev
+from timebank_app.infra.logging import LineEncoder, StampClock, format_line, utc_stamp
+
+
+def tap_events(count: int) -> list[tuple[str, Event]]:
+    """The events of a tap, repeated: one sync, the end of a turn and the next start."""
+    events = []
+    for index in range(count // 3):
+        player = f"Player {index % 6}"
+        events += [
+            ("1712345", ev("RUNTIME_SYNC", player=player, bank_after=512.25, now_mono=index)),
+            (
+                "1712345",
+                ev("TURN_END", player=player, bank_after=512.25, spent_no_cooldown=7.5),
+            ),
+            ("1712345", ev("TURN_START", player=player, phase="cooldown", now_mono=index)),
+        ]
+    return events
+
+
+def best_of(rounds: int, body: Callable[[], list[str]]) -> tuple[float, list[str]]:
+    """Fastest of ``rounds`` runs with the garbage collector off, and its output."""
+    best = float("inf")
+    lines: list[str] = []
+    gc.disable()
+    try:
+        for _ in range(rounds):
+            started = time.perf_counter()
+            lines = body()
+            best = min(best, time.perf_counter() - started)
+    finally:
+        gc.enable()
+    return best, lines
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--events", type=int, default=60_000)
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args(argv)
+    events = tap_events(args.events)
+    numbered = [(seq, game_id, event) for seq, (game_id, event) in enumerate(events, 1)]
+    stamps = StampClock()
+    encode = LineEncoder().encode
+
+    def reference() -> list[str]:
+        return [format_line(utc_stamp(), seq, game, event) for seq, game, event in numbered]
+
+    def compiled() -> list[str]:
+        return [encode(stamps(), seq, game, event) for seq, game, event in numbered]
+
+    baseline, expected = best_of(args.rounds, reference)
+    elapsed, encoded = best_of(args.rounds, compiled)
+    same = [line.split(" ", 1)[1] for line in expected] == [
+        line.split(" ", 1)[1] for line in encoded
+    ]
+    print(f"{len(events)} events, bodies identical: {same}")
+    for label, seconds in (("format_line", baseline), ("LineEncoder", elapsed)):
+        print(f"{label:<14} {seconds * 1e9 / len(events):8.0f} ns/event")
+    print(f"speedup        {baseline / elapsed:8.2f}x")
+    return 0 if same else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,89 @@
+"""Season-report column loading: one process vs a process pool.
+
+PYTHONPATH=src python benchmarks/bench_parallel_scan.py --mb 200 --workers 1 2 4 8
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import tempfile
+import time
+from pathlib import Path
+
+from timebank_app.app.analytics import load_columns, load_columns_parallel
+from timebank_app.domain.events import ev
+from timebank_app.infra.logging import format_line
+
+PLAYERS = [f"Player {index}" for index in range(8)]
+
+
+def write_log(path: Path, megabytes: float) -> None:
+    """Synthetic games: each turn is a start, a few syncs, maybe a warning and an end."""
+    limit = int(megabytes * (1 << 20))
+    stamp = "2026-03-01T12:00:00.000+00:00"
+    seq = 0
+    size = 0
+    turn = 0
+    with path.open("w", encoding="utf-8") as handle:
+        handle.write("LOG_FORMAT v=1\n")
+        while size < limit:
+            game_id = f"game-{turn // 400}"
+            player = PLAYERS[turn % len(PLAYERS)]
+            now = turn * 40.0
+            events = [ev("TURN_START", player=player, phase="cooldown", now_mono=now)]
+            events += [
+                ev("RUNTIME_SYNC", player=player, bank_after=600 - step, now_mono=now + step)
+                for step in range(4)
+            ]
+            if turn % 5 == 0:
+                events.append(
+                    ev("WARN_LONG_TURN", player=player, warn_no=1, elapsed_no_cooldown=60)
+                )
+            events.append(
+                ev(
+                    "TURN_END",
+                    player=player,
+                    bank_after=560.5,
+                    spent_no_cooldown=35.0,
+                    now_mono=now,
+                )
+            )
+            lines = []
+            for event in events:
+                seq += 1
+                lines.append(format_line(stamp, seq, game_id, event) + "\n")
+            chunk = "".join(lines)
+            handle.write(chunk)
+            size += len(chunk)
+            turn += 1
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--mb", type=float, default=100.0)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4])
+    parser.add_argument("--chunk-mb", type=float, default=8.0)
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        log = Path(tmp) / "season.log"
+        write_log(log, args.mb)
+        print(f"log {log.stat().st_size / (1 << 20):.0f} MiB, {os.cpu_count()} cores")
+        started = time.perf_counter()
+        rows = len(load_columns([log]))
+        baseline = time.perf_counter() - started
+        print(f"{'load_columns':<22}{baseline:8.2f} s  {rows} rows")
+        for workers in args.workers:
+            started = time.perf_counter()
+            columns = load_columns_parallel(
+                [log], workers=workers, chunk_bytes=int(args.chunk_mb * (1 << 20))
+            )
+            elapsed = time.perf_counter() - started
+            assert len(columns) == rows
+            print(f"{f'parallel x{workers}':<22}{elapsed:8.2f} s  {baseline / elapsed:5.2f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,96 @@
+"""Tap-to-both-screens latency: a follower's tap, dispatched by a leader process.
+
+PYTHONPATH=src python benchmarks/bench_replication.py --taps 500
+"""
+
+from __future__ import annotations
+
+import argparse
+import multiprocessing
+import statistics
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+from timebank_app.app.controller import GameController
+from timebank_app.app.replication import ReplicationFollower, ReplicationLeader
+from timebank_app.domain.commands import CmdStartGame
+from timebank_app.domain.engine import Decider
+from timebank_app.domain.models import OrderDir, PlayerConfig, Rules
+from timebank_app.infra.effects import EffectSink, SoundRepo
+from timebank_app.infra.event_store import MemoryEventStore
+
+PLAYERS = [f"Player {index}" for index in range(6)]
+
+
+def controller(sounds: Path) -> GameController:
+    return GameController(
+        decider=Decider("pw"),
+        log_writer=MemoryEventStore(),
+        effects=EffectSink(),
+        sound_repo=SoundRepo(sounds),
+    )
+
+
+def lead(sounds: Path, addresses, stop) -> None:
+    table = controller(sounds)
+    leader = ReplicationLeader(table, host="127.0.0.1", port=0)
+    leader.dispatch(
+        CmdStartGame(
+            now_mono=time.monotonic(),
+            game_id="bench",
+            players=[PlayerConfig(name=name) for name in PLAYERS],
+            order=PLAYERS,
+            order_dir=OrderDir.CLOCKWISE,
+            rules=Rules(bank_initial=3600, cooldown=0),
+        )
+    )
+    addresses.put(leader.address)
+    stop.wait()
+    leader.close()
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--taps", type=int, default=500)
+    args = parser.parse_args(argv)
+
+    context = multiprocessing.get_context("fork")
+    addresses = context.Queue()
+    stop = context.Event()
+    with tempfile.TemporaryDirectory() as sounds:
+        leader = context.Process(target=lead, args=(Path(sounds), addresses, stop))
+        leader.start()
+        mirror = controller(Path(sounds))
+        turn_ended = threading.Event()
+        mirror.subscribe(
+            lambda _game, _seq, event: event.event_type == "TURN_END" and turn_ended.set()
+        )
+        follower = ReplicationFollower(mirror, addresses.get(timeout=10)).start()
+        follower.wait_synced(10)
+        print(f"clock offset {follower.offset * 1e3:+.3f} ms, best rtt {follower.rtt * 1e3:.3f} ms")
+
+        latencies = []
+        for _ in range(args.taps):
+            turn_ended.clear()
+            started = time.perf_counter()
+            follower.tap()
+            turn_ended.wait(5)
+            latencies.append(time.perf_counter() - started)
+        follower.close()
+        stop.set()
+        leader.join(10)
+
+    latencies.sort()
+    p95 = latencies[int(0.95 * (len(latencies) - 1))]
+    print(f"{len(latencies)} taps, tap -> leader -> follower screen:")
+    print(
+        f"median {statistics.median(latencies) * 1e3:.2f} ms  p95 {p95 * 1e3:.2f} ms"
+        f"  max {latencies[-1] * 1e3:.2f} ms"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
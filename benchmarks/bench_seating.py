@@ -0,0 +1,109 @@
+"""Seat rotation and edits at large tables: list scans vs ``SeatRing``.
+
+PYTHONPATH=src python benchmarks/bench_seating.py --players 200
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+from collections.abc import Callable
+
+from timebank_app.domain.commands import CmdAdminAuth, CmdAdminEdit, CmdStartGame, CmdTap
+from timebank_app.domain.engine import Decider, apply_event
+from timebank_app.domain.models import GameState, OrderDir, PlayerConfig, Rules
+from timebank_app.domain.seating import SeatRing
+
+
+def timed(label: str, runs: int, body: Callable[[], None]) -> None:
+    started = time.perf_counter()
+    body()
+    elapsed = time.perf_counter() - started
+    print(f"{label:<34} {elapsed * 1e6 / runs:9.3f} us/op")
+
+
+def bench_rotation(names: list[str], rounds: int) -> None:
+    runs = rounds * len(names)
+
+    def list_rotation() -> None:
+        current = names[0]
+        for _ in range(runs):
+            current = names[(names.index(current) + 1) % len(names)]
+
+    ring = SeatRing(names)
+
+    def ring_rotation() -> None:
+        current = names[0]
+        for _ in range(runs):
+            current = ring.next(current)
+
+    timed("next seat, list.index", runs, list_rotation)
+    timed("next seat, SeatRing", runs, ring_rotation)
+
+
+def bench_edits(names: list[str]) -> None:
+    runs = len(names) - 1
+
+    def list_edits() -> None:
+        order = list(names)
+        for name in names[:-1]:
+            order = [f"{value}'" if value == name else value for value in order]
+            order = [value for value in order if value != f"{name}'"]
+
+    def ring_edits() -> None:
+        ring = SeatRing(names)
+        for name in names[:-1]:
+            ring.rename(name, f"{name}'")
+            ring.remove(f"{name}'")
+
+    timed("rename + remove, list rebuild", runs, list_edits)
+    timed("rename + remove, SeatRing", runs, ring_edits)
+
+
+def bench_taps(names: list[str], rounds: int) -> None:
+    decider = Decider("pw")
+    state = GameState()
+    now = 0.0
+    start = CmdStartGame(
+        now_mono=now,
+        game_id="bench",
+        players=[PlayerConfig(name=name) for name in names],
+        order=names,
+        order_dir=OrderDir.CLOCKWISE,
+        rules=Rules(bank_initial=1e9, cooldown=0.0),
+    )
+    for command in (start, CmdAdminAuth(now_mono=now, password="pw")):
+        for event in decider.decide(state, command):
+            state = apply_event(state, event)
+    runs = rounds * len(names)
+
+    def taps() -> None:
+        nonlocal state, now
+        for index in range(runs):
+            now += 1.0
+            if index == runs // 2:
+                command = CmdAdminEdit(now_mono=now, edit_type="reverse", payload={})
+                for event in decider.decide(state, command):
+                    state = apply_event(state, event)
+            for event in decider.decide(state, CmdTap(now_mono=now)):
+                state = apply_event(state, event)
+
+    timed("tap (decide + apply), engine", runs, taps)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--players", type=int, default=200)
+    parser.add_argument("--rounds", type=int, default=50)
+    args = parser.parse_args(argv)
+
+    names = [f"P{index:03d}" for index in range(args.players)]
+    print(f"players={args.players} rounds={args.rounds}")
+    bench_rotation(names, args.rounds)
+    bench_edits(names)
+    bench_taps(names, args.rounds)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
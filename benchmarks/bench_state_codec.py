@@ -0,0 +1,125 @@
+"""Binary GameState snapshots vs ``dataclasses.asdict`` + json.
+
+"binary live" leaves out the undo history, as spectator snapshots do.
+
+    PYTHONPATH=src python benchmarks/bench_state_codec.py --players 10 --turns 40
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import timeit
+from collections import deque
+from dataclasses import asdict, is_dataclass
+from functools import partial
+from typing import Any
+
+from timebank_app.domain.commands import CmdStartGame, CmdTap
+from timebank_app.domain.engine import Decider, apply_event
+from timebank_app.domain.models import (
+    GameState,
+    Mode,
+    OrderDir,
+    PlayerConfig,
+    Rules,
+    TurnPhase,
+    TurnRuntime,
+    TurnSnapshot,
+)
+from timebank_app.domain.seating import SeatRing
+from timebank_app.infra.state_codec import decode_state, encode_state
+
+
+def build_state(players: int, turns: int) -> GameState:
+    decider = Decider("pw")
+    state = GameState()
+    names = [f"Player {index}" for index in range(players)]
+    commands = [
+        CmdStartGame(
+            now_mono=0.0,
+            game_id="bench",
+            players=[
+                PlayerConfig(name=name, color="#FFC107", sound_tap="tap.wav") for name in names
+            ],
+            order=names,
+            order_dir=OrderDir.CLOCKWISE,
+            rules=Rules(bank_initial=3600, cooldown=5, warn_every=60),
+        )
+    ]
+    commands += [CmdTap(now_mono=7.5 * (turn + 1)) for turn in range(turns)]
+    for command in commands:
+        for event in decider.decide(state, command):
+            state = apply_event(state, event)
+    return state
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, SeatRing):
+        return list(value)
+    if isinstance(value, deque):
+        return [asdict(item) for item in value]
+    if is_dataclass(value):
+        return asdict(value)
+    raise TypeError(type(value))
+
+
+def json_encode(state: GameState) -> bytes:
+    return json.dumps(asdict(state), default=_json_default).encode("utf-8")
+
+
+def json_decode(data: bytes) -> GameState:
+    raw = json.loads(data)
+    turn = raw["turn"]
+    return GameState(
+        game_id=raw["game_id"],
+        mode=Mode(raw["mode"]),
+        players=[PlayerConfig(**item) for item in raw["players"]],
+        order=SeatRing(raw["order"]),
+        order_dir=OrderDir(raw["order_dir"]),
+        rules=Rules(**raw["rules"]),
+        bank=raw["bank"],
+        current_player=raw["current_player"],
+        turn=TurnRuntime(**{**turn, "phase": TurnPhase(turn["phase"])}),
+        admin_mode=raw["admin_mode"],
+        game_started=raw["game_started"],
+        last_turn_end=raw["last_turn_end"],
+        undo_ring=deque((TurnSnapshot(**item) for item in raw["undo_ring"]), maxlen=32),
+    )
+
+
+def per_call_us(func: Any, arg: Any, number: int) -> float:
+    return min(timeit.repeat(lambda: func(arg), number=number, repeat=5)) / number * 1e6
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--players", type=int, default=10)
+    parser.add_argument("--turns", type=int, default=40)
+    parser.add_argument("--number", type=int, default=2000)
+    args = parser.parse_args(argv)
+
+    state = build_state(args.players, args.turns)
+    binary = encode_state(state)
+    text = json_encode(state)
+    assert decode_state(binary) == state
+    assert json_decode(text) == state
+
+    print(f"players={args.players} undo_depth={len(state.undo_ring)}")
+    print(f"{'':<14}{'bytes':>8}{'encode us':>12}{'decode us':>12}")
+    live = encode_state(state, undo=False)
+    for label, encode, decode, payload in (
+        ("binary", encode_state, decode_state, binary),
+        ("binary live", partial(encode_state, undo=False), decode_state, live),
+        ("asdict+json", json_encode, json_decode, text),
+    ):
+        print(
+            f"{label:<14}{len(payload):>8}"
+            f"{per_call_us(encode, state, args.number):>12.2f}"
+            f"{per_call_us(decode, payload, args.number):>12.2f}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
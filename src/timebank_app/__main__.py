@@ -1,4 +1,4 @@
-from timebank_app.ui.main import run_flet_app
+from timebank_app.ui.main import main
 
 if __name__ == "__main__":
-    run_flet_app()
+    main()
@@ -0,0 +1,320 @@
+from __future__ import annotations
+
+import math
+import os
+from collections.abc import Iterable
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+
+from timebank_app.infra.archive import ARCHIVE_SUFFIX
+from timebank_app.infra.log_reader import LogRecord, iter_log_lines, iter_log_records
+
+KIND_TURN_START = 0
+KIND_TURN_END = 1
+KIND_WARN = 2
+EVENT_KINDS = {
+    "TURN_START": KIND_TURN_START,
+    "TURN_END": KIND_TURN_END,
+    "WARN_LONG_TURN": KIND_WARN,
+}
+PARALLEL_CHUNK = 32 << 20
+
+
+@dataclass(slots=True)
+class EventColumns:
+    """Columnar view of TURN_START/TURN_END/WARN_LONG_TURN rows in log order.
+
+    ``game`` and ``player`` are codes into ``game_ids`` and ``player_names``;
+    float columns hold ``nan`` where the event type has no such field.
+    """
+
+    game_ids: list[str]
+    player_names: list[str]
+    seq: np.ndarray
+    kind: np.ndarray
+    game: np.ndarray
+    player: np.ndarray
+    mono: np.ndarray
+    spent_no_cooldown: np.ndarray
+    bank_after: np.ndarray
+
+    def __len__(self) -> int:
+        return int(self.kind.shape[0])
+
+
+@dataclass(slots=True)
+class PlayerAggregates:
+    names: list[str]
+    turns: np.ndarray
+    countdown_seconds: np.ndarray
+    cooldown_seconds: np.ndarray
+    mean_turn_seconds: np.ndarray
+    warns: np.ndarray
+
+
+@dataclass(slots=True)
+class GameAggregates:
+    game_ids: list[str]
+    turns: np.ndarray
+    countdown_seconds: np.ndarray
+    warns: np.ndarray
+    first_mono: np.ndarray
+    last_mono: np.ndarray
+
+
+@dataclass(slots=True)
+class FinalBanks:
+    """Bank left after the last TURN_END of each (game, player) pair."""
+
+    game: np.ndarray
+    player: np.ndarray
+    bank_after: np.ndarray
+
+
+def _float(fields: dict[str, str], key: str) -> float:
+    raw = fields.get(key)
+    if raw is None:
+        return np.nan
+    try:
+        return float(raw)
+    except ValueError:
+        return np.nan
+
+
+def columns_from_records(
+    records: Iterable[LogRecord],
+    *,
+    kinds: dict[str, int] | None = None,
+    game_codes: dict[str, int] | None = None,
+    player_codes: dict[str, int] | None = None,
+) -> EventColumns:
+    """Columns of the ``EVENT_KINDS`` rows in ``records``.
+
+    With ``kinds`` every event type is kept and a new one gets the next free
+    code in it. The code dictionaries are updated in place, so successive
+    calls that pass the same ones share codes.
+    """
+    codes = EVENT_KINDS if kinds is None else kinds
+    game_codes = {} if game_codes is None else game_codes
+    player_codes = {} if player_codes is None else player_codes
+    seq: list[int] = []
+    kind: list[int] = []
+    game: list[int] = []
+    player: list[int] = []
+    mono: list[float] = []
+    spent: list[float] = []
+    bank: list[float] = []
+
+    for record in records:
+        code = codes.get(record.event_type)
+        if code is None:
+            if kinds is None:
+                continue
+            code = kinds[record.event_type] = len(kinds)
+        fields = record.fields
+        game_id = record.game_id
+        if record.event_type == "GAME_START":
+            game_id = fields.get("game_id", game_id)
+        seq.append(record.seq)
+        kind.append(code)
+        game.append(game_codes.setdefault(game_id, len(game_codes)))
+        player.append(player_codes.setdefault(fields.get("player", ""), len(player_codes)))
+        mono.append(_float(fields, "now_mono"))
+        spent.append(_float(fields, "spent_no_cooldown"))
+        bank.append(_float(fields, "bank_after"))
+
+    return EventColumns(
+        game_ids=list(game_codes),
+        player_names=list(player_codes),
+        seq=np.asarray(seq, dtype=np.int64),
+        kind=np.asarray(kind, dtype=np.int8),
+        game=np.asarray(game, dtype=np.int32),
+        player=np.asarray(player, dtype=np.int32),
+        mono=np.asarray(mono, dtype=np.float64),
+        spent_no_cooldown=np.asarray(spent, dtype=np.float64),
+        bank_after=np.asarray(bank, dtype=np.float64),
+    )
+
+
+def load_columns(paths: Iterable[Path]) -> EventColumns:
+    records = (
+        record for path in paths for record in iter_log_records(path, event_types=EVENT_KINDS)
+    )
+    return columns_from_records(records)
+
+
+def split_log(path: Path, chunk_bytes: int = PARALLEL_CHUNK) -> list[tuple[int, int]]:
+    """Byte ranges of about ``chunk_bytes`` that start and end on line boundaries."""
+    size = path.stat().st_size
+    count = max(1, math.ceil(size / chunk_bytes))
+    starts = [0]
+    with path.open("rb") as handle:
+        for index in range(1, count):
+            handle.seek(index * size // count)
+            handle.readline()
+            position = handle.tell()
+            if starts[-1] < position < size:
+                starts.append(position)
+    return list(zip(starts, starts[1:] + [size], strict=True))
+
+
+def _scan_range(task: tuple[str, int, int]) -> EventColumns:
+    name, start, end = task
+    path = Path(name)
+    if path.suffix == ARCHIVE_SUFFIX:
+        return columns_from_records(iter_log_records(path, event_types=EVENT_KINDS))
+    with path.open("rb") as handle:
+        handle.seek(start)
+        text = handle.read(end - start).decode("utf-8", errors="replace")
+    return columns_from_records(iter_log_lines(text.splitlines(), event_types=EVENT_KINDS))
+
+
+def _recode(codes: dict[str, int], names: list[str], values: np.ndarray) -> np.ndarray:
+    mapping = np.asarray([codes.setdefault(name, len(codes)) for name in names], dtype=np.int32)
+    return mapping[values]
+
+
+def merge_columns(parts: Iterable[EventColumns]) -> EventColumns:
+    """Concatenate per-chunk columns in the given order, unifying their codes."""
+    parts = list(parts)
+    if not parts:
+        return columns_from_records([])
+    game_codes: dict[str, int] = {}
+    player_codes: dict[str, int] = {}
+    games = [_recode(game_codes, part.game_ids, part.game) for part in parts]
+    players = [_recode(player_codes, part.player_names, part.player) for part in parts]
+    return EventColumns(
+        game_ids=list(game_codes),
+        player_names=list(player_codes),
+        seq=np.concatenate([part.seq for part in parts]),
+        kind=np.concatenate([part.kind for part in parts]),
+        game=np.concatenate(games),
+        player=np.concatenate(players),
+        mono=np.concatenate([part.mono for part in parts]),
+        spent_no_cooldown=np.concatenate([part.spent_no_cooldown for part in parts]),
+        bank_after=np.concatenate([part.bank_after for part in parts]),
+    )
+
+
+def load_columns_parallel(
+    paths: Iterable[Path], *, workers: int | None = None, chunk_bytes: int = PARALLEL_CHUNK
+) -> EventColumns:
+    """``load_columns`` with the parsing spread over a process pool.
+
+    Logs are cut into line-aligned chunks (archives stay whole), each worker
+    builds the columns of its chunks, and the parts are merged back in log
+    order. Turn pairing crosses chunk edges, so the aggregates themselves run
+    once, vectorised, on the merged columns.
+    """
+    tasks = []
+    for path in paths:
+        if path.suffix == ARCHIVE_SUFFIX:
+            tasks.append((str(path), 0, 0))
+        else:
+            tasks += [(str(path), start, end) for start, end in split_log(path, chunk_bytes)]
+    workers = workers or os.cpu_count() or 1
+    if workers <= 1 or len(tasks) <= 1:
+        return merge_columns(map(_scan_range, tasks))
+    with ProcessPoolExecutor(max_workers=min(workers, len(tasks))) as pool:
+        return merge_columns(pool.map(_scan_range, tasks))
+
+
+def turn_durations(columns: EventColumns) -> np.ndarray:
+    """Wall length of every turn, aligned with the TURN_END rows.
+
+    A TURN_END is paired with the TURN_START immediately before it in the same
+    game; turns without a matching start get ``nan``. Tech pauses inside a turn
+    are part of its length.
+    """
+    rows = np.flatnonzero(columns.kind != KIND_WARN)
+    order = rows[np.argsort(columns.game[rows], kind="stable")]
+    ends = columns.kind[order] == KIND_TURN_END
+
+    prev = np.empty_like(order)
+    prev[0:1] = -1
+    prev[1:] = order[:-1]
+    valid = prev >= 0
+    safe_prev = np.where(valid, prev, 0)
+    matched = (
+        valid
+        & (columns.kind[safe_prev] == KIND_TURN_START)
+        & (columns.game[safe_prev] == columns.game[order])
+        & (columns.player[safe_prev] == columns.player[order])
+    )
+    duration = np.where(matched, columns.mono[order] - columns.mono[safe_prev], np.nan)
+
+    end_rows = order[ends]
+    result = np.full(len(columns), np.nan)
+    result[end_rows] = duration[ends]
+    return result[columns.kind == KIND_TURN_END]
+
+
+def player_aggregates(columns: EventColumns) -> PlayerAggregates:
+    size = len(columns.player_names)
+    is_end = columns.kind == KIND_TURN_END
+    end_player = columns.player[is_end]
+    spent = np.nan_to_num(columns.spent_no_cooldown[is_end])
+    duration = turn_durations(columns)
+    known = ~np.isnan(duration)
+    cooldown = np.clip(np.nan_to_num(duration) - spent, 0.0, None)
+
+    turns = np.bincount(end_player, minlength=size)
+    timed_turns = np.bincount(end_player[known], minlength=size)
+    total_duration = np.bincount(end_player[known], weights=duration[known], minlength=size)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        mean_turn = np.where(timed_turns > 0, total_duration / timed_turns, np.nan)
+
+    return PlayerAggregates(
+        names=list(columns.player_names),
+        turns=turns,
+        countdown_seconds=np.bincount(end_player, weights=spent, minlength=size),
+        cooldown_seconds=np.bincount(end_player[known], weights=cooldown[known], minlength=size),
+        mean_turn_seconds=mean_turn,
+        warns=np.bincount(columns.player[columns.kind == KIND_WARN], minlength=size),
+    )
+
+
+def game_aggregates(columns: EventColumns) -> GameAggregates:
+    size = len(columns.game_ids)
+    is_end = columns.kind == KIND_TURN_END
+    end_game = columns.game[is_end]
+    has_mono = ~np.isnan(columns.mono)
+
+    first_mono = np.full(size, np.inf)
+    last_mono = np.full(size, -np.inf)
+    np.minimum.at(first_mono, columns.game[has_mono], columns.mono[has_mono])
+    np.maximum.at(last_mono, columns.game[has_mono], columns.mono[has_mono])
+
+    return GameAggregates(
+        game_ids=list(columns.game_ids),
+        turns=np.bincount(end_game, minlength=size),
+        countdown_seconds=np.bincount(
+            end_game,
+            weights=np.nan_to_num(columns.spent_no_cooldown[is_end]),
+            minlength=size,
+        ),
+        warns=np.bincount(columns.game[columns.kind == KIND_WARN], minlength=size),
+        first_mono=np.where(np.isfinite(first_mono), first_mono, np.nan),
+        last_mono=np.where(np.isfinite(last_mono), last_mono, np.nan),
+    )
+
+
+def final_banks(columns: EventColumns) -> FinalBanks:
+    ends = np.flatnonzero(columns.kind == KIND_TURN_END)
+    if ends.size == 0:
+        empty = np.empty(0, dtype=np.int32)
+        return FinalBanks(game=empty, player=empty, bank_after=np.empty(0))
+
+    key = columns.game[ends].astype(np.int64) * len(columns.player_names) + columns.player[ends]
+    # Rows are in log order, so the last occurrence of each key is the final TURN_END.
+    reversed_key = key[::-1]
+    _, first_in_reversed = np.unique(reversed_key, return_index=True)
+    last_rows = ends[::-1][first_in_reversed]
+    return FinalBanks(
+        game=columns.game[last_rows],
+        player=columns.player[last_rows],
+        bank_after=columns.bank_after[last_rows],
+    )
@@ -0,0 +1,173 @@
+from __future__ import annotations
+
+import argparse
+import os
+from array import array
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from timebank_app.app.time_travel import (
+    event_game_id,
+    replay_games,
+    state_summary,
+)
+from timebank_app.domain.models import GameState
+from timebank_app.infra.log_reader import LogRecord, decode_event, parse_log_line
+from timebank_app.infra.logging import LogLock, new_game_id
+
+# Events that never touch the fields a RUNTIME_SYNC overwrites, so they do not
+# make an earlier sync observable.
+TRANSPARENT_EVENTS = frozenset({"WARN_LONG_TURN"})
+
+
+class CompactionError(RuntimeError):
+    """Raised when the compacted log does not replay to the original states."""
+
+
+@dataclass(slots=True)
+class CompactionReport:
+    closed_games: list[str] = field(default_factory=list)
+    lines_before: int = 0
+    lines_after: int = 0
+    bytes_before: int = 0
+    bytes_after: int = 0
+    dropped_syncs: int = 0
+    written: bool = False
+
+
+@dataclass(slots=True)
+class _GameScan:
+    candidates: array = field(default_factory=lambda: array("q"))
+    pending_line: int = -1
+    pending_player: str = ""
+
+
+def _iter_lines(path: Path, limit: int) -> Iterator[tuple[int, bytes, LogRecord | None]]:
+    with path.open("rb") as handle:
+        consumed = 0
+        for line_no, raw in enumerate(handle):
+            consumed += len(raw)
+            if consumed > limit or not raw.endswith(b"\n"):
+                return
+            yield line_no, raw, parse_log_line(raw.decode("utf-8"))
+
+
+def plan_compaction(path: Path, limit: int) -> tuple[list[str], bytearray, int]:
+    """Return closed games, a per-line drop mask and the line count.
+
+    A RUNTIME_SYNC is redundant when the next state-changing event of the same
+    game is another RUNTIME_SYNC for the same player: that sync overwrites every
+    field the earlier one set. The last sync before any other event (TURN_END,
+    COOLDOWN_END, TECH_PAUSE_ON, ADMIN_EDIT, ...) is always kept.
+    """
+    scans: dict[str, _GameScan] = {}
+    started: list[str] = []
+    lines = 0
+    for line_no, _, record in _iter_lines(path, limit):
+        lines = line_no + 1
+        if record is None:
+            continue
+        event = decode_event(record)
+        game_id = event_game_id(record, event)
+        scan = scans.setdefault(game_id, _GameScan())
+        if event.event_type == "GAME_START":
+            started.append(game_id)
+        if event.event_type == "RUNTIME_SYNC":
+            player = event.data["player"]
+            if scan.pending_line >= 0 and scan.pending_player == player:
+                scan.candidates.append(scan.pending_line)
+            scan.pending_line = line_no
+            scan.pending_player = player
+        elif event.event_type not in TRANSPARENT_EVENTS:
+            scan.pending_line = -1
+        follow_up = new_game_id(event)
+        if follow_up is not None:
+            started.append(follow_up)
+
+    # Only the most recently started game can still receive events.
+    open_game = started[-1] if started else None
+    closed = [game_id for game_id in scans if game_id and game_id != open_game]
+    mask = bytearray(lines)
+    for game_id in closed:
+        for line_no in scans[game_id].candidates:
+            mask[line_no] = 1
+    return closed, mask, lines
+
+
+def _records(path: Path, limit: int, mask: bytearray | None = None) -> Iterable[LogRecord]:
+    for line_no, _, record in _iter_lines(path, limit):
+        if record is not None and (mask is None or not mask[line_no]):
+            yield record
+
+
+def _same_state(left: GameState, right: GameState) -> bool:
+    return state_summary(left) == state_summary(right) and list(left.undo_ring) == list(
+        right.undo_ring
+    )
+
+
+def compact_log(path: Path, *, dry_run: bool = False) -> CompactionReport:
+    """Drop redundant RUNTIME_SYNC lines of closed games and rewrite ``path``.
+
+    Kept lines are copied byte for byte, so SEQ values simply get gaps. The
+    result is verified by replaying both versions before it replaces the
+    original (temp file + ``os.replace``). The last copy and the swap happen
+    under an exclusive ``LogLock``, so lines a running ``LogWriter`` appended
+    meanwhile are carried over and its next batch goes to the new file.
+    """
+    report = CompactionReport(bytes_before=path.stat().st_size)
+    limit = report.bytes_before
+    closed, mask, report.lines_before = plan_compaction(path, limit)
+    report.closed_games = closed
+    report.dropped_syncs = sum(mask)
+    report.lines_after = report.lines_before - report.dropped_syncs
+    if dry_run or not report.dropped_syncs:
+        report.bytes_after = report.bytes_before
+        return report
+
+    expected = replay_games(_records(path, limit))
+    actual = replay_games(_records(path, limit, mask))
+    for game_id, state in expected.items():
+        if game_id not in actual or not _same_state(state, actual[game_id]):
+            raise CompactionError(f"Compacted game {game_id!r} does not replay identically")
+
+    tmp_path = path.with_name(path.name + ".compact")
+    with tmp_path.open("wb") as out:
+        for line_no, raw, _ in _iter_lines(path, limit):
+            if not mask[line_no]:
+                out.write(raw)
+        lock = LogLock(path)
+        try:
+            with lock.hold(exclusive=True):
+                with path.open("rb") as source:
+                    source.seek(limit)
+                    out.write(source.read())
+                out.flush()
+                os.fsync(out.fileno())
+                os.replace(tmp_path, path)
+        finally:
+            lock.close()
+    report.bytes_after = path.stat().st_size
+    report.written = True
+    return report
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Compact RUNTIME_SYNC lines of finished games")
+    parser.add_argument("log", type=Path)
+    parser.add_argument("--dry-run", action="store_true")
+    args = parser.parse_args(argv)
+
+    report = compact_log(args.log, dry_run=args.dry_run)
+    print(
+        f"closed_games={len(report.closed_games)} dropped_syncs={report.dropped_syncs}"
+        f" lines={report.lines_before}->{report.lines_after}"
+        f" bytes={report.bytes_before}->{report.bytes_after}"
+        f" written={report.written}"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
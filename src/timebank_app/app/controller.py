@@ -1,14 +1,27 @@
 from __future__ import annotations
 
-import random
+from collections.abc import Callable
 from dataclasses import dataclass, field
 
+from timebank_app.app.history import DEFAULT_HISTORY, EventHistory
 from timebank_app.domain.commands import CmdTap, Command
 from timebank_app.domain.engine import Decider, apply_event
 from timebank_app.domain.events import Event
 from timebank_app.domain.models import GameState
-from timebank_app.infra.effects import EffectSink, SoundRepo
-from timebank_app.infra.logging import LogWriter
+from timebank_app.infra.effects import (
+    Effect,
+    EffectSink,
+    EffectWorker,
+    KeepAwake,
+    SoundRepo,
+    TapFeedback,
+    WarnSound,
+)
+from timebank_app.infra.event_store import EventStore
+from timebank_app.infra.logging import new_game_id
+
+EventSubscriber = Callable[[str, int, Event], None]
+StateListener = Callable[[GameState], None]
 
 
 @dataclass(slots=True)
@@ -19,48 +32,104 @@ class DispatchResult:
 
 class GameController:
     def __init__(
-        self, decider: Decider, log_writer: LogWriter, effects: EffectSink, sound_repo: SoundRepo
+        self,
+        decider: Decider,
+        log_writer: EventStore,
+        effects: EffectSink,
+        sound_repo: SoundRepo,
+        *,
+        threaded_effects: bool = False,
+        history_capacity: int = DEFAULT_HISTORY,
+        keep_log_lines: bool = True,
     ):
         self.decider = decider
         self.log_writer = log_writer
+        self.keep_log_lines = keep_log_lines
         self.effects = effects
         self.sound_repo = sound_repo
+        self.effect_worker = EffectWorker(effects, sound_repo, threaded=threaded_effects)
         self.state = GameState()
+        self.history = EventHistory(history_capacity)
+        self.subscribers: list[EventSubscriber] = [self.history]
+        self.state_listeners: list[StateListener] = []
+
+    def subscribe(self, subscriber: EventSubscriber) -> None:
+        self.subscribers.append(subscriber)
+
+    def unsubscribe(self, subscriber: EventSubscriber) -> None:
+        self.subscribers.remove(subscriber)
+
+    def add_state_listener(self, listener: StateListener) -> None:
+        """Call ``listener`` with the new state once per dispatch that changed it."""
+        self.state_listeners.append(listener)
+
+    def remove_state_listener(self, listener: StateListener) -> None:
+        self.state_listeners.remove(listener)
 
     def dispatch(self, command: Command) -> DispatchResult:
+        """Commit the events of ``command``; effects are handed to the worker last."""
         events = self.decider.decide(self.state, command)
         result = DispatchResult(events=list(events))
+        effects: list[Effect] = []
 
+        # One store write per dispatch; events are logged under the game id the
+        # state has when each of them is applied.
+        game_id = self.state.game_id
+        batch = []
         for event in events:
-            result.log_lines.append(self.log_writer.append(self.state.game_id, event))
+            batch.append((game_id, event))
+            if event.event_type == "GAME_START":
+                game_id = str(event.data["game_id"])
+            else:
+                game_id = new_game_id(event) or game_id
+        result.log_lines = self.log_writer.append_batch(batch, lines=self.keep_log_lines)
+
+        seq = self.log_writer.seq - len(events)
+        for event in events:
+            seq += 1
             self.state = apply_event(self.state, event)
-            self._run_effects(command, event)
+            for subscriber in self.subscribers:
+                subscriber(self.state.game_id, seq, event)
+            effects.extend(self._effects_for(command, event))
 
+        if events:
+            for listener in self.state_listeners:
+                listener(self.state)
+        self.effect_worker.submit(effects)
         return result
 
-    def _run_effects(self, command: Command, event: Event) -> None:
-        if event.event_type == "GAME_START":
-            self.effects.set_keep_awake(True)
+    def apply_replayed(self, seq: int, event: Event) -> None:
+        """Apply an already logged event, e.g. during replay; nothing is written."""
+        self.state = apply_event(self.state, event)
+        for subscriber in self.subscribers:
+            subscriber(self.state.game_id, seq, event)
+        for listener in self.state_listeners:
+            listener(self.state)
+        self.effect_worker.submit(self._effects_for(None, event))
+
+    def restore_state(self, state: GameState) -> None:
+        """Replace the state wholesale, e.g. from a snapshot; nothing is written."""
+        self.state = state
+        for listener in self.state_listeners:
+            listener(self.state)
+
+    def _effects_for(self, command: Command | None, event: Event) -> list[Effect]:
+        effects: list[Effect] = []
+        if event.event_type in ("GAME_START", "TECH_PAUSE_OFF"):
+            effects.append(KeepAwake(True))
         elif event.event_type == "TECH_PAUSE_ON":
-            self.effects.set_keep_awake(False)
-        elif event.event_type == "TECH_PAUSE_OFF":
-            self.effects.set_keep_awake(True)
+            effects.append(KeepAwake(False))
 
-        if isinstance(command, CmdTap) and event.event_type == "TURN_END":
+        # Replayed events have no command; their turn ends are treated as taps.
+        if (command is None or isinstance(command, CmdTap)) and event.event_type == "TURN_END":
             player = event.data["player"]
             sound_name = ""
             for cfg in self.state.players:
                 if cfg.name == player:
                     sound_name = cfg.sound_tap
                     break
-
-            if sound_name == "__random__":
-                files = self.sound_repo.list_files()
-                sound_name = random.choice(files) if files else ""
-
-            self.effects.play_sound(self.sound_repo.resolve(sound_name))
-            self.effects.vibrate()
+            effects.append(TapFeedback(sound_name))
 
         if event.event_type == "WARN_LONG_TURN":
-            warn = self.sound_repo.resolve(self.state.rules.warn_sound)
-            self.effects.play_sound(warn)
+            effects.append(WarnSound(self.state.rules.warn_sound))
+        return effects
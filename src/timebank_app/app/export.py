@@ -0,0 +1,206 @@
+"""Columnar export of event logs for notebooks.
+
+    python -m timebank_app.app.export appdata/logs/*.tba appdata/logs/events.log --out season
+    python -m timebank_app.app.export appdata/logs/events.log --out game --game 1712345
+
+An export directory has one sub-directory per appended part with one
+``.npy`` file per column (``COLUMNS``), ``dictionary.json`` with the event
+type, game id and player name behind each code, and ``manifest.json``, which
+lists the parts and how far each source was read. The manifest is written
+last, so an interrupted export leaves the previous one intact.
+
+Running the export again reads only what was appended to each log since,
+using ``LogFollower`` positions, and survives rotation and compaction.
+Archives are read once; a rewritten archive adds only SEQs past those
+already exported from it. Codes only ever grow, so earlier parts stay valid,
+and ``load_export`` memory-maps the ``.npy`` files.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+from timebank_app.app.analytics import EVENT_KINDS, EventColumns, columns_from_records
+from timebank_app.infra.archive import ARCHIVE_SUFFIX
+from timebank_app.infra.log_follower import FollowPosition, LogFollower
+from timebank_app.infra.log_reader import LogRecord, iter_log_records
+from timebank_app.infra.storage import atomic_write_text
+
+EXPORT_FORMAT = 1
+COLUMNS = ("seq", "kind", "game", "player", "mono", "spent_no_cooldown", "bank_after")
+MANIFEST = "manifest.json"
+DICTIONARY = "dictionary.json"
+EXPORT_READ_LIMIT = 8 << 20
+
+
+class ExportError(ValueError):
+    pass
+
+
+def _read_json(path: Path) -> dict[str, Any] | None:
+    try:
+        return json.loads(path.read_text(encoding="utf-8"))
+    except FileNotFoundError:
+        return None
+
+
+def _owner(record: LogRecord) -> str:
+    if record.event_type == "GAME_START":
+        return record.fields.get("game_id", record.game_id)
+    return record.game_id
+
+
+def _read_log(path: Path, stored: str | None) -> tuple[list[LogRecord], str]:
+    follower = LogFollower(path, read_limit=EXPORT_READ_LIMIT)
+    if stored is not None:
+        follower.position = FollowPosition.from_text(stored)
+    records: list[LogRecord] = []
+    try:
+        while True:
+            offset = follower.position.offset
+            records += follower.poll()
+            if follower.position.offset == offset:
+                break
+    finally:
+        follower.close_file()
+    return records, follower.position.to_text()
+
+
+def _read_archive(path: Path, stored: str | None) -> tuple[list[LogRecord], str]:
+    stat = path.stat()
+    done = FollowPosition() if stored is None else FollowPosition.from_text(stored)
+    if stored is not None and done.inode == stat.st_ino:
+        return [], stored
+    # A rewritten archive (new inode) only contributes SEQs past the last exported one.
+    records = [record for record in iter_log_records(path) if record.seq > done.seq]
+    last = records[-1].seq if records else done.seq
+    return records, FollowPosition(stat.st_size, last, stat.st_ino).to_text()
+
+
+def export_logs(paths: Iterable[Path], directory: Path, *, game_id: str | None = None) -> int:
+    """Append what is new in ``paths`` to the export in ``directory``; returns the row count.
+
+    With ``game_id`` only that game's events are exported. An export keeps
+    the filter it was created with.
+    """
+    directory.mkdir(parents=True, exist_ok=True)
+    manifest = _read_json(directory / MANIFEST) or {
+        "format": EXPORT_FORMAT,
+        "game_id": game_id,
+        "rows": 0,
+        "parts": [],
+        "sources": {},
+    }
+    if manifest["format"] != EXPORT_FORMAT:
+        raise ExportError(f"Unsupported export format {manifest['format']}")
+    if manifest["game_id"] != game_id:
+        raise ExportError(f"{directory} exports game {manifest['game_id']!r}, not {game_id!r}")
+    dictionary = _read_json(directory / DICTIONARY) or {
+        "event_types": list(EVENT_KINDS),
+        "game_ids": [],
+        "player_names": [],
+    }
+    kinds = {name: code for code, name in enumerate(dictionary["event_types"])}
+    game_codes = {name: code for code, name in enumerate(dictionary["game_ids"])}
+    player_codes = {name: code for code, name in enumerate(dictionary["player_names"])}
+
+    records: list[LogRecord] = []
+    sources = manifest["sources"]
+    for path in paths:
+        key = str(path.resolve())
+        read = _read_archive if path.suffix == ARCHIVE_SUFFIX else _read_log
+        found, sources[key] = read(path, sources.get(key))
+        records += found
+    if game_id is not None:
+        records = [record for record in records if _owner(record) == game_id]
+
+    columns = columns_from_records(
+        records, kinds=kinds, game_codes=game_codes, player_codes=player_codes
+    )
+    rows = len(columns)
+    if rows:
+        name = f"part-{len(manifest['parts']):06d}"
+        (directory / name).mkdir(exist_ok=True)
+        for column in COLUMNS:
+            np.save(directory / name / f"{column}.npy", getattr(columns, column))
+        manifest["parts"].append(
+            {
+                "name": name,
+                "rows": rows,
+                "first_seq": int(columns.seq[0]),
+                "last_seq": int(columns.seq[-1]),
+            }
+        )
+        manifest["rows"] += rows
+        dictionary = {
+            "event_types": list(kinds),
+            "game_ids": columns.game_ids,
+            "player_names": columns.player_names,
+        }
+        atomic_write_text(directory / DICTIONARY, json.dumps(dictionary, ensure_ascii=False))
+    atomic_write_text(directory / MANIFEST, json.dumps(manifest, ensure_ascii=False, indent=1))
+    return rows
+
+
+def load_export(
+    directory: Path, *, event_types: Iterable[str] | None = None, mmap: bool = True
+) -> EventColumns:
+    """All parts as one ``EventColumns``; ``kind`` indexes ``event_types`` in the dictionary.
+
+    The first codes are those of ``EVENT_KINDS``, so with
+    ``event_types=EVENT_KINDS`` the result can go straight into the
+    ``analytics`` aggregates. A single part without a filter stays memory-mapped.
+    """
+    manifest = _read_json(directory / MANIFEST)
+    dictionary = _read_json(directory / DICTIONARY)
+    if manifest is None:
+        raise ExportError(f"No export in {directory}")
+    names = [part["name"] for part in manifest["parts"]]
+    mode = "r" if mmap else None
+    arrays: dict[str, np.ndarray] = {}
+    for column in COLUMNS:
+        parts = [np.load(directory / name / f"{column}.npy", mmap_mode=mode) for name in names]
+        if len(parts) == 1:
+            arrays[column] = parts[0]
+        elif parts:
+            arrays[column] = np.concatenate(parts)
+        else:
+            arrays[column] = getattr(columns_from_records([]), column)
+    kinds = dictionary["event_types"] if dictionary else list(EVENT_KINDS)
+    if event_types is not None:
+        wanted = [kinds.index(name) for name in event_types if name in kinds]
+        mask = np.isin(arrays["kind"], wanted)
+        arrays = {column: values[mask] for column, values in arrays.items()}
+    return EventColumns(
+        game_ids=dictionary["game_ids"] if dictionary else [],
+        player_names=dictionary["player_names"] if dictionary else [],
+        **arrays,
+    )
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Append event logs to a columnar .npy export")
+    parser.add_argument("logs", type=Path, nargs="+", help="logs and archives, oldest first")
+    parser.add_argument("--out", type=Path, required=True, help="export directory")
+    parser.add_argument("--game", help="export only this game id")
+    args = parser.parse_args(argv)
+    try:
+        rows = export_logs(args.logs, args.out, game_id=args.game)
+    except ExportError as exc:
+        parser.error(str(exc))
+    manifest = json.loads((args.out / MANIFEST).read_text(encoding="utf-8"))
+    print(
+        f"appended {rows} rows; {manifest['rows']} rows in {len(manifest['parts'])} parts "
+        f"in {args.out}"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
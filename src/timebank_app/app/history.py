@@ -0,0 +1,207 @@
+from __future__ import annotations
+
+import math
+from array import array
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+
+from timebank_app.domain.events import Event
+from timebank_app.infra.clock import Clock, SystemClock
+
+DEFAULT_HISTORY = 4096
+_NO_VALUE = math.nan
+
+
+@dataclass(frozen=True, slots=True)
+class HistoryEntry:
+    seq: int
+    game_id: str
+    event_type: str
+    player: str
+    wall: float
+    bank: float | None
+    spent: float | None
+
+
+class _Interner:
+    def __init__(self) -> None:
+        self.names: list[str] = []
+        self.ids: dict[str, int] = {}
+
+    def id(self, name: str) -> int:
+        found = self.ids.get(name)
+        if found is None:
+            found = self.ids[name] = len(self.names)
+            self.names.append(name)
+        return found
+
+    def rename(self, old: str, new: str, codes: array) -> None:
+        """Relabel ``old`` as ``new``; if ``new`` is interned too, ``codes`` merge into it."""
+        found = self.ids.pop(old, None)
+        if found is None:
+            return
+        merged = self.ids.get(new)
+        if merged is None:
+            self.names[found] = new
+            self.ids[new] = found
+            return
+        self.names[found] = ""
+        for index, code in enumerate(codes):
+            if code == found:
+                codes[index] = merged
+
+    def compact(self, codes: array) -> None:
+        """Keep only the names ``codes`` still use, renumbering ``codes`` in place."""
+        remap: dict[int, int] = {}
+        names: list[str] = []
+        for index, code in enumerate(codes):
+            if code < 0:
+                continue
+            new = remap.get(code)
+            if new is None:
+                new = remap[code] = len(names)
+                names.append(self.names[code])
+            codes[index] = new
+        self.names = names
+        self.ids = {name: code for code, name in enumerate(names)}
+
+
+class EventHistory:
+    """Fixed-capacity ring of recent events, stored column-wise in arrays.
+
+    Each event keeps only SEQ, wall time, interned type/player/game ids and
+    the bank/spent numbers of turn events (~40 bytes), so memory is set by
+    ``capacity`` alone however long the session runs; the name tables are
+    pruned each time the ring wraps. It is a controller subscriber; renames
+    relabel past entries so they show the current name.
+    """
+
+    def __init__(self, capacity: int = DEFAULT_HISTORY, clock: Clock | None = None):
+        if capacity < 1:
+            raise ValueError("History capacity must be positive")
+        self.capacity = capacity
+        self.clock = clock or SystemClock()
+        self._seq = array("q", bytes(8 * capacity))
+        self._wall = array("d", bytes(8 * capacity))
+        self._bank = array("d", bytes(8 * capacity))
+        self._spent = array("d", bytes(8 * capacity))
+        self._type = array("H", bytes(2 * capacity))
+        self._player = array("i", bytes(4 * capacity))
+        self._game = array("i", bytes(4 * capacity))
+        self._types = _Interner()
+        self._players = _Interner()
+        self._games = _Interner()
+        self._next = 0
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __call__(self, game_id: str, seq: int, event: Event) -> None:
+        self.record(game_id, seq, event)
+
+    def record(self, game_id: str, seq: int, event: Event) -> None:
+        data = event.data
+        if event.event_type == "ADMIN_EDIT" and data.get("edit_type") == "rename_player":
+            payload = data["payload"]
+            self._players.rename(payload["old"], payload["new"], self._player)
+
+        slot = self._next
+        self._seq[slot] = seq
+        self._wall[slot] = self.clock.time()
+        self._type[slot] = self._types.id(event.event_type)
+        player = data.get("player")
+        self._player[slot] = self._players.id(player) if isinstance(player, str) else -1
+        self._game[slot] = self._games.id(game_id)
+        bank = data.get("bank_after")
+        self._bank[slot] = _NO_VALUE if bank is None else float(bank)
+        spent = data.get("spent_no_cooldown", data.get("elapsed_no_cooldown"))
+        self._spent[slot] = _NO_VALUE if spent is None else float(spent)
+        self._next = (slot + 1) % self.capacity
+        self._size = min(self._size + 1, self.capacity)
+        if not self._next:
+            # Every slot has just been written, so names no entry uses can go.
+            self._types.compact(self._type)
+            self._players.compact(self._player)
+            self._games.compact(self._game)
+
+    def clear(self) -> None:
+        self._next = 0
+        self._size = 0
+
+    def _slots_newest_first(self) -> Iterator[int]:
+        for offset in range(1, self._size + 1):
+            yield (self._next - offset) % self.capacity
+
+    def _entry(self, slot: int) -> HistoryEntry:
+        player = self._player[slot]
+        bank = self._bank[slot]
+        spent = self._spent[slot]
+        return HistoryEntry(
+            seq=self._seq[slot],
+            game_id=self._games.names[self._game[slot]],
+            event_type=self._types.names[self._type[slot]],
+            player=self._players.names[player] if player >= 0 else "",
+            wall=self._wall[slot],
+            bank=None if math.isnan(bank) else bank,
+            spent=None if math.isnan(spent) else spent,
+        )
+
+    def query(
+        self,
+        *,
+        event_types: Iterable[str] | None = None,
+        player: str | None = None,
+        game_id: str | None = None,
+        since: float | None = None,
+        until: float | None = None,
+        limit: int | None = None,
+    ) -> list[HistoryEntry]:
+        """Matching entries, newest first; ``since``/``until`` are wall times."""
+        type_ids = None
+        if event_types is not None:
+            type_ids = {self._types.ids[name] for name in event_types if name in self._types.ids}
+        player_id = None
+        if player is not None:
+            player_id = self._players.ids.get(player)
+            if player_id is None:
+                return []
+        game = None
+        if game_id is not None:
+            game = self._games.ids.get(game_id)
+            if game is None:
+                return []
+
+        found: list[HistoryEntry] = []
+        for slot in self._slots_newest_first():
+            wall = self._wall[slot]
+            if since is not None and wall < since:
+                # Entries are appended in wall-clock order, so nothing older matches.
+                break
+            if until is not None and wall > until:
+                continue
+            if type_ids is not None and self._type[slot] not in type_ids:
+                continue
+            if player_id is not None and self._player[slot] != player_id:
+                continue
+            if game is not None and self._game[slot] != game:
+                continue
+            found.append(self._entry(slot))
+            if limit is not None and len(found) >= limit:
+                break
+        return found
+
+    def last_turns(self, limit: int = 20, game_id: str | None = None) -> list[HistoryEntry]:
+        return self.query(event_types={"TURN_END"}, game_id=game_id, limit=limit)
+
+    def nbytes(self) -> int:
+        columns = (
+            self._seq,
+            self._wall,
+            self._bank,
+            self._spent,
+            self._type,
+            self._player,
+            self._game,
+        )
+        return sum(column.itemsize * len(column) for column in columns)
@@ -0,0 +1,268 @@
+from __future__ import annotations
+
+import json
+from collections import deque
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Protocol
+
+from timebank_app.domain.engine import undo_steps
+from timebank_app.domain.events import Event
+from timebank_app.domain.models import UNDO_DEPTH
+from timebank_app.infra.storage import atomic_write_text
+
+
+class Projection(Protocol):
+    """Live read model fed one event at a time by ``GameController.dispatch``.
+
+    ``apply`` must be O(1) in the length of the session; ``snapshot`` and
+    ``restore`` round-trip the model through plain JSON-compatible data.
+    """
+
+    name: str
+
+    def apply(self, game_id: str, seq: int, event: Event) -> None: ...
+
+    def snapshot(self) -> dict[str, Any]: ...
+
+    def restore(self, data: dict[str, Any]) -> None: ...
+
+
+@dataclass(slots=True)
+class PlayerTotals:
+    turns: int = 0
+    time_used: float = 0.0
+    warns: int = 0
+
+    @property
+    def mean_turn(self) -> float:
+        return self.time_used / self.turns if self.turns else 0.0
+
+
+class PlayerStatsProjection:
+    """Per-player totals across every game seen: turns, countdown time, warns."""
+
+    name = "player_stats"
+
+    def __init__(self) -> None:
+        self.players: dict[str, PlayerTotals] = {}
+
+    def _totals(self, player: str) -> PlayerTotals:
+        totals = self.players.get(player)
+        if totals is None:
+            totals = self.players[player] = PlayerTotals()
+        return totals
+
+    def apply(self, game_id: str, seq: int, event: Event) -> None:
+        data = event.data
+        if event.event_type == "TURN_END":
+            totals = self._totals(data["player"])
+            totals.turns += 1
+            totals.time_used += data["spent_no_cooldown"]
+        elif event.event_type == "WARN_LONG_TURN":
+            self._totals(data["player"]).warns += 1
+        elif event.event_type == "ADMIN_EDIT" and data["edit_type"] == "rename_player":
+            payload = data["payload"]
+            moved = self.players.pop(payload["old"], None)
+            if moved is not None:
+                self.players[payload["new"]] = moved
+
+    def snapshot(self) -> dict[str, Any]:
+        return {name: asdict(totals) for name, totals in self.players.items()}
+
+    def restore(self, data: dict[str, Any]) -> None:
+        self.players = {name: PlayerTotals(**totals) for name, totals in data.items()}
+
+
+@dataclass(slots=True)
+class LeaderboardRow:
+    player: str
+    games: int
+    mean_bank_left: float
+
+
+class LeaderboardProjection:
+    """Bank left per (game, player), ranked across games on read.
+
+    Every update touches a single dict entry. Each turn end also records its
+    player, bank and spent time, as deep as the engine's undo ring, so undo
+    edits restore just the undone players like the engine does. Ranking sorts
+    the players only when ``leaderboard`` is asked for, which is cheap for
+    table-sized rosters.
+    """
+
+    name = "leaderboard"
+
+    def __init__(self) -> None:
+        self.banks: dict[str, dict[str, float]] = {}
+        self.bank_sums: dict[str, float] = {}
+        self.game_counts: dict[str, int] = {}
+        self.bank_initial: dict[str, float] = {}
+        self.undo: dict[str, deque[tuple[str, float, float]]] = {}
+        self.game_id = ""
+
+    def _set_bank(self, game_id: str, player: str, value: float) -> None:
+        game = self.banks.setdefault(game_id, {})
+        previous = game.get(player)
+        if previous is None:
+            self.game_counts[player] = self.game_counts.get(player, 0) + 1
+            previous = 0.0
+        game[player] = value
+        self.bank_sums[player] = self.bank_sums.get(player, 0.0) + value - previous
+
+    def _drop_bank(self, game_id: str, player: str) -> float:
+        value = self.banks[game_id].pop(player)
+        self.game_counts[player] -= 1
+        if self.game_counts[player]:
+            self.bank_sums[player] -= value
+        else:
+            del self.game_counts[player], self.bank_sums[player]
+        return value
+
+    def _start(self, game_id: str, players: list[str], bank_initial: float) -> None:
+        self.bank_initial[game_id] = bank_initial
+        # Only the running game can be undone, so older rings are dropped.
+        self.undo = {game_id: deque(maxlen=UNDO_DEPTH)}
+        for player in players:
+            self._set_bank(game_id, player, bank_initial)
+
+    def apply(self, game_id: str, seq: int, event: Event) -> None:
+        data = event.data
+        if event.event_type == "GAME_START":
+            game_id = data["game_id"]
+            self._start(game_id, data["order"], float(data["rules"]["bank_initial"]))
+        elif event.event_type == "TURN_END":
+            player, bank_after = data["player"], data["bank_after"]
+            self._set_bank(game_id, player, bank_after)
+            self.undo.setdefault(game_id, deque(maxlen=UNDO_DEPTH)).append(
+                (player, bank_after, data.get("spent_no_cooldown", 0.0))
+            )
+        elif event.event_type == "ADMIN_EDIT":
+            game_id = self._apply_edit(game_id, data["edit_type"], data["payload"])
+        self.game_id = game_id
+
+    def _apply_edit(self, game_id: str, edit_type: str, payload: dict[str, Any]) -> str:
+        """Follow the engine's edit; returns the game the edit leaves current."""
+        game = self.banks.get(game_id, {})
+        if edit_type == "set_bank":
+            self._set_bank(game_id, payload["player"], float(payload["value"]))
+        elif edit_type == "set_rules" and "bank_initial" in payload:
+            self.bank_initial[game_id] = float(payload["bank_initial"])
+        elif edit_type == "rename_player" and payload["old"] in game:
+            old, new = payload["old"], payload["new"]
+            if new in game:
+                self._drop_bank(game_id, new)
+            self._set_bank(game_id, new, self._drop_bank(game_id, old))
+            ring = self.undo.get(game_id, deque())
+            renamed = [(new, *turn[1:]) if turn[0] == old else turn for turn in ring]
+            ring.clear()
+            ring.extend(renamed)
+        elif edit_type == "remove_player" and payload["player"] in game and len(game) > 1:
+            self._drop_bank(game_id, payload["player"])
+            self.undo.pop(game_id, None)
+        elif edit_type == "new_game":
+            # Logged under the game it ends, but dispatched under the new one.
+            source = self.game_id if game_id == payload["game_id"] else game_id
+            game_id = payload["game_id"]
+            bank_initial = self.bank_initial.get(source, 0.0)
+            self._start(game_id, list(self.banks.get(source, {})), bank_initial)
+        elif edit_type == "undo":
+            ring = self.undo.get(game_id, ())
+            target = None
+            for _ in range(min(undo_steps(payload), len(ring))):
+                target = ring.pop()
+                player, bank_after, spent = target
+                if player in game:
+                    self._set_bank(game_id, player, bank_after + spent)
+            if target is not None and target[0] in game:
+                self._set_bank(game_id, target[0], target[1])
+        return game_id
+
+    def leaderboard(self, limit: int | None = None) -> list[LeaderboardRow]:
+        rows = [
+            LeaderboardRow(
+                player=player,
+                games=self.game_counts[player],
+                mean_bank_left=self.bank_sums[player] / self.game_counts[player],
+            )
+            for player in self.bank_sums
+        ]
+        rows.sort(key=lambda row: (-row.mean_bank_left, row.player))
+        return rows if limit is None else rows[:limit]
+
+    def snapshot(self) -> dict[str, Any]:
+        return {
+            "banks": self.banks,
+            "bank_initial": self.bank_initial,
+            "undo": {game_id: list(ring) for game_id, ring in self.undo.items()},
+            "game_id": self.game_id,
+        }
+
+    def restore(self, data: dict[str, Any]) -> None:
+        self.banks = {}
+        self.bank_sums = {}
+        self.game_counts = {}
+        for game_id, players in data.get("banks", {}).items():
+            for player, value in players.items():
+                self._set_bank(game_id, player, value)
+        self.bank_initial = dict(data.get("bank_initial", {}))
+        self.undo = {
+            game_id: deque(map(tuple, ring), maxlen=UNDO_DEPTH)
+            for game_id, ring in data.get("undo", {}).items()
+        }
+        self.game_id = data.get("game_id", "")
+
+
+@dataclass(slots=True)
+class ProjectionSet:
+    """Fan-out subscriber for ``GameController`` with optional checkpoints.
+
+    With ``checkpoint_path`` set, the projections are written to disk every
+    ``checkpoint_every`` events (temp file + atomic rename) together with the
+    SEQ they reflect, and ``restore`` loads them back on the next launch.
+    """
+
+    projections: list[Projection] = field(default_factory=list)
+    checkpoint_path: Path | None = None
+    checkpoint_every: int = 500
+    last_seq: int = 0
+    _since_checkpoint: int = 0
+
+    def __call__(self, game_id: str, seq: int, event: Event) -> None:
+        for projection in self.projections:
+            projection.apply(game_id, seq, event)
+        self.last_seq = seq
+        if self.checkpoint_path is None:
+            return
+        self._since_checkpoint += 1
+        if self._since_checkpoint >= self.checkpoint_every:
+            self.checkpoint()
+
+    def get(self, name: str) -> Projection:
+        for projection in self.projections:
+            if projection.name == name:
+                return projection
+        raise KeyError(name)
+
+    def checkpoint(self) -> None:
+        if self.checkpoint_path is None:
+            return
+        payload = {
+            "seq": self.last_seq,
+            "projections": {item.name: item.snapshot() for item in self.projections},
+        }
+        self.checkpoint_path.parent.mkdir(parents=True, exist_ok=True)
+        atomic_write_text(self.checkpoint_path, json.dumps(payload, separators=(",", ":")))
+        self._since_checkpoint = 0
+
+    def restore(self) -> int:
+        """Load the last checkpoint, if any, and return the SEQ it covers."""
+        if self.checkpoint_path is None or not self.checkpoint_path.exists():
+            return 0
+        payload = json.loads(self.checkpoint_path.read_text(encoding="utf-8"))
+        stored = payload.get("projections", {})
+        for projection in self.projections:
+            if projection.name in stored:
+                projection.restore(stored[projection.name])
+        self.last_seq = int(payload.get("seq", 0))
+        return self.last_seq
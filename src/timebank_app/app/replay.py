@@ -0,0 +1,178 @@
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import tempfile
+import time
+from collections.abc import Callable, Iterable, Iterator
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+
+from timebank_app.app.controller import GameController
+from timebank_app.app.time_travel import state_summary
+from timebank_app.domain.engine import Decider
+from timebank_app.domain.events import Event
+from timebank_app.infra.clock import Clock, SystemClock, VirtualClock
+from timebank_app.infra.effects import EffectSink, SoundRepo
+from timebank_app.infra.log_reader import LogRecord, decode_event, iter_log_records
+from timebank_app.infra.logging import LogWriter
+
+MAX_SPEED = 0.0
+
+
+def parse_speed(text: str) -> float:
+    """``"1"``, ``"10x"`` or ``"max"``; max speed is returned as ``MAX_SPEED``."""
+    value = text.strip().lower()
+    if value == "max":
+        return MAX_SPEED
+    speed = float(value.removesuffix("x"))
+    if speed <= 0:
+        raise ValueError(f"Speed must be positive or 'max', got {text!r}")
+    return speed
+
+
+@dataclass(slots=True)
+class ReplayStep:
+    seq: int
+    event: Event
+    wall: float
+    now_mono: float | None = None
+
+
+def replay_steps(records: Iterable[LogRecord]) -> Iterator[ReplayStep]:
+    for record in records:
+        event = decode_event(record)
+        now_mono = event.data.get("now_mono")
+        yield ReplayStep(
+            seq=record.seq,
+            event=event,
+            wall=datetime.fromisoformat(record.stamp).timestamp(),
+            now_mono=None if now_mono is None else float(now_mono),
+        )
+
+
+@dataclass(slots=True)
+class ReplayReport:
+    events: int = 0
+    log_seconds: float = 0.0
+    wall_seconds: float = 0.0
+    slowest_apply: float = 0.0
+
+    def summary(self) -> str:
+        rate = self.events / self.wall_seconds if self.wall_seconds > 0 else 0.0
+        return (
+            f"events={self.events} log_seconds={self.log_seconds:.1f}"
+            f" wall_seconds={self.wall_seconds:.3f} events_per_sec={rate:.0f}"
+            f" slowest_apply_ms={self.slowest_apply * 1000:.3f}"
+        )
+
+
+class ReplayDriver:
+    """Feed logged events into a controller at ``speed`` times real time.
+
+    Pacing follows the log stamps; the controller-facing ``clock`` is a
+    ``VirtualClock`` moved to each event's ``now_mono`` (or by the stamp delta
+    when the event has none), so tickers and blink maths see logged time.
+    ``real_clock`` is only used to measure how far behind schedule we are.
+    """
+
+    def __init__(
+        self,
+        controller: GameController,
+        *,
+        speed: float = 1.0,
+        clock: VirtualClock | None = None,
+        real_clock: Clock | None = None,
+        on_step: Callable[[ReplayStep], None] | None = None,
+    ):
+        self.controller = controller
+        self.speed = speed
+        self.clock = clock or VirtualClock()
+        controller.history.clock = self.clock
+        self.real_clock = real_clock or SystemClock()
+        self.on_step = on_step
+        self.report = ReplayReport()
+        self._origin: tuple[float, float] | None = None
+        self._started = 0.0
+
+    def _delay(self, step: ReplayStep) -> float:
+        now = self.real_clock.monotonic()
+        if self._origin is None:
+            self._origin = (step.wall, now)
+            self._started = now
+            return 0.0
+        if self.speed == MAX_SPEED:
+            return 0.0
+        log_wall, real_start = self._origin
+        return max(0.0, real_start + (step.wall - log_wall) / self.speed - now)
+
+    def _apply(self, step: ReplayStep) -> None:
+        if self.clock.wall and step.now_mono is None:
+            self.clock.mono += max(0.0, step.wall - self.clock.wall)
+        elif step.now_mono is not None:
+            self.clock.mono = step.now_mono
+        self.clock.wall = step.wall
+
+        started = time.perf_counter()
+        self.controller.apply_replayed(step.seq, step.event)
+        self.report.slowest_apply = max(self.report.slowest_apply, time.perf_counter() - started)
+        self.report.events += 1
+        if self._origin is not None:
+            self.report.log_seconds = step.wall - self._origin[0]
+        self.report.wall_seconds = self.real_clock.monotonic() - self._started
+        if self.on_step is not None:
+            self.on_step(step)
+
+    def run(
+        self, steps: Iterable[ReplayStep], sleep: Callable[[float], None] = time.sleep
+    ) -> ReplayReport:
+        for step in steps:
+            delay = self._delay(step)
+            if delay > 0:
+                sleep(delay)
+            self._apply(step)
+        return self.report
+
+    async def run_async(self, steps: Iterable[ReplayStep]) -> ReplayReport:
+        for step in steps:
+            # Yield even at max speed so the UI loop gets to redraw.
+            await asyncio.sleep(self._delay(step))
+            self._apply(step)
+        return self.report
+
+
+def replay_controller(sound_dir: Path, scratch_log: Path) -> GameController:
+    """Controller for replays; ``scratch_log`` only satisfies the writer, nothing is appended."""
+    return GameController(
+        decider=Decider(""),
+        log_writer=LogWriter(scratch_log),
+        effects=EffectSink(),
+        sound_repo=SoundRepo(sound_dir),
+    )
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Replay a logged game through the controller")
+    parser.add_argument("log", type=Path)
+    parser.add_argument("--game", help="replay only this game id")
+    parser.add_argument("--speed", default="max", help="1, 10x, ... or max")
+    parser.add_argument("--sounds", type=Path, default=Path("./appdata/sounds"))
+    args = parser.parse_args(argv)
+
+    try:
+        speed = parse_speed(args.speed)
+    except ValueError as exc:
+        parser.error(str(exc))
+    with tempfile.TemporaryDirectory() as scratch:
+        controller = replay_controller(args.sounds, Path(scratch) / "events.log")
+        driver = ReplayDriver(controller, speed=speed)
+        report = driver.run(replay_steps(iter_log_records(args.log, game_id=args.game)))
+    print(report.summary())
+    print(json.dumps(state_summary(controller.state), ensure_ascii=False, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
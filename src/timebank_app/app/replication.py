@@ -0,0 +1,426 @@
+"""One table on several devices: a leader controller and followers on the LAN."""
+
+from __future__ import annotations
+
+import argparse
+import base64
+import contextlib
+import json
+import math
+import os
+import queue
+import socket
+import threading
+from collections import deque
+from collections.abc import Callable
+from dataclasses import fields
+from pathlib import Path
+from typing import Any
+
+from timebank_app.app.controller import DispatchResult, GameController
+from timebank_app.app.history import DEFAULT_HISTORY
+from timebank_app.domain.commands import CmdPauseOff, CmdPauseOn, CmdTap, Command
+from timebank_app.domain.engine import CommandError, Decider
+from timebank_app.domain.events import Event
+from timebank_app.domain.models import GameState
+from timebank_app.infra.clock import Clock, SystemClock
+from timebank_app.infra.effects import EffectSink, SoundRepo
+from timebank_app.infra.event_store import MemoryEventStore
+from timebank_app.infra.state_codec import decode_state, encode_state
+
+DEFAULT_PORT = 7700
+PING_ROUNDS = 5
+RECONNECT_MIN = 0.05
+RECONNECT_MAX = 2.0
+FORWARDED: dict[str, type[Command]] = {
+    command.__name__: command for command in (CmdTap, CmdPauseOn, CmdPauseOff)
+}
+
+CommandHandler = Callable[[Command], object]
+
+
+class ReplicationError(RuntimeError):
+    pass
+
+
+def _line(message: dict[str, Any]) -> bytes:
+    return json.dumps(message, separators=(",", ":"), ensure_ascii=False).encode() + b"\n"
+
+
+def _no_delay(sock: socket.socket) -> socket.socket:
+    sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    return sock
+
+
+def _shutdown(sock: socket.socket) -> None:
+    with contextlib.suppress(OSError):
+        sock.shutdown(socket.SHUT_RDWR)
+    sock.close()
+
+
+class _Peer:
+    """A follower connection on the leader; its own thread does the sending.
+
+    Whatever is queued by the time the thread wakes goes out in one
+    ``sendall``, and a slow follower never blocks the leader's dispatch.
+    """
+
+    def __init__(self, sock: socket.socket):
+        self.sock = sock
+        self.outbox: queue.SimpleQueue[bytes | None] = queue.SimpleQueue()
+        threading.Thread(target=self._write, daemon=True).start()
+
+    def send(self, data: bytes | None) -> None:
+        """Queue ``data``; ``None`` closes the connection after what is queued."""
+        self.outbox.put(data)
+
+    def _write(self) -> None:
+        closing = False
+        while not closing:
+            chunks = [self.outbox.get()]
+            with contextlib.suppress(queue.Empty):
+                while True:
+                    chunks.append(self.outbox.get_nowait())
+            if None in chunks:
+                closing = True
+                del chunks[chunks.index(None) :]
+            try:
+                self.sock.sendall(b"".join(chunks))  # type: ignore[arg-type]
+            except OSError:
+                closing = True
+        _shutdown(self.sock)
+
+
+class ReplicationLeader:
+    """Serves the events of ``controller`` to followers on ``host:port``.
+
+    Forwarded commands are passed to ``on_command``, by default ``dispatch``,
+    which holds ``lock`` around ``controller.dispatch``. The controller is not
+    thread-safe, so local commands must be serialised with them, e.g. by
+    dispatching them through ``dispatch`` too; followers join under ``lock``.
+    """
+
+    def __init__(
+        self,
+        controller: GameController,
+        *,
+        host: str = "0.0.0.0",
+        port: int = DEFAULT_PORT,
+        backlog: int = DEFAULT_HISTORY,
+        clock: Clock | None = None,
+        on_command: CommandHandler | None = None,
+    ):
+        self.controller = controller
+        self.clock = clock or SystemClock()
+        self.on_command = on_command or self.dispatch
+        self.lock = threading.Lock()
+        self.epoch = os.urandom(8).hex()
+        self.forwarded = 0
+        # Guards the backlog, the peers and the last state seen by a listener.
+        self._lock = threading.Lock()
+        self._backlog: deque[tuple[int, bytes]] = deque(maxlen=backlog)
+        self._peers: list[_Peer] = []
+        self._seq = controller.log_writer.seq
+        self._state = controller.state
+        self._state_seq = self._seq
+        controller.subscribe(self._on_event)
+        controller.add_state_listener(self._on_state)
+        self._server = socket.create_server((host, port))
+        self.address: tuple[str, int] = self._server.getsockname()[:2]
+        threading.Thread(target=self._accept, daemon=True).start()
+
+    def dispatch(self, command: Command) -> DispatchResult:
+        with self.lock:
+            return self.controller.dispatch(command)
+
+    @property
+    def followers(self) -> int:
+        return len(self._peers)
+
+    def close(self) -> None:
+        self.controller.unsubscribe(self._on_event)
+        self.controller.remove_state_listener(self._on_state)
+        _shutdown(self._server)
+        with self._lock:
+            peers, self._peers = self._peers, []
+        for peer in peers:
+            peer.send(None)
+
+    def _on_event(self, _game_id: str, seq: int, event: Event) -> None:
+        line = _line({"t": "ev", "s": seq, "e": event.event_type, "d": event.data})
+        with self._lock:
+            self._backlog.append((seq, line))
+            self._seq = seq
+            for peer in self._peers:
+                peer.send(line)
+
+    def _on_state(self, state: GameState) -> None:
+        # Listeners run once all events of a dispatch are applied, so this
+        # state is exactly the one after ``self._seq``.
+        with self._lock:
+            self._state = state
+            self._state_seq = self._seq
+
+    def _accept(self) -> None:
+        while True:
+            try:
+                sock, _address = self._server.accept()
+            except OSError:
+                return
+            threading.Thread(target=self._serve, args=(_no_delay(sock),), daemon=True).start()
+
+    def _serve(self, sock: socket.socket) -> None:
+        peer = _Peer(sock)
+        try:
+            with sock.makefile("rb") as stream:
+                for raw in stream:
+                    message = json.loads(raw)
+                    kind = message["t"]
+                    if kind == "hello":
+                        self._register(peer, int(message["s"]), str(message["x"]))
+                    elif kind == "ping":
+                        pong = {"t": "pong", "m": message["m"], "l": self.clock.monotonic()}
+                        peer.send(_line(pong))
+                    elif kind == "cmd":
+                        self._forward(peer, message)
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+        finally:
+            with self._lock:
+                if peer in self._peers:
+                    self._peers.remove(peer)
+            peer.send(None)
+
+    def _register(self, peer: _Peer, seq: int, epoch: str) -> None:
+        """Queue what the follower misses after ``seq``, then add it to the broadcast.
+
+        ``lock`` keeps dispatch out while the snapshot is taken: the reducer
+        changes ``controller.state`` in place, so mid-dispatch it may already
+        hold events the backlog would send again.
+        """
+        with self.lock, self._lock:
+            first = self._backlog[0][0] if self._backlog else self._seq + 1
+            peer.send(_line({"t": "welcome", "s": self._seq, "x": self.epoch}))
+            if epoch != self.epoch or not first - 1 <= seq <= self._seq:
+                snapshot = base64.b64encode(encode_state(self._state)).decode("ascii")
+                peer.send(_line({"t": "state", "s": self._state_seq, "b": snapshot}))
+                seq = self._state_seq
+            for entry_seq, line in self._backlog:
+                if entry_seq > seq:
+                    peer.send(line)
+            self._peers.append(peer)
+
+    def _forward(self, peer: _Peer, message: dict[str, Any]) -> None:
+        command_type = FORWARDED.get(message["c"])
+        if command_type is None:
+            return
+        # A follower's clock estimate can run slightly ahead; never act in the future.
+        now = min(float(message["m"]), self.clock.monotonic())
+        command = command_type(now_mono=now, **message.get("a", {}))
+        self.forwarded += 1
+        try:
+            self.on_command(command)
+        except CommandError as error:
+            # The game refused it (e.g. a tap during a pause); the link is fine.
+            peer.send(_line({"t": "reject", "c": message["c"], "r": str(error)}))
+
+
+class ReplicationFollower:
+    """Mirrors a leader's game into ``controller`` from a background thread.
+
+    ``seq`` and ``epoch`` resume a previous session: the leader then only
+    sends the events after ``seq``. The follower reconnects on its own with
+    exponential backoff. ``synced`` is set once the clock offset is measured
+    and the follower has caught up, and cleared while disconnected. Commands
+    the leader refuses come back as reasons in ``rejected``.
+    """
+
+    def __init__(
+        self,
+        controller: GameController,
+        address: tuple[str, int],
+        *,
+        seq: int = 0,
+        epoch: str = "",
+        clock: Clock | None = None,
+        reconnect_min: float = RECONNECT_MIN,
+        reconnect_max: float = RECONNECT_MAX,
+    ):
+        self.controller = controller
+        self.address = address
+        self.seq = seq
+        self.epoch = epoch
+        self.clock = clock or SystemClock()
+        self.reconnect_min = reconnect_min
+        self.reconnect_max = reconnect_max
+        self.offset = 0.0
+        self.rtt = math.inf
+        self.synced = threading.Event()
+        self.connects = 0
+        self.snapshots = 0
+        self.applied = 0
+        self.rejected: list[str] = []
+        self._sock: socket.socket | None = None
+        self._send_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> ReplicationFollower:
+        self._thread = threading.Thread(target=self.run, daemon=True)
+        self._thread.start()
+        return self
+
+    def wait_synced(self, timeout: float | None = None) -> bool:
+        return self.synced.wait(timeout)
+
+    def leader_time(self, now_mono: float) -> float:
+        return now_mono + self.offset
+
+    def tap(self) -> None:
+        self.forward(CmdTap(now_mono=self.clock.monotonic()))
+
+    def forward(self, command: Command) -> None:
+        """Send ``command`` to the leader; its ``now_mono`` is on this device's clock."""
+        name = type(command).__name__
+        if name not in FORWARDED:
+            raise ValueError(f"{name} cannot be forwarded to the leader")
+        if not self.synced.is_set():
+            raise ReplicationError("Not connected to the leader")
+        args = {
+            field.name: getattr(command, field.name)
+            for field in fields(command)
+            if field.name != "now_mono"
+        }
+        message = {"t": "cmd", "c": name, "m": self.leader_time(command.now_mono)}
+        if args:
+            message["a"] = args
+        try:
+            self._send(message)
+        except OSError as error:
+            raise ReplicationError("Lost the connection to the leader") from error
+
+    def run(self) -> None:
+        delay = self.reconnect_min
+        while not self._stop.is_set():
+            try:
+                self._session()
+            except (OSError, ValueError, KeyError, TypeError, ReplicationError):
+                pass
+            finally:
+                self.synced.clear()
+                if self._sock is not None:
+                    _shutdown(self._sock)
+                    self._sock = None
+            if self.connects and self.rtt < math.inf:
+                delay = self.reconnect_min
+            self._stop.wait(delay)
+            delay = min(delay * 2, self.reconnect_max)
+
+    def close(self) -> None:
+        self._stop.set()
+        sock = self._sock
+        if sock is not None:
+            with contextlib.suppress(OSError):
+                sock.shutdown(socket.SHUT_RDWR)
+        if self._thread is not None:
+            self._thread.join()
+
+    def _send(self, message: dict[str, Any]) -> None:
+        sock = self._sock
+        if sock is None:
+            raise OSError("not connected")
+        with self._send_lock:
+            sock.sendall(_line(message))
+
+    def _session(self) -> None:
+        self._sock = _no_delay(socket.create_connection(self.address))
+        if self._stop.is_set():
+            return
+        self.connects += 1
+        self.rtt = math.inf
+        pongs = 0
+        target = math.inf
+        self._send({"t": "hello", "s": self.seq, "x": self.epoch})
+        self._send({"t": "ping", "m": self.clock.monotonic()})
+        with self._sock.makefile("rb") as stream:
+            for raw in stream:
+                message = json.loads(raw)
+                kind = message["t"]
+                if kind == "ev":
+                    self._apply(message)
+                elif kind == "welcome":
+                    target = message["s"]
+                    self.epoch = message["x"]
+                elif kind == "state":
+                    self._restore(message)
+                elif kind == "reject":
+                    self.rejected.append(str(message["r"]))
+                elif kind == "pong":
+                    self._measure(message)
+                    pongs += 1
+                    if pongs < PING_ROUNDS:
+                        self._send({"t": "ping", "m": self.clock.monotonic()})
+                if pongs >= PING_ROUNDS and self.seq >= target:
+                    self.synced.set()
+
+    def _measure(self, message: dict[str, Any]) -> None:
+        received = self.clock.monotonic()
+        sent = float(message["m"])
+        rtt = received - sent
+        # The fastest round trip is the least skewed by queueing on either side.
+        if rtt < self.rtt:
+            self.rtt = rtt
+            self.offset = float(message["l"]) - (sent + received) / 2
+
+    def _apply(self, message: dict[str, Any]) -> None:
+        seq = int(message["s"])
+        if seq <= self.seq:
+            return
+        if seq != self.seq + 1:
+            raise ReplicationError(f"Missed events {self.seq + 1}..{seq - 1}")
+        self.controller.apply_replayed(seq, Event(message["e"], message["d"]))
+        self.seq = seq
+        self.applied += 1
+
+    def _restore(self, message: dict[str, Any]) -> None:
+        self.controller.restore_state(decode_state(base64.b64decode(message["b"])))
+        self.seq = int(message["s"])
+        self.snapshots += 1
+
+
+def parse_address(text: str) -> tuple[str, int]:
+    host, _, port = text.rpartition(":")
+    if not host:
+        return text, DEFAULT_PORT
+    return host, int(port)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Follow a leading device and print its table")
+    parser.add_argument("leader", help="HOST[:PORT] of the leader")
+    parser.add_argument("--sounds", type=Path, default=Path("./appdata/sounds"))
+    args = parser.parse_args(argv)
+    controller = GameController(
+        decider=Decider(""),
+        log_writer=MemoryEventStore(),
+        effects=EffectSink(),
+        sound_repo=SoundRepo(args.sounds),
+    )
+
+    def show(state: GameState) -> None:
+        banks = "  ".join(f"{name}={state.bank.get(name, 0.0):.1f}" for name in state.order.names())
+        print(f"{state.mode.value:<10} {state.current_player or '-':<12} {banks}", flush=True)
+
+    controller.add_state_listener(show)
+    follower = ReplicationFollower(controller, parse_address(args.leader)).start()
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        follower.close()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
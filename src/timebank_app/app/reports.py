@@ -0,0 +1,50 @@
+"""Season report: per-player and per-game totals over many logs."""
+
+from __future__ import annotations
+
+import argparse
+import time
+from pathlib import Path
+
+from timebank_app.app.analytics import (
+    PARALLEL_CHUNK,
+    game_aggregates,
+    load_columns_parallel,
+    player_aggregates,
+)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Season report over LOG_FORMAT v=1 logs")
+    parser.add_argument("logs", type=Path, nargs="+")
+    parser.add_argument("--workers", type=int, default=None, help="processes (default: cores)")
+    parser.add_argument("--chunk-mb", type=float, default=PARALLEL_CHUNK / (1 << 20))
+    args = parser.parse_args(argv)
+
+    started = time.perf_counter()
+    columns = load_columns_parallel(
+        args.logs, workers=args.workers, chunk_bytes=max(1, int(args.chunk_mb * (1 << 20)))
+    )
+    players = player_aggregates(columns)
+    games = game_aggregates(columns)
+    elapsed = time.perf_counter() - started
+
+    print(
+        f"{'player':<24}{'turns':>8}{'countdown s':>14}{'cooldown s':>13}{'mean turn s':>13}"
+        f"{'warns':>8}"
+    )
+    for index, name in enumerate(players.names):
+        print(
+            f"{name or '-':<24}{players.turns[index]:>8}"
+            f"{players.countdown_seconds[index]:>14.1f}{players.cooldown_seconds[index]:>13.1f}"
+            f"{players.mean_turn_seconds[index]:>13.1f}{players.warns[index]:>8}"
+        )
+    print(
+        f"{len(columns)} turn events, {len(games.game_ids)} games,"
+        f" {int(games.turns.sum())} turns in {elapsed:.2f}s"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
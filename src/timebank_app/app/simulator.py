@@ -0,0 +1,344 @@
+from __future__ import annotations
+
+import argparse
+import heapq
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+from collections import Counter
+from collections.abc import Generator, Iterator
+from dataclasses import dataclass, field, replace
+from pathlib import Path
+
+from timebank_app.app.controller import GameController
+from timebank_app.domain.commands import (
+    CmdAdminAuth,
+    CmdAdminEdit,
+    CmdAdminModeOff,
+    CmdBackground,
+    CmdPauseOff,
+    CmdPauseOn,
+    CmdResume,
+    CmdStartGame,
+    CmdTap,
+    CmdTick,
+    Command,
+)
+from timebank_app.domain.engine import CommandError, Decider
+from timebank_app.domain.models import Mode, OrderDir, PlayerConfig, Rules
+from timebank_app.infra.effects import EffectSink, SoundRepo
+from timebank_app.infra.logging import LogWriter
+
+SIM_PASSWORD = "sim"
+ADMIN_EDITS = ("reverse", "set_bank", "rename_player", "undo", "new_game")
+
+
+@dataclass(slots=True)
+class SimulationProfile:
+    """Shape of a simulated session; all durations are virtual seconds."""
+
+    players: int = 5
+    mean_turn: float = 45.0
+    min_turn: float = 1.0
+    tick_interval: float = 0.25
+    pause_chance: float = 0.03
+    mean_pause: float = 90.0
+    background_share: float = 0.3
+    edit_chance: float = 0.5
+    rules: Rules = field(default_factory=lambda: Rules(bank_initial=3600.0, warn_every=60))
+
+
+@dataclass(slots=True)
+class SimulationReport:
+    tables: int
+    virtual_seconds: float
+    wall_seconds: float = 0.0
+    commands: int = 0
+    events: int = 0
+    rejected_commands: int = 0
+    log_bytes: int = 0
+    log_lines: int = 0
+    peak_traced_bytes: int | None = None
+    max_rss_bytes: int | None = None
+    events_by_type: Counter[str] = field(default_factory=Counter)
+
+    @property
+    def commands_per_second(self) -> float:
+        return self.commands / self.wall_seconds if self.wall_seconds else 0.0
+
+    @property
+    def events_per_second(self) -> float:
+        return self.events / self.wall_seconds if self.wall_seconds else 0.0
+
+    @property
+    def speedup(self) -> float:
+        if not self.wall_seconds:
+            return 0.0
+        return self.tables * self.virtual_seconds / self.wall_seconds
+
+    def summary(self) -> str:
+        lines = [
+            f"tables={self.tables} virtual_hours={self.virtual_seconds / 3600:.2f}",
+            f"wall={self.wall_seconds:.3f}s speedup={self.speedup:.0f}x",
+            f"commands={self.commands} ({self.commands_per_second:.0f}/s)"
+            f" rejected={self.rejected_commands}",
+            f"events={self.events} ({self.events_per_second:.0f}/s)",
+            f"log_bytes={self.log_bytes} log_lines={self.log_lines}"
+            f" bytes_per_table_hour={self.log_bytes_per_table_hour:.0f}",
+        ]
+        if self.peak_traced_bytes is not None:
+            lines.append(f"peak_traced_bytes={self.peak_traced_bytes}")
+        if self.max_rss_bytes is not None:
+            lines.append(f"max_rss_bytes={self.max_rss_bytes}")
+        lines.extend(f"  {name}={count}" for name, count in sorted(self.events_by_type.items()))
+        return "\n".join(lines)
+
+    @property
+    def log_bytes_per_table_hour(self) -> float:
+        table_hours = self.tables * self.virtual_seconds / 3600
+        return self.log_bytes / table_hours if table_hours else 0.0
+
+
+def make_table_controller(log_path: Path) -> GameController:
+    return GameController(
+        decider=Decider(SIM_PASSWORD),
+        log_writer=LogWriter(log_path),
+        effects=EffectSink(),
+        sound_repo=SoundRepo(log_path.parent / "sounds"),
+        keep_log_lines=False,
+    )
+
+
+def session_commands(
+    controller: GameController,
+    rng: random.Random,
+    profile: SimulationProfile,
+    duration: float,
+    table_no: int = 0,
+) -> Iterator[Command]:
+    """Yield a lazily generated session for one table on a virtual clock.
+
+    Commands are produced one at a time so the generator can look at the
+    controller state left by the previous command (names for renames, the
+    current player for bank edits) and memory stays flat for long sessions.
+    """
+    names = [f"T{table_no}P{idx}" for idx in range(profile.players)]
+    game_no = 0
+    now = 0.0
+    yield CmdStartGame(
+        now_mono=now,
+        game_id=f"t{table_no}-g{game_no}",
+        players=[PlayerConfig(name=name) for name in names],
+        order=list(names),
+        order_dir=OrderDir.CLOCKWISE,
+        rules=replace(profile.rules),
+    )
+
+    while now < duration:
+        turn_length = max(profile.min_turn, rng.expovariate(1.0 / profile.mean_turn))
+        turn_end = min(duration, now + turn_length)
+        pause_at = now + rng.random() * turn_length if rng.random() < profile.pause_chance else None
+
+        while now + profile.tick_interval < turn_end:
+            now += profile.tick_interval
+            if pause_at is not None and now >= pause_at:
+                pause_at = None
+                paused_at = now
+                now = yield from _pause_session(controller, rng, profile, now, table_no, game_no)
+                game_no = _game_no(controller, game_no)
+                if controller.state.mode != Mode.RUNNING:
+                    return
+                turn_end = min(duration, turn_end + now - paused_at)
+                continue
+            yield CmdTick(now_mono=now)
+
+        now = turn_end
+        if now >= duration:
+            return
+        yield CmdTap(now_mono=now)
+
+
+def _game_no(controller: GameController, game_no: int) -> int:
+    game_id = controller.state.game_id
+    suffix = game_id.rsplit("-g", 1)[-1]
+    return int(suffix) if suffix.isdigit() else game_no
+
+
+def _pause_session(
+    controller: GameController,
+    rng: random.Random,
+    profile: SimulationProfile,
+    now: float,
+    table_no: int,
+    game_no: int,
+) -> Generator[Command, None, float]:
+    if rng.random() < profile.background_share:
+        yield CmdBackground(now_mono=now)
+    else:
+        yield CmdPauseOn(now_mono=now, cause="manual")
+    pause_end = now + rng.expovariate(1.0 / profile.mean_pause)
+
+    if rng.random() < profile.edit_chance:
+        now += 1.0
+        yield CmdAdminAuth(now_mono=now, password=SIM_PASSWORD)
+        now += 1.0
+        edit = _random_edit(controller, rng, now, table_no, game_no)
+        if edit is not None:
+            yield edit
+        now += 1.0
+        yield CmdAdminModeOff(now_mono=now)
+
+    now = max(now, pause_end)
+    if rng.random() < profile.background_share:
+        yield CmdResume(now_mono=now)
+    else:
+        yield CmdPauseOff(now_mono=now)
+    return now
+
+
+def _random_edit(
+    controller: GameController,
+    rng: random.Random,
+    now: float,
+    table_no: int,
+    game_no: int,
+) -> CmdAdminEdit | None:
+    state = controller.state
+    edit_type = rng.choice(ADMIN_EDITS)
+    current = state.current_player
+    if edit_type == "reverse":
+        return CmdAdminEdit(now_mono=now, edit_type="reverse", payload={})
+    if edit_type == "set_bank" and current is not None:
+        value = round(max(0.0, state.bank.get(current, 0.0) + rng.uniform(-60.0, 60.0)), 3)
+        return CmdAdminEdit(
+            now_mono=now, edit_type="set_bank", payload={"player": current, "value": value}
+        )
+    if edit_type == "rename_player" and state.order:
+        old = rng.choice(list(state.order))
+        new = f"{old.split('~', 1)[0]}~{rng.randrange(1_000_000)}"
+        if new in state.bank:
+            return None
+        return CmdAdminEdit(
+            now_mono=now, edit_type="rename_player", payload={"old": old, "new": new}
+        )
+    if edit_type == "undo":
+        return CmdAdminEdit(now_mono=now, edit_type="undo", payload={})
+    if edit_type == "new_game":
+        return CmdAdminEdit(
+            now_mono=now,
+            edit_type="new_game",
+            payload={"game_id": f"t{table_no}-g{game_no + 1}"},
+        )
+    return None
+
+
+def run_simulation(
+    *,
+    tables: int,
+    hours: float,
+    out_dir: Path,
+    profile: SimulationProfile | None = None,
+    seed: int = 0,
+    trace_memory: bool = False,
+) -> SimulationReport:
+    """Drive ``tables`` controllers through ``hours`` of virtual play each.
+
+    Tables are interleaved by virtual time so every controller is alive at once,
+    the way a hub hosting several tables would look. Each table writes its own
+    log file under ``out_dir``.
+    """
+    profile = profile or SimulationProfile()
+    duration = hours * 3600.0
+    report = SimulationReport(tables=tables, virtual_seconds=duration)
+    out_dir.mkdir(parents=True, exist_ok=True)
+
+    controllers: list[GameController] = []
+    sessions: list[Iterator[Command]] = []
+    for table_no in range(tables):
+        controller = make_table_controller(out_dir / f"table-{table_no:03d}.log")
+        rng = random.Random(f"{seed}:{table_no}")
+        controllers.append(controller)
+        sessions.append(session_commands(controller, rng, profile, duration, table_no))
+
+    if trace_memory:
+        tracemalloc.start()
+    started = time.perf_counter()
+
+    queue: list[tuple[float, int, Command]] = []
+    for table_no, session in enumerate(sessions):
+        first = next(session, None)
+        if first is not None:
+            queue.append((first.now_mono, table_no, first))
+    heapq.heapify(queue)
+
+    while queue:
+        _, table_no, command = heapq.heappop(queue)
+        report.commands += 1
+        try:
+            result = controllers[table_no].dispatch(command)
+        except CommandError:
+            report.rejected_commands += 1
+        else:
+            report.events += len(result.events)
+            report.events_by_type.update(event.event_type for event in result.events)
+        following = next(sessions[table_no], None)
+        if following is not None:
+            heapq.heappush(queue, (following.now_mono, table_no, following))
+
+    report.wall_seconds = time.perf_counter() - started
+    if trace_memory:
+        report.peak_traced_bytes = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    report.max_rss_bytes = _max_rss_bytes()
+
+    for controller in controllers:
+        path = controller.log_writer.path
+        report.log_bytes += path.stat().st_size
+        with path.open("rb") as handle:
+            report.log_lines += sum(1 for _ in handle)
+    return report
+
+
+def _max_rss_bytes() -> int | None:
+    try:
+        import resource
+    except ImportError:
+        return None
+    usage = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return usage if sys.platform == "darwin" else usage * 1024
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Virtual-clock timebank load generator")
+    parser.add_argument("--tables", type=int, default=4)
+    parser.add_argument("--hours", type=float, default=1.0)
+    parser.add_argument("--players", type=int, default=5)
+    parser.add_argument("--mean-turn", type=float, default=45.0)
+    parser.add_argument("--tick", type=float, default=0.25, help="UI ticker interval, seconds")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--out", type=Path, default=None, help="keep logs in this directory")
+    parser.add_argument("--trace-memory", action="store_true", help="report tracemalloc peak")
+    args = parser.parse_args(argv)
+
+    profile = SimulationProfile(
+        players=args.players,
+        mean_turn=args.mean_turn,
+        tick_interval=args.tick,
+    )
+    with tempfile.TemporaryDirectory() as scratch:
+        report = run_simulation(
+            tables=args.tables,
+            hours=args.hours,
+            out_dir=args.out or Path(scratch),
+            profile=profile,
+            seed=args.seed,
+            trace_memory=args.trace_memory,
+        )
+    print(report.summary())
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,321 @@
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import struct
+from array import array
+from bisect import bisect_right
+from collections.abc import Iterable
+from copy import deepcopy
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any
+
+from timebank_app.domain.engine import apply_event
+from timebank_app.domain.events import Event
+from timebank_app.domain.models import GameState
+from timebank_app.infra.log_reader import LogRecord, decode_event, parse_log_line
+from timebank_app.infra.logging import new_game_id
+from timebank_app.infra.state_codec import decode_state, encode_state
+
+INDEX_SUFFIX = ".tti"
+INDEX_MAGIC = b"TBTTI1\n"
+_INDEX_HEAD = struct.Struct("<7sI")
+
+
+class TimeTravelIndexError(ValueError):
+    """Raised when an index sidecar cannot be used for its log."""
+
+
+@dataclass(slots=True)
+class _Checkpoint:
+    position: int
+    state: bytes
+
+
+@dataclass(slots=True)
+class _GameIndex:
+    seqs: array = field(default_factory=lambda: array("q"))
+    offsets: array = field(default_factory=lambda: array("q"))
+    checkpoints: list[_Checkpoint] = field(default_factory=list)
+    head: GameState = field(default_factory=GameState)
+    ordered: bool = True
+
+
+def event_game_id(record: LogRecord, event: Event) -> str:
+    """Game an event belongs to: ``GAME_START`` is logged before its id is set."""
+    if event.event_type == "GAME_START":
+        return str(event.data["game_id"])
+    return record.game_id
+
+
+def replay_games(records: Iterable[LogRecord]) -> dict[str, GameState]:
+    """Final state of every game in ``records``, routed the same way as the index."""
+    heads: dict[str, GameState] = {}
+    for record in records:
+        event = decode_event(record)
+        game_id = event_game_id(record, event)
+        if event.event_type == "GAME_START" or game_id not in heads:
+            heads[game_id] = GameState()
+        heads[game_id] = apply_event(heads[game_id], event)
+        follow_up = new_game_id(event)
+        if follow_up is not None and follow_up != game_id:
+            heads[follow_up] = deepcopy(heads[game_id])
+    return heads
+
+
+class LogTimeMachine:
+    """Answer "what was the state at SEQ n of game g" without replaying the log.
+
+    One incremental scan builds, per game, a seek index (SEQ and byte offset of
+    every event, packed in arrays) and a ``state_codec`` snapshot every
+    ``snapshot_every`` events. ``state_at`` then seeks to the nearest snapshot
+    and replays at most ``snapshot_every`` lines of that game.
+
+    ``save`` keeps the index in a sidecar next to the log and ``load`` picks it
+    up again while the log is the same file, so only appended lines are scanned.
+    """
+
+    def __init__(self, path: Path, snapshot_every: int = 256):
+        self.path = path
+        self.snapshot_every = max(1, snapshot_every)
+        self.games: dict[str, _GameIndex] = {}
+        self._offset = 0
+        self._saved_offset = 0
+
+    @property
+    def index_path(self) -> Path:
+        return self.path.with_name(self.path.name + INDEX_SUFFIX)
+
+    @classmethod
+    def load(cls, path: Path, snapshot_every: int = 256) -> LogTimeMachine:
+        """Machine for ``path`` with the saved index, if it still matches the log."""
+        machine = cls(path, snapshot_every)
+        try:
+            machine._read_index()
+        except (OSError, KeyError, TypeError, ValueError):
+            # Missing, stale or damaged: scan the log from the top instead.
+            machine.games = {}
+            machine._offset = machine._saved_offset = 0
+        return machine
+
+    def save(self) -> None:
+        """Write the index sidecar unless nothing was indexed since the last save."""
+        if self._offset == self._saved_offset or not self.path.exists():
+            return
+        games = []
+        blobs: list[bytes] = []
+        for game_id, index in self.games.items():
+            head = encode_state(index.head)
+            games.append(
+                {
+                    "id": game_id,
+                    "events": len(index.seqs),
+                    "ordered": index.ordered,
+                    "checkpoints": [
+                        [checkpoint.position, len(checkpoint.state)]
+                        for checkpoint in index.checkpoints
+                    ],
+                    "head": len(head),
+                }
+            )
+            blobs += [index.seqs.tobytes(), index.offsets.tobytes()]
+            blobs += [checkpoint.state for checkpoint in index.checkpoints]
+            blobs.append(head)
+        header = json.dumps(
+            {
+                "offset": self._offset,
+                "inode": self.path.stat().st_ino,
+                "snapshot_every": self.snapshot_every,
+                "games": games,
+            },
+            ensure_ascii=False,
+        ).encode("utf-8")
+        tmp_path = self.index_path.with_name(self.index_path.name + ".tmp")
+        with tmp_path.open("wb") as handle:
+            handle.write(_INDEX_HEAD.pack(INDEX_MAGIC, len(header)))
+            handle.write(header)
+            handle.write(b"".join(blobs))
+        os.replace(tmp_path, self.index_path)
+        self._saved_offset = self._offset
+
+    def _read_index(self) -> None:
+        data = self.index_path.read_bytes()
+        try:
+            magic, length = _INDEX_HEAD.unpack_from(data)
+            header = json.loads(data[_INDEX_HEAD.size : _INDEX_HEAD.size + length])
+        except (struct.error, ValueError) as exc:
+            raise TimeTravelIndexError("Index sidecar is corrupt") from exc
+        if magic != INDEX_MAGIC or header["snapshot_every"] != self.snapshot_every:
+            raise TimeTravelIndexError("Index sidecar is for other settings")
+        stat = self.path.stat()
+        # A rotated or compacted log is a new file; an index past its end is stale.
+        if header["inode"] != stat.st_ino or header["offset"] > stat.st_size:
+            raise TimeTravelIndexError("Index sidecar is for another log")
+        view = memoryview(data)
+        pos = _INDEX_HEAD.size + length
+
+        def take(size: int) -> memoryview:
+            nonlocal pos
+            if pos + size > len(data):
+                raise TimeTravelIndexError("Index sidecar is truncated")
+            pos += size
+            return view[pos - size : pos]
+
+        for game in header["games"]:
+            index = _GameIndex(ordered=game["ordered"])
+            index.seqs.frombytes(take(8 * game["events"]))
+            index.offsets.frombytes(take(8 * game["events"]))
+            for position, size in game["checkpoints"]:
+                index.checkpoints.append(_Checkpoint(position, bytes(take(size))))
+            index.head = decode_state(bytes(take(game["head"])))
+            self.games[game["id"]] = index
+        self._offset = self._saved_offset = header["offset"]
+
+    def refresh(self) -> None:
+        """Index lines appended since the previous call."""
+        if not self.path.exists():
+            return
+        with self.path.open("rb") as handle:
+            handle.seek(self._offset)
+            offset = self._offset
+            for raw in handle:
+                if not raw.endswith(b"\n"):
+                    break
+                line_offset = offset
+                offset += len(raw)
+                record = parse_log_line(raw.decode("utf-8"))
+                if record is not None:
+                    self._index(record, line_offset)
+            self._offset = offset
+
+    def _start_game(self, game_id: str, start_state: GameState) -> _GameIndex:
+        index = _GameIndex(head=start_state)
+        index.checkpoints.append(_Checkpoint(position=0, state=encode_state(start_state)))
+        self.games[game_id] = index
+        return index
+
+    def _index(self, record: LogRecord, line_offset: int) -> None:
+        event = decode_event(record)
+        game_id = event_game_id(record, event)
+        index = self.games.get(game_id)
+        if event.event_type == "GAME_START" or index is None:
+            index = self._start_game(game_id, GameState())
+
+        if index.seqs and record.seq <= index.seqs[-1]:
+            index.ordered = False
+        index.seqs.append(record.seq)
+        index.offsets.append(line_offset)
+        index.head = apply_event(index.head, event)
+
+        if len(index.seqs) % self.snapshot_every == 0:
+            index.checkpoints.append(
+                _Checkpoint(position=len(index.seqs), state=encode_state(index.head))
+            )
+        follow_up = new_game_id(event)
+        if follow_up is not None and follow_up != game_id:
+            self._start_game(follow_up, deepcopy(index.head))
+
+    def _position(self, index: _GameIndex, seq: int) -> int:
+        if index.ordered:
+            position = bisect_right(index.seqs, seq)
+            if position and index.seqs[position - 1] == seq:
+                return position
+        else:
+            for position in range(len(index.seqs), 0, -1):
+                if index.seqs[position - 1] == seq:
+                    return position
+        raise KeyError(seq)
+
+    def state_at(self, game_id: str, seq: int) -> GameState:
+        """State of ``game_id`` right after the event logged with ``seq``."""
+        self.refresh()
+        index = self.games.get(game_id)
+        if index is None:
+            raise KeyError(game_id)
+        target = self._position(index, seq)
+
+        positions = [checkpoint.position for checkpoint in index.checkpoints]
+        checkpoint = index.checkpoints[bisect_right(positions, target) - 1]
+        state = decode_state(checkpoint.state)
+        position = checkpoint.position
+        if position == target:
+            return state
+
+        wanted = set(index.offsets[position:target])
+        with self.path.open("rb") as handle:
+            handle.seek(index.offsets[position])
+            offset = index.offsets[position]
+            for raw in handle:
+                line_offset = offset
+                offset += len(raw)
+                if line_offset not in wanted:
+                    continue
+                record = parse_log_line(raw.decode("utf-8"))
+                if record is None:
+                    continue
+                state = apply_event(state, decode_event(record))
+                position += 1
+                if position == target:
+                    break
+        return state
+
+    def seqs(self, game_id: str) -> list[int]:
+        self.refresh()
+        return list(self.games[game_id].seqs)
+
+
+def state_at(path: Path, game_id: str, seq: int) -> GameState:
+    """``LogTimeMachine.state_at`` through the saved index, which is brought up to date."""
+    machine = LogTimeMachine.load(path)
+    machine.refresh()
+    machine.save()
+    return machine.state_at(game_id, seq)
+
+
+def state_summary(state: GameState) -> dict[str, Any]:
+    return {
+        "game_id": state.game_id,
+        "mode": state.mode.value,
+        "current_player": state.current_player,
+        "order": list(state.order),
+        "order_dir": state.order_dir.value,
+        "bank": dict(state.bank),
+        "turn": {**asdict(state.turn), "phase": state.turn.phase.value},
+        "rules": asdict(state.rules),
+        "players": [asdict(player) for player in state.players],
+        "admin_mode": state.admin_mode,
+        "undo_depth": len(state.undo_ring),
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Reconstruct GameState at a log SEQ")
+    parser.add_argument("log", type=Path)
+    parser.add_argument("game_id", nargs="?")
+    parser.add_argument("seq", nargs="?", type=int)
+    parser.add_argument("--snapshot-every", type=int, default=256)
+    args = parser.parse_args(argv)
+
+    machine = LogTimeMachine.load(args.log, snapshot_every=args.snapshot_every)
+    machine.refresh()
+    machine.save()
+    if args.game_id is None:
+        for game_id, index in machine.games.items():
+            first, last = (index.seqs[0], index.seqs[-1]) if index.seqs else (0, 0)
+            print(f"{game_id or '-'} events={len(index.seqs)} seq={first}..{last}")
+        return 0
+    game_id = "" if args.game_id == "-" else args.game_id
+    if args.seq is None:
+        parser.error("seq is required together with game_id")
+    try:
+        state = machine.state_at(game_id, args.seq)
+    except KeyError as exc:
+        parser.exit(1, f"not found: {exc}\n")
+    print(json.dumps(state_summary(state), ensure_ascii=False, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
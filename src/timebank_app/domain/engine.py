@@ -1,7 +1,6 @@
 from __future__ import annotations
 
-from copy import deepcopy
-from dataclasses import asdict
+from dataclasses import asdict, replace
 
 from .commands import (
     CmdAdminAuth,
@@ -17,7 +16,8 @@ from .commands import (
     Command,
 )
 from .events import Event, ev
-from .models import GameState, Mode, OrderDir, PlayerConfig, Rules, TurnPhase
+from .models import GameState, Mode, OrderDir, PlayerConfig, Rules, TurnPhase, TurnSnapshot
+from .seating import SeatRing
 
 
 class CommandError(ValueError):
@@ -29,10 +29,8 @@ class Decider:
         self.admin_password = admin_password
 
     @staticmethod
-    def _next_player(order: list[str], current: str, order_dir: OrderDir) -> str:
-        idx = order.index(current)
-        shift = 1 if order_dir == OrderDir.CLOCKWISE else -1
-        return order[(idx + shift) % len(order)]
+    def _next_player(order: SeatRing, current: str, order_dir: OrderDir) -> str:
+        return order.next(current) if order_dir == OrderDir.CLOCKWISE else order.prev(current)
 
     @staticmethod
     def _advance_runtime(state: GameState, now_mono: float) -> list[Event]:
@@ -50,7 +48,7 @@ class Decider:
 
         if state.turn.phase == TurnPhase.COUNTDOWN:
             spent = elapsed_since_phase
-            state.turn.elapsed_no_cooldown = spent
+            state.turn.elapsed_no_cooldown += spent
             bank_before = state.bank[state.current_player]
             state.bank[state.current_player] = bank_before - spent
             state.turn.phase_started_mono = now_mono
@@ -97,7 +95,12 @@ class Decider:
         )
 
     def decide(self, state: GameState, command: Command) -> list[Event]:
-        shadow = deepcopy(state)
+        # _advance_runtime only touches the turn and the current player's bank,
+        # so the shadow carries just that entry and shares the rest; a tap
+        # stays cheap at tables with hundreds of seats.
+        current = state.current_player
+        bank = {current: state.bank[current]} if current in state.bank else {}
+        shadow = replace(state, turn=replace(state.turn), bank=bank)
         pre_events = self._advance_runtime(shadow, command.now_mono)
         runtime_sync = self._runtime_sync_event(state, shadow, command.now_mono)
         if runtime_sync is not None:
@@ -216,6 +219,10 @@ class Decider:
             ]
         if not state.admin_mode:
             raise CommandError("Admin mode is required")
+        if command.edit_type == "undo":
+            steps = undo_steps(command.payload)
+            if steps > 1 and steps > len(state.undo_ring):
+                raise CommandError(f"Only {len(state.undo_ring)} turns can be undone")
         return pre_events + [
             ev(
                 "ADMIN_EDIT",
@@ -225,9 +232,52 @@ class Decider:
         ]
 
 
+def undo_steps(payload: dict) -> int:
+    steps = payload.get("steps", 1)
+    if not isinstance(steps, int) or isinstance(steps, bool) or steps < 1:
+        raise CommandError("Undo steps must be a positive integer")
+    return steps
+
+
+def _undo_turns(state: GameState, steps: int) -> None:
+    target: TurnSnapshot | None = None
+    for _ in range(min(steps, len(state.undo_ring))):
+        # Each undone turn gives its player back the time spent in it; the
+        # oldest one is popped last, so its bank wins for a repeated player.
+        target = state.undo_ring.pop()
+        state.bank[target.player] = target.bank_before
+    if target is None:
+        return
+
+    state.bank[target.player] = target.bank_after
+    state.current_player = target.player
+    state.turn.phase = TurnPhase.COUNTDOWN
+    state.turn.elapsed_no_cooldown = target.spent_no_cooldown
+    warn_every = max(1, state.rules.warn_every)
+    state.turn.warn_count = int(state.turn.elapsed_no_cooldown // warn_every)
+    if state.undo_ring:
+        previous = state.undo_ring[-1]
+        state.last_turn_end = {
+            "player": previous.player,
+            "bank_after": previous.bank_after,
+            "spent_no_cooldown": previous.spent_no_cooldown,
+        }
+    else:
+        state.last_turn_end = None
+
+
+def _rename_in_history(state: GameState, old: str, new: str) -> None:
+    if state.last_turn_end and state.last_turn_end["player"] == old:
+        state.last_turn_end["player"] = new
+    snapshots = list(state.undo_ring)
+    state.undo_ring.clear()
+    for snap in snapshots:
+        state.undo_ring.append(replace(snap, player=new) if snap.player == old else snap)
+
+
 def _apply_edit(state: GameState, etype: str, payload: dict) -> None:
     if etype == "reorder":
-        state.order = payload["new_order"]
+        state.order = SeatRing(payload["new_order"])
     elif etype == "reverse":
         state.order_dir = (
             OrderDir.COUNTERCLOCKWISE
@@ -244,12 +294,13 @@ def _apply_edit(state: GameState, etype: str, payload: dict) -> None:
         new = payload["new"]
         if old in state.bank:
             state.bank[new] = state.bank.pop(old)
-        state.order = [new if value == old else value for value in state.order]
+        state.order.rename(old, new)
         if state.current_player == old:
             state.current_player = new
         for player in state.players:
             if player.name == old:
                 player.name = new
+        _rename_in_history(state, old, new)
     elif etype == "set_color":
         for player in state.players:
             if player.name == payload["player"]:
@@ -262,18 +313,25 @@ def _apply_edit(state: GameState, etype: str, payload: dict) -> None:
         player_name = payload["player"]
         if player_name not in state.order or len(state.order) <= 1:
             return
-        state.order = [name for name in state.order if name != player_name]
+        state.order.remove(player_name)
         state.bank.pop(player_name, None)
         state.players = [player for player in state.players if player.name != player_name]
         if state.current_player == player_name:
-            state.current_player = state.order[0] if state.order else None
+            state.current_player = state.order.first()
+        state.undo_ring.clear()
+        if state.last_turn_end and state.last_turn_end["player"] == player_name:
+            state.last_turn_end = None
     elif etype == "new_game":
         state.game_id = payload["game_id"]
         state.bank = {name: state.rules.bank_initial for name in state.order}
-        state.current_player = state.order[0] if state.order else None
+        state.current_player = state.order.first()
         state.turn.phase = TurnPhase.COOLDOWN
         state.turn.elapsed_no_cooldown = 0.0
         state.turn.warn_count = 0
+        state.last_turn_end = None
+        state.undo_ring.clear()
+    elif etype == "undo" and state.undo_ring:
+        _undo_turns(state, undo_steps(payload))
     elif etype == "undo" and state.last_turn_end:
         state.current_player = state.last_turn_end["player"]
         state.bank[state.current_player] = state.last_turn_end["bank_after"]
@@ -289,10 +347,12 @@ def apply_event(state: GameState, event: Event) -> GameState:
         state.mode = Mode.RUNNING
         state.game_started = True
         state.players = [PlayerConfig(**item) for item in event.data["players"]]
-        state.order = list(event.data["order"])
+        state.order = SeatRing(event.data["order"])
         state.order_dir = OrderDir(event.data["order_dir"])
         state.rules = Rules(**event.data["rules"])
         state.bank = {name: state.rules.bank_initial for name in state.order}
+        state.last_turn_end = None
+        state.undo_ring.clear()
 
     elif event.event_type == "TURN_START":
         state.current_player = event.data["player"]
@@ -309,6 +369,9 @@ def apply_event(state: GameState, event: Event) -> GameState:
         player = event.data["player"]
         state.bank[player] = event.data["bank_after"]
         state.last_turn_end = dict(event.data)
+        state.undo_ring.append(
+            TurnSnapshot(player, event.data["bank_after"], event.data.get("spent_no_cooldown", 0.0))
+        )
 
     elif event.event_type == "RUNTIME_SYNC":
         player = event.data["player"]
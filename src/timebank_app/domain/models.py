@@ -1,9 +1,14 @@
 from __future__ import annotations
 
+from collections import deque
 from dataclasses import dataclass, field
 from enum import Enum
 from typing import Any
 
+from .seating import SeatRing
+
+UNDO_DEPTH = 32
+
 
 class Mode(str, Enum):
     SETUP = "setup"
@@ -48,12 +53,32 @@ class TurnRuntime:
     warn_count: int = 0
 
 
+@dataclass(frozen=True, slots=True)
+class TurnSnapshot:
+    """Immutable record of one TURN_END, kept for multi-level undo.
+
+    Only the ending player's bank is stored; the bank they started the turn
+    with is ``bank_after + spent_no_cooldown``.
+    """
+
+    player: str
+    bank_after: float
+    spent_no_cooldown: float
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> TurnSnapshot:
+        return self
+
+    @property
+    def bank_before(self) -> float:
+        return self.bank_after + self.spent_no_cooldown
+
+
 @dataclass(slots=True)
 class GameState:
     game_id: str = ""
     mode: Mode = Mode.SETUP
     players: list[PlayerConfig] = field(default_factory=list)
-    order: list[str] = field(default_factory=list)
+    order: SeatRing = field(default_factory=SeatRing)
     order_dir: OrderDir = OrderDir.CLOCKWISE
     rules: Rules = field(default_factory=Rules)
     bank: dict[str, float] = field(default_factory=dict)
@@ -62,6 +87,7 @@ class GameState:
     admin_mode: bool = False
     game_started: bool = False
     last_turn_end: dict[str, Any] | None = None
+    undo_ring: deque[TurnSnapshot] = field(default_factory=lambda: deque(maxlen=UNDO_DEPTH))
 
     def player_names(self) -> list[str]:
         return [player.name for player in self.players]
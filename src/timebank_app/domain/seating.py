@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator
+from typing import Any
+
+
+class SeatRing:
+    """Seating order as a doubly linked ring keyed by player name.
+
+    ``next``/``prev``, membership, ``remove`` and ``rename`` are O(1); iteration
+    walks the ring from the first seat, so the ring still compares equal to and
+    iterates like the list of names it replaces. ``deepcopy`` is O(1) too: copies
+    share the link tables until one of them is edited.
+    """
+
+    __slots__ = ("_next", "_prev", "_first", "_shared", "_names")
+
+    def __init__(self, names: Iterable[str] = ()):
+        ordered = tuple(dict.fromkeys(names))
+        rotated = ordered[1:] + ordered[:1]
+        self._next: dict[str, str] = dict(zip(ordered, rotated, strict=True))
+        self._prev: dict[str, str] = dict(zip(rotated, ordered, strict=True))
+        self._first: str | None = ordered[0] if ordered else None
+        self._shared = False
+        self._names: tuple[str, ...] | None = ordered
+
+    def __len__(self) -> int:
+        return len(self._next)
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._next
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.names())
+
+    def __getitem__(self, index: int) -> str:
+        if index == 0 and self._first is not None:
+            return self._first
+        return self.names()[index]
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, SeatRing):
+            return self.names() == other.names()
+        if isinstance(other, (list, tuple)):
+            return list(self.names()) == list(other)
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"SeatRing({list(self.names())!r})"
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> SeatRing:
+        clone = SeatRing.__new__(SeatRing)
+        clone._next = self._next
+        clone._prev = self._prev
+        clone._first = self._first
+        clone._names = self._names
+        clone._shared = self._shared = True
+        return clone
+
+    def names(self) -> tuple[str, ...]:
+        """Seats from the first one, cached until the next edit."""
+        if self._names is None:
+            seats: list[str] = []
+            name = self._first
+            for _ in range(len(self._next)):
+                assert name is not None
+                seats.append(name)
+                name = self._next[name]
+            self._names = tuple(seats)
+        return self._names
+
+    def first(self) -> str | None:
+        return self._first
+
+    def next(self, name: str) -> str:
+        return self._next[name]
+
+    def prev(self, name: str) -> str:
+        return self._prev[name]
+
+    def _own(self) -> None:
+        if self._shared:
+            self._next = dict(self._next)
+            self._prev = dict(self._prev)
+            self._shared = False
+        self._names = None
+
+    def remove(self, name: str) -> None:
+        if name not in self._next:
+            raise KeyError(name)
+        self._own()
+        after = self._next.pop(name)
+        before = self._prev.pop(name)
+        if after == name:
+            self._first = None
+            return
+        self._next[before] = after
+        self._prev[after] = before
+        if self._first == name:
+            self._first = after
+
+    def rename(self, old: str, new: str) -> None:
+        """Give seat ``old`` to ``new``; an existing ``new`` seat is dropped first."""
+        if old not in self._next or old == new:
+            return
+        if new in self._next:
+            self.remove(new)
+        self._own()
+        after = self._next.pop(old)
+        before = self._prev.pop(old)
+        if after == old:
+            after = before = new
+        self._next[new] = after
+        self._prev[new] = before
+        self._next[before] = new
+        self._prev[after] = new
+        if self._first == old:
+            self._first = new
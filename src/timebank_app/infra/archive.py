@@ -0,0 +1,224 @@
+from __future__ import annotations
+
+import argparse
+import gzip
+import json
+import lzma
+import struct
+import zlib
+from collections.abc import Callable, Iterable, Iterator
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+
+from timebank_app.infra.logging import line_key
+
+ARCHIVE_SUFFIX = ".tba"
+ARCHIVE_MAGIC = b"TBARCH1\n"
+FOOTER = struct.Struct("<Q8s")
+FOOTER_MAGIC = b"TBINDEX\n"
+DEFAULT_BLOCK_BYTES = 256 * 1024
+
+CODECS: dict[str, tuple[Callable[[bytes], bytes], Callable[[bytes], bytes]]] = {
+    "lzma": (lambda data: lzma.compress(data, preset=6), lzma.decompress),
+    "zlib": (lambda data: zlib.compress(data, 9), zlib.decompress),
+    "gzip": (lambda data: gzip.compress(data, 9, mtime=0), gzip.decompress),
+}
+
+
+class ArchiveError(ValueError):
+    """Raised when a file is not a readable log archive."""
+
+
+@dataclass(slots=True)
+class ArchiveBlock:
+    offset: int
+    length: int
+    lines: int
+    first_seq: int
+    last_seq: int
+    games: list[str] = field(default_factory=list)
+
+    def covers(self, game_id: str | None, seq_from: int | None, seq_to: int | None) -> bool:
+        if game_id is not None and game_id not in self.games:
+            return False
+        if seq_from is not None and self.last_seq < seq_from:
+            return False
+        return seq_to is None or self.first_seq <= seq_to
+
+
+class _BlockBuilder:
+    def __init__(self) -> None:
+        self.chunks: list[bytes] = []
+        self.size = 0
+        self.first_seq = 0
+        self.last_seq = 0
+        self.games: dict[str, None] = {}
+
+    def add(self, raw: bytes, seq: int, game_id: str) -> None:
+        if not self.chunks:
+            self.first_seq = self.last_seq = seq
+        self.first_seq = min(self.first_seq, seq)
+        self.last_seq = max(self.last_seq, seq)
+        self.games.setdefault(game_id, None)
+        self.chunks.append(raw)
+        self.size += len(raw)
+
+
+def write_archive(
+    lines: Iterable[str],
+    path: Path,
+    *,
+    codec: str = "lzma",
+    block_bytes: int = DEFAULT_BLOCK_BYTES,
+) -> list[ArchiveBlock]:
+    """Write log lines as independently compressed blocks plus a block index.
+
+    Layout: magic, compressed blocks back to back, a JSON index and a fixed
+    footer pointing at the index, so readers seek straight to the index and
+    then only to the blocks a query needs.
+    """
+    if codec not in CODECS:
+        raise ArchiveError(f"Unknown codec {codec!r}")
+    compress = CODECS[codec][0]
+    blocks: list[ArchiveBlock] = []
+    tmp_path = path.with_name(path.name + ".tmp")
+
+    with tmp_path.open("wb") as out:
+        out.write(ARCHIVE_MAGIC)
+        builder = _BlockBuilder()
+
+        def flush() -> None:
+            nonlocal builder
+            if not builder.chunks:
+                return
+            payload = compress(b"".join(builder.chunks))
+            blocks.append(
+                ArchiveBlock(
+                    offset=out.tell(),
+                    length=len(payload),
+                    lines=len(builder.chunks),
+                    first_seq=builder.first_seq,
+                    last_seq=builder.last_seq,
+                    games=list(builder.games),
+                )
+            )
+            out.write(payload)
+            builder = _BlockBuilder()
+
+        for line in lines:
+            key = line_key(line)
+            if key is None:
+                continue
+            text = line if line.endswith("\n") else line + "\n"
+            builder.add(text.encode("utf-8"), *key)
+            if builder.size >= block_bytes:
+                flush()
+        flush()
+
+        index_offset = out.tell()
+        index = {"version": 1, "codec": codec, "blocks": [asdict(block) for block in blocks]}
+        out.write(json.dumps(index, separators=(",", ":")).encode("utf-8"))
+        out.write(FOOTER.pack(index_offset, FOOTER_MAGIC))
+    tmp_path.replace(path)
+    return blocks
+
+
+def archive_log(
+    log_path: Path,
+    archive_path: Path,
+    *,
+    codec: str = "lzma",
+    block_bytes: int = DEFAULT_BLOCK_BYTES,
+) -> list[ArchiveBlock]:
+    with log_path.open(encoding="utf-8") as handle:
+        return write_archive(handle, archive_path, codec=codec, block_bytes=block_bytes)
+
+
+class ArchiveReader:
+    """Random access into an archive: only blocks matching a query are inflated."""
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.blocks_read = 0
+        with path.open("rb") as handle:
+            if handle.read(len(ARCHIVE_MAGIC)) != ARCHIVE_MAGIC:
+                raise ArchiveError(f"{path} is not a log archive")
+            handle.seek(-FOOTER.size, 2)
+            index_offset, magic = FOOTER.unpack(handle.read(FOOTER.size))
+            if magic != FOOTER_MAGIC:
+                raise ArchiveError(f"{path} has no block index")
+            end = handle.tell() - FOOTER.size
+            handle.seek(index_offset)
+            index = json.loads(handle.read(end - index_offset))
+        self.codec: str = index["codec"]
+        self.blocks = [ArchiveBlock(**item) for item in index["blocks"]]
+        self._decompress = CODECS[self.codec][1]
+
+    def games(self) -> list[str]:
+        seen: dict[str, None] = {}
+        for block in self.blocks:
+            for game_id in block.games:
+                seen.setdefault(game_id, None)
+        return list(seen)
+
+    def blocks_for(
+        self,
+        game_id: str | None = None,
+        seq_from: int | None = None,
+        seq_to: int | None = None,
+    ) -> list[ArchiveBlock]:
+        return [block for block in self.blocks if block.covers(game_id, seq_from, seq_to)]
+
+    def iter_lines(
+        self,
+        game_id: str | None = None,
+        seq_from: int | None = None,
+        seq_to: int | None = None,
+    ) -> Iterator[str]:
+        """Lines of the matching blocks, filtered down to the exact query."""
+        filtered = game_id is not None or seq_from is not None or seq_to is not None
+        with self.path.open("rb") as handle:
+            for block in self.blocks_for(game_id, seq_from, seq_to):
+                handle.seek(block.offset)
+                self.blocks_read += 1
+                text = self._decompress(handle.read(block.length)).decode("utf-8")
+                for body in text.split("\n")[:-1]:
+                    line = body + "\n"
+                    if filtered:
+                        key = line_key(line)
+                        if key is None:
+                            continue
+                        seq, owner = key
+                        if game_id is not None and owner != game_id:
+                            continue
+                        if seq_from is not None and seq < seq_from:
+                            continue
+                        if seq_to is not None and seq > seq_to:
+                            continue
+                    yield line
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Archive a log into compressed blocks")
+    parser.add_argument("source", type=Path)
+    parser.add_argument("archive", type=Path, nargs="?")
+    parser.add_argument("--codec", choices=sorted(CODECS), default="lzma")
+    parser.add_argument("--block-kib", type=int, default=DEFAULT_BLOCK_BYTES // 1024)
+    parser.add_argument("--game", help="print one game from an existing archive")
+    args = parser.parse_args(argv)
+
+    if args.game is not None:
+        reader = ArchiveReader(args.source)
+        for line in reader.iter_lines(game_id=args.game):
+            print(line, end="")
+        return 0
+
+    target = args.archive or args.source.with_suffix(ARCHIVE_SUFFIX)
+    blocks = archive_log(args.source, target, codec=args.codec, block_bytes=args.block_kib * 1024)
+    ratio = target.stat().st_size / max(1, args.source.stat().st_size)
+    print(f"{target}: blocks={len(blocks)} ratio={ratio:.3f}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
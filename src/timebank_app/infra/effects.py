@@ -1,8 +1,13 @@
 from __future__ import annotations
 
+import random
+import threading
+from collections.abc import Iterable
 from dataclasses import dataclass, field
 from pathlib import Path
 
+RANDOM_SOUND = "__random__"
+
 
 @dataclass(slots=True)
 class EffectSink:
@@ -27,11 +32,20 @@ class EffectSink:
 class SoundRepo:
     def __init__(self, sound_dir: Path):
         self.sound_dir = sound_dir
+        self._listing: tuple[int, list[str]] | None = None
 
     def list_files(self) -> list[str]:
-        if not self.sound_dir.exists() or not self.sound_dir.is_dir():
+        """Sound file names; the directory is rescanned only when its mtime changes."""
+        try:
+            stat = self.sound_dir.stat()
+        except (FileNotFoundError, NotADirectoryError):
+            return []
+        if not self.sound_dir.is_dir():
             return []
-        return sorted(path.name for path in self.sound_dir.iterdir() if path.is_file())
+        if self._listing is None or self._listing[0] != stat.st_mtime_ns:
+            names = sorted(path.name for path in self.sound_dir.iterdir() if path.is_file())
+            self._listing = (stat.st_mtime_ns, names)
+        return list(self._listing[1])
 
     def resolve(self, file_name: str) -> Path | None:
         if not file_name:
@@ -40,3 +54,135 @@ class SoundRepo:
         if candidate.exists() and candidate.is_file():
             return candidate
         return None
+
+
+@dataclass(frozen=True, slots=True)
+class KeepAwake:
+    enabled: bool
+
+
+@dataclass(frozen=True, slots=True)
+class TapFeedback:
+    sound_name: str
+
+
+@dataclass(frozen=True, slots=True)
+class WarnSound:
+    sound_name: str
+
+
+Effect = KeepAwake | TapFeedback | WarnSound
+
+
+def coalesce(effects: list[Effect]) -> list[Effect]:
+    """Drop effects that a later one in the same batch makes pointless.
+
+    Only the last keep-awake toggle matters, and a run of identical warn sounds
+    (e.g. warnings that piled up while the app was in the background) plays once.
+    Tap feedback is never merged.
+    """
+    last_keep = -1
+    for index, effect in enumerate(effects):
+        if isinstance(effect, KeepAwake):
+            last_keep = index
+    kept: list[Effect] = []
+    for index, effect in enumerate(effects):
+        if isinstance(effect, KeepAwake) and index != last_keep:
+            continue
+        if isinstance(effect, WarnSound) and kept and kept[-1] == effect:
+            continue
+        kept.append(effect)
+    return kept
+
+
+class EffectWorker:
+    """Runs effect intents against an ``EffectSink``.
+
+    With ``threaded=False`` each submitted batch is performed immediately, which
+    keeps tests and tools deterministic. With ``threaded=True`` batches are
+    queued and a daemon thread performs them, coalescing whatever piled up
+    since it last woke; ``drain`` waits until the queue is empty.
+    """
+
+    def __init__(self, sink: EffectSink, sound_repo: SoundRepo, *, threaded: bool = False):
+        self.sink = sink
+        self.sound_repo = sound_repo
+        self.threaded = threaded
+        self.performed = 0
+        self.coalesced = 0
+        self._pending: list[Effect] = []
+        self._busy = False
+        self._closed = False
+        self._keep_awake: bool | None = None
+        self._cond = threading.Condition()
+        self._thread: threading.Thread | None = None
+
+    def submit(self, effects: Iterable[Effect]) -> None:
+        batch = list(effects)
+        if not batch:
+            return
+        if not self.threaded:
+            self._perform_all(batch)
+            return
+        with self._cond:
+            self._pending.extend(batch)
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._loop, name="effects-worker", daemon=True
+                )
+                self._thread.start()
+            self._cond.notify_all()
+
+    def drain(self, timeout: float | None = None) -> bool:
+        with self._cond:
+            return self._cond.wait_for(lambda: not self._pending and not self._busy, timeout)
+
+    def close(self) -> None:
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _loop(self) -> None:
+        while True:
+            with self._cond:
+                self._cond.wait_for(lambda: self._pending or self._closed)
+                if not self._pending:
+                    return
+                batch, self._pending = self._pending, []
+                self._busy = True
+            try:
+                self._perform_all(batch)
+            finally:
+                with self._cond:
+                    self._busy = False
+                    self._cond.notify_all()
+
+    def _perform_all(self, batch: list[Effect]) -> None:
+        kept = coalesce(batch)
+        self.coalesced += len(batch) - len(kept)
+        for effect in kept:
+            try:
+                self._perform(effect)
+            except Exception as exc:
+                # A failing sink (e.g. a closed page) must not stop later effects
+                # or, when threaded, kill the worker with effects still queued.
+                self.sink.errors.append(str(exc) or type(exc).__name__)
+            self.performed += 1
+
+    def _perform(self, effect: Effect) -> None:
+        if isinstance(effect, KeepAwake):
+            if effect.enabled != self._keep_awake:
+                self.sink.set_keep_awake(effect.enabled)
+                self._keep_awake = effect.enabled
+        elif isinstance(effect, TapFeedback):
+            sound_name = effect.sound_name
+            if sound_name == RANDOM_SOUND:
+                files = self.sound_repo.list_files()
+                sound_name = random.choice(files) if files else ""
+            self.sink.play_sound(self.sound_repo.resolve(sound_name))
+            self.sink.vibrate()
+        else:
+            self.sink.play_sound(self.sound_repo.resolve(effect.sound_name))
@@ -0,0 +1,241 @@
+"""Event store backends behind ``GameController``."""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any, Protocol
+
+from timebank_app.domain.events import Event
+from timebank_app.infra.logging import LineEncoder, StampClock, owner_game_id
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS events (
+    seq INTEGER PRIMARY KEY,
+    stamp TEXT NOT NULL,
+    game_id TEXT NOT NULL,
+    event_type TEXT NOT NULL,
+    player TEXT,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS events_game ON events (game_id, seq);
+CREATE INDEX IF NOT EXISTS events_type ON events (event_type, player, stamp);
+"""
+
+
+class EventStore(Protocol):
+    seq: int
+
+    def append_batch(
+        self, batch: Sequence[tuple[str, Event]], *, lines: bool = True
+    ) -> list[str]: ...
+
+    def flush(self) -> None: ...
+
+    def close(self) -> None: ...
+
+
+@dataclass(frozen=True, slots=True)
+class StoredEvent:
+    seq: int
+    stamp: str
+    game_id: str
+    event: Event
+
+
+def stamp_bound(value: datetime) -> str:
+    """``value`` in the stamp format, so time windows compare as strings."""
+    return value.astimezone(UTC).isoformat(timespec="milliseconds")
+
+
+def _pack(data: dict[str, Any]) -> tuple[str | None, str]:
+    """Player column and compact JSON for the rest of ``data``."""
+    player = data.get("player")
+    if isinstance(player, str):
+        data = {key: value for key, value in data.items() if key != "player"}
+    else:
+        player = None
+    return player, json.dumps(data, separators=(",", ":"), ensure_ascii=False, default=str)
+
+
+def _unpack(player: str | None, text: str) -> dict[str, Any]:
+    data = json.loads(text)
+    if player is not None:
+        data["player"] = player
+    return data
+
+
+def _select(
+    *,
+    game_id: str | None = None,
+    event_types: Iterable[str] | None = None,
+    player: str | None = None,
+    since: datetime | None = None,
+    until: datetime | None = None,
+    limit: int | None = None,
+) -> tuple[str, list[Any]]:
+    where = []
+    params: list[Any] = []
+    if game_id is not None:
+        where.append("game_id = ?")
+        params.append(game_id)
+    if event_types is not None:
+        types = list(event_types)
+        where.append(f"event_type IN ({','.join('?' * len(types))})")
+        params += types
+    if player is not None:
+        where.append("player = ?")
+        params.append(player)
+    if since is not None:
+        where.append("stamp >= ?")
+        params.append(stamp_bound(since))
+    if until is not None:
+        where.append("stamp < ?")
+        params.append(stamp_bound(until))
+    sql = "SELECT seq, stamp, game_id, event_type, player, data FROM events"
+    if where:
+        sql += " WHERE " + " AND ".join(where)
+    sql += " ORDER BY seq"
+    if limit is not None:
+        sql += " LIMIT ?"
+        params.append(limit)
+    return sql, params
+
+
+class MemoryEventStore:
+    """Keeps every event in a list; for benchmarks and tests."""
+
+    def __init__(self) -> None:
+        self.seq = 0
+        self.last_game_id = ""
+        self.events: list[StoredEvent] = []
+        self.encoder = LineEncoder()
+        self.stamps = StampClock()
+
+    def append(self, game_id: str, event: Event) -> str:
+        return self.append_batch([(game_id, event)])[0]
+
+    def append_batch(self, batch: Sequence[tuple[str, Event]], *, lines: bool = True) -> list[str]:
+        stamp = self.stamps()
+        encoded = []
+        for game_id, event in batch:
+            self.seq += 1
+            if lines:
+                encoded.append(self.encoder.encode(stamp, self.seq, game_id, event))
+            self.last_game_id = owner_game_id(game_id, event)
+            self.events.append(StoredEvent(self.seq, stamp, self.last_game_id, event))
+        return encoded
+
+    def query(
+        self,
+        *,
+        game_id: str | None = None,
+        event_types: Iterable[str] | None = None,
+        player: str | None = None,
+        since: datetime | None = None,
+        until: datetime | None = None,
+        limit: int | None = None,
+    ) -> list[StoredEvent]:
+        types = None if event_types is None else set(event_types)
+        low = None if since is None else stamp_bound(since)
+        high = None if until is None else stamp_bound(until)
+        found = []
+        for item in self.events:
+            if (
+                (game_id is None or item.game_id == game_id)
+                and (types is None or item.event.event_type in types)
+                and (player is None or item.event.data.get("player") == player)
+                and (low is None or item.stamp >= low)
+                and (high is None or item.stamp < high)
+            ):
+                found.append(item)
+                if limit is not None and len(found) >= limit:
+                    break
+        return found
+
+    def flush(self) -> None:
+        pass
+
+    def close(self) -> None:
+        pass
+
+
+class SqliteEventStore:
+    """Events in an SQLite database in WAL mode, one transaction per batch.
+
+    ``game_id`` is the game an event belongs to (a ``GAME_START`` belongs to
+    the game it starts). The player is its own column, and the rest of the
+    payload is compact JSON. Lookups by game, by event type, player and time
+    window are served from indexes.
+    """
+
+    def __init__(self, path: Path, *, synchronous: str = "NORMAL"):
+        self.path = path
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(f"PRAGMA synchronous={synchronous}")
+        self._conn.executescript(SCHEMA)
+        row = self._conn.execute(
+            "SELECT seq, game_id FROM events ORDER BY seq DESC LIMIT 1"
+        ).fetchone()
+        self.seq, self.last_game_id = row if row else (0, "")
+        self.encoder = LineEncoder()
+        self.stamps = StampClock()
+
+    def append(self, game_id: str, event: Event) -> str:
+        return self.append_batch([(game_id, event)])[0]
+
+    def append_batch(self, batch: Sequence[tuple[str, Event]], *, lines: bool = True) -> list[str]:
+        stamp = self.stamps()
+        encoded = []
+        rows = []
+        seq = self.seq
+        for game_id, event in batch:
+            seq += 1
+            if lines:
+                encoded.append(self.encoder.encode(stamp, seq, game_id, event))
+            player, data = _pack(event.data)
+            owner = owner_game_id(game_id, event)
+            rows.append((seq, stamp, owner, event.event_type, player, data))
+        if not rows:
+            return encoded
+        conn = self._conn
+        conn.execute("BEGIN")
+        try:
+            conn.executemany("INSERT INTO events VALUES (?, ?, ?, ?, ?, ?)", rows)
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+        self.seq = seq
+        self.last_game_id = rows[-1][2]
+        return encoded
+
+    def query(self, **filters: Any) -> list[StoredEvent]:
+        """Matching events in SEQ order.
+
+        Filters are ``game_id``, ``event_types``, ``player``, ``since`` and
+        ``until`` (exclusive), and ``limit``, as for ``MemoryEventStore.query``.
+        """
+        sql, params = _select(**filters)
+        return [
+            StoredEvent(seq, stamp, game, Event(event_type, _unpack(player, data)))
+            for seq, stamp, game, event_type, player, data in self._conn.execute(sql, params)
+        ]
+
+    def query_plan(self, **filters: Any) -> str:
+        """SQLite's plan for ``query(**filters)``, to check which index it uses."""
+        sql, params = _select(**filters)
+        rows = self._conn.execute("EXPLAIN QUERY PLAN " + sql, params).fetchall()
+        return "; ".join(str(row[-1]) for row in rows)
+
+    def flush(self) -> None:
+        self._conn.execute("PRAGMA wal_checkpoint(PASSIVE)")
+
+    def close(self) -> None:
+        self._conn.close()
@@ -0,0 +1,234 @@
+from __future__ import annotations
+
+import os
+import threading
+import time
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+from pathlib import Path
+from typing import BinaryIO
+
+from timebank_app.infra.log_reader import LogRecord, iter_log_lines
+from timebank_app.infra.logging import line_key
+from timebank_app.infra.storage import atomic_write_text
+
+MIN_SLEEP = 0.02
+MAX_SLEEP = 1.0
+READ_LIMIT = 1 << 20
+TAIL_BYTES = 64 * 1024
+
+
+@dataclass(slots=True)
+class FollowPosition:
+    """Where a follower stopped: byte offset, last SEQ and the file it was in."""
+
+    offset: int = 0
+    seq: int = 0
+    inode: int = 0
+
+    def to_text(self) -> str:
+        return f"{self.offset} {self.seq} {self.inode}\n"
+
+    @classmethod
+    def from_text(cls, text: str) -> FollowPosition:
+        offset, seq, inode = (int(part) for part in text.split())
+        return cls(offset, seq, inode)
+
+
+class LogFollower:
+    """Tail ``events.log`` and hand out records as soon as their line is complete.
+
+    Each ``poll`` costs one ``stat`` when nothing was appended and reads only
+    the new bytes otherwise (at most ``read_limit`` per call), so many
+    followers can watch one writer. A partial last line is left for the next
+    poll. When the path points at a new file
+    (rotation, ``compact_log``) or the file shrank, reading restarts from the
+    top and records up to the last seen SEQ are skipped; if the new file never
+    gets that far its SEQ numbering restarted and everything in it is new.
+
+    With ``checkpoint`` the position is saved at most every
+    ``checkpoint_interval`` seconds and on ``close``, and a restarted follower
+    resumes where it stopped. Only records the consumer has finished with are
+    saved: those handed out before the next ``poll`` (or before ``follow``
+    asks for more), or before an explicit ``commit``. A crash while handling a
+    batch replays that batch on restart.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        *,
+        checkpoint: Path | None = None,
+        checkpoint_interval: float = 1.0,
+        event_types: Iterable[str] | None = None,
+        min_sleep: float = MIN_SLEEP,
+        max_sleep: float = MAX_SLEEP,
+        read_limit: int = READ_LIMIT,
+    ):
+        self.path = path
+        self.checkpoint = checkpoint
+        self.checkpoint_interval = checkpoint_interval
+        self.event_types = None if event_types is None else frozenset(event_types)
+        self.min_sleep = min_sleep
+        self.max_sleep = max_sleep
+        self.position = FollowPosition()
+        self.reopens = 0
+        self.reads = 0
+        self.read_limit = read_limit
+        self._handle: BinaryIO | None = None
+        self._skip_to: int | None = None
+        self._saved = self.position.to_text()
+        self._saved_at = 0.0
+        self._taken = self._saved
+        if checkpoint is not None:
+            try:
+                self.position = FollowPosition.from_text(checkpoint.read_text(encoding="utf-8"))
+            except (FileNotFoundError, ValueError):
+                pass
+            self._saved = self._taken = self.position.to_text()
+
+    def _open(self) -> os.stat_result | None:
+        """Open the current file; returns its stat, or ``None`` when it is missing."""
+        try:
+            handle = self.path.open("rb")
+        except FileNotFoundError:
+            return None
+        self.close_file()
+        self._handle = handle
+        return os.fstat(handle.fileno())
+
+    def _resumable(self, handle: BinaryIO, size: int) -> bool:
+        offset = self.position.offset
+        if offset == 0:
+            return True
+        if offset > size:
+            return False
+        handle.seek(offset - 1)
+        return handle.read(1) == b"\n"
+
+    def _restart(self, handle: BinaryIO, size: int) -> None:
+        """Read a replaced or rewritten file from the top without repeating records."""
+        self.reopens += 1
+        self.position.offset = 0
+        handle.seek(max(0, size - TAIL_BYTES))
+        tail = handle.read().split(b"\n")
+        tail_seq = 0
+        for raw in reversed(tail[1:-1] if size > TAIL_BYTES else tail[:-1]):
+            key = line_key(raw.decode("utf-8", errors="replace"))
+            if key is not None:
+                tail_seq = key[0]
+                break
+        # A file that does not reach the last seen SEQ started its numbering over.
+        self._skip_to = self.position.seq if tail_seq >= self.position.seq else None
+
+    def poll(self) -> list[LogRecord]:
+        """Records appended since the last call (possibly none).
+
+        Calling it again means the records returned last time were handled,
+        so they are committed first.
+        """
+        self.commit()
+        return self._poll()
+
+    def _poll(self) -> list[LogRecord]:
+        position = self.position
+        if self._handle is None:
+            stat = self._open()
+            if stat is None:
+                return []
+            assert self._handle is not None
+            known = position.inode != 0 or position.offset != 0
+            if stat.st_ino != position.inode or not self._resumable(self._handle, stat.st_size):
+                if known:
+                    self._restart(self._handle, stat.st_size)
+                position.offset = 0
+            position.inode = stat.st_ino
+        else:
+            try:
+                stat = os.stat(self.path)
+            except FileNotFoundError:
+                # Mid-rotation: finish the old file, pick up the new one next time.
+                return self._read(self._handle)
+            if stat.st_ino != position.inode:
+                records = self._read(self._handle)
+                self.close_file()
+                return records + self._poll()
+            if stat.st_size < position.offset:
+                self._restart(self._handle, stat.st_size)
+            elif stat.st_size == position.offset:
+                return []
+        return self._read(self._handle)
+
+    def _read(self, handle: BinaryIO) -> list[LogRecord]:
+        position = self.position
+        handle.seek(position.offset)
+        chunk = handle.read(self.read_limit)
+        end = chunk.rfind(b"\n") + 1
+        if end == 0:
+            if len(chunk) < self.read_limit:
+                return []
+            # One line longer than the limit: take it whole.
+            chunk += handle.readline()
+            end = chunk.rfind(b"\n") + 1
+            if end == 0:
+                return []
+        self.reads += 1
+        position.offset += end
+        lines = chunk[:end].decode("utf-8", errors="replace").splitlines()
+        records = list(iter_log_lines(lines))
+        if self._skip_to is not None and records:
+            skip_to = self._skip_to
+            if records[-1].seq > skip_to:
+                self._skip_to = None
+            records = [record for record in records if record.seq > skip_to]
+        if records:
+            position.seq = records[-1].seq
+        if self.event_types is not None:
+            records = [record for record in records if record.event_type in self.event_types]
+        return records
+
+    def commit(self) -> None:
+        """Mark everything handed out so far as handled and save it when due."""
+        self._taken = self.position.to_text()
+        self._maybe_save()
+
+    def _maybe_save(self, force: bool = False) -> None:
+        if self.checkpoint is None:
+            return
+        text = self._taken
+        if text == self._saved:
+            return
+        now = time.monotonic()
+        if force or now - self._saved_at >= self.checkpoint_interval:
+            atomic_write_text(self.checkpoint, text)
+            self._saved = text
+            self._saved_at = now
+
+    def follow(self, stop: threading.Event | None = None) -> Iterator[LogRecord]:
+        """Yield records forever (or until ``stop`` is set), sleeping between polls.
+
+        The sleep doubles from ``min_sleep`` up to ``max_sleep`` while the log
+        is idle and drops back as soon as something arrives.
+        """
+        stop = stop or threading.Event()
+        delay = self.min_sleep
+        while not stop.is_set():
+            offset = self.position.offset
+            records = self.poll()
+            if records or self.position.offset != offset:
+                delay = self.min_sleep
+                yield from records
+                continue
+            stop.wait(delay)
+            delay = min(self.max_sleep, delay * 2)
+
+    def close_file(self) -> None:
+        if self._handle is not None:
+            self._handle.close()
+            self._handle = None
+
+    def close(self) -> None:
+        """Commit what was handed out, save the checkpoint and close the file."""
+        self._taken = self.position.to_text()
+        self._maybe_save(force=True)
+        self.close_file()
@@ -0,0 +1,195 @@
+from __future__ import annotations
+
+import ast
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass, field, fields
+from pathlib import Path
+from typing import Any
+
+from timebank_app.domain.events import Event
+from timebank_app.domain.models import Rules
+from timebank_app.infra.archive import ARCHIVE_SUFFIX, ArchiveReader
+from timebank_app.infra.logging import line_key
+
+LOG_HEADER = "LOG_FORMAT v=1"
+
+FLOAT_FIELDS = frozenset(
+    {"now_mono", "bank_after", "spent_no_cooldown", "elapsed_no_cooldown", "phase_started_mono"}
+)
+INT_FIELDS = frozenset({"warn_no", "warn_count"})
+RULE_TYPES = {item.name: {"float": float, "int": int}.get(item.type, str) for item in fields(Rules)}
+PAYLOAD_TYPES: dict[str, dict[str, Any]] = {
+    "reorder": {"new_order": ast.literal_eval},
+    "set_bank": {"value": float},
+    "set_rules": RULE_TYPES,
+    "undo": {"steps": int},
+}
+
+
+@dataclass(slots=True)
+class LogRecord:
+    stamp: str
+    seq: int
+    game_id: str
+    event_type: str
+    fields: dict[str, str] = field(default_factory=dict)
+
+
+def _split_quoted(text: str) -> list[str]:
+    tokens: list[str] = []
+    current: list[str] = []
+    quoted = False
+    for char in text:
+        if char == '"':
+            quoted = not quoted
+        elif char == " " and not quoted:
+            if current:
+                tokens.append("".join(current))
+                current = []
+        else:
+            current.append(char)
+    if current:
+        tokens.append("".join(current))
+    return tokens
+
+
+def parse_log_line(line: str) -> LogRecord | None:
+    """Parse one ``LOG_FORMAT v=1`` line; returns ``None`` for headers and junk."""
+    parts = line.rstrip("\n").split(" ", 4)
+    if len(parts) < 4:
+        return None
+    stamp, seq_part, game_part, event_part = parts[:4]
+    if not (
+        seq_part.startswith("SEQ=")
+        and game_part.startswith("G=")
+        and event_part.startswith("EVENT=")
+    ):
+        return None
+    try:
+        seq = int(seq_part[4:])
+    except ValueError:
+        return None
+
+    game_id = game_part[2:]
+    fields: dict[str, str] = {}
+    if len(parts) == 5:
+        rest = parts[4]
+        tokens = _split_quoted(rest) if '"' in rest else rest.split()
+        for token in tokens:
+            key, _, value = token.partition("=")
+            fields[key] = value
+
+    return LogRecord(
+        stamp=stamp,
+        seq=seq,
+        game_id="" if game_id == "-" else game_id,
+        event_type=event_part[6:],
+        fields=fields,
+    )
+
+
+def _wanted(line: str, markers: tuple[str, ...]) -> bool:
+    for marker in markers:
+        pos = line.find(marker)
+        if pos >= 0:
+            end = pos + len(marker)
+            if end == len(line) or line[end] in " \n":
+                return True
+    return False
+
+
+def iter_log_lines(
+    lines: Iterable[str], *, event_types: Iterable[str] | None = None
+) -> Iterator[LogRecord]:
+    markers = None if event_types is None else tuple(f" EVENT={name}" for name in event_types)
+    for line in lines:
+        if markers is not None and not _wanted(line, markers):
+            continue
+        record = parse_log_line(line)
+        if record is not None:
+            yield record
+
+
+def iter_log_records(
+    path: Path,
+    *,
+    event_types: Iterable[str] | None = None,
+    game_id: str | None = None,
+) -> Iterator[LogRecord]:
+    """Stream parsed records from a log file or a block archive.
+
+    With ``event_types`` lines of other types are skipped by a substring check
+    before any parsing, which is what makes single-type scans cheap. For
+    archives (``ARCHIVE_SUFFIX``) only blocks holding ``game_id`` are inflated.
+    """
+    if path.suffix == ARCHIVE_SUFFIX:
+        lines = ArchiveReader(path).iter_lines(game_id=game_id)
+        yield from iter_log_lines(lines, event_types=event_types)
+        return
+    with path.open(encoding="utf-8") as handle:
+        lines: Iterable[str] = handle
+        if game_id is not None:
+            lines = (line for line in handle if (key := line_key(line)) and key[1] == game_id)
+        yield from iter_log_lines(lines, event_types=event_types)
+
+
+def _split_top_level(text: str) -> list[str]:
+    """Split ``a:1,b:['x', 'y']`` on commas that are not inside brackets or quotes."""
+    items: list[str] = []
+    depth = 0
+    quote = ""
+    start = 0
+    for pos, char in enumerate(text):
+        if quote:
+            if char == quote:
+                quote = ""
+        elif char in "'\"":
+            quote = char
+        elif char in "[{(":
+            depth += 1
+        elif char in "]})":
+            depth -= 1
+        elif char == "," and depth == 0:
+            items.append(text[start:pos])
+            start = pos + 1
+    items.append(text[start:])
+    return [item for item in items if item]
+
+
+def _decode_payload(edit_type: str, raw: str) -> dict[str, Any]:
+    types = PAYLOAD_TYPES.get(edit_type, {})
+    payload: dict[str, Any] = {}
+    for item in _split_top_level(raw):
+        key, _, value = item.partition(":")
+        convert = types.get(key, str)
+        payload[key] = convert(value)
+    return payload
+
+
+def decode_event(record: LogRecord) -> Event:
+    """Rebuild the domain ``Event`` written by ``LogWriter`` for ``record``.
+
+    The text format is lossy for names that contain commas or colons; every
+    other value round-trips exactly (floats are written with ``repr``).
+    """
+    data: dict[str, Any] = {}
+    event_type = record.event_type
+    for key, value in record.fields.items():
+        if key in FLOAT_FIELDS:
+            data[key] = float(value)
+        elif key in INT_FIELDS:
+            data[key] = int(value)
+        elif event_type == "GAME_START" and key == "order":
+            data[key] = [name for name in value.split(",") if name]
+        elif event_type == "GAME_START" and key == "rules":
+            data[key] = {
+                name: RULE_TYPES.get(name, str)(raw)
+                for name, _, raw in (item.partition(":") for item in _split_top_level(value))
+            }
+        elif event_type == "GAME_START" and key == "players":
+            data[key] = list(ast.literal_eval(f"[{value}]"))
+        elif key == "payload" and event_type in {"SETUP_EDIT", "ADMIN_EDIT"}:
+            data[key] = _decode_payload(record.fields.get("edit_type", ""), value)
+        else:
+            data[key] = value
+    return Event(event_type=event_type, data=data)
@@ -1,39 +1,346 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+import os
+from collections.abc import Callable, Iterator, Sequence
+from contextlib import contextmanager
+from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from pathlib import Path
+from typing import Any
 
 from timebank_app.domain.events import Event
+from timebank_app.infra.clock import Clock, SystemClock
+
+try:
+    import fcntl
+except ImportError:  # no advisory locks on Windows
+    fcntl = None
+
+TAIL_BLOCK = 4096
+STAMP_RESYNC = 60.0
+STAMP_HOLD = 1.0
+
+LayoutEncoder = Callable[[str, int, str, dict[str, Any]], str]
+# Exact types whose f-string formatting already equals ``_format_value``.
+_PLAIN = frozenset({int, float, bool, type(None)})
 
 
 @dataclass(slots=True)
 class LogWriter:
+    """Append-only ``LOG_FORMAT v=1`` writer whose SEQ keeps growing across launches.
+
+    On start the last SEQ and game id are taken from a tiny ``.seq`` sidecar
+    when it still matches the log size, otherwise from the last complete line,
+    found by reading the file backwards in ``TAIL_BLOCK`` chunks. Either way
+    startup cost does not depend on the log size. Each batch is written under
+    a shared ``LogLock``, so ``compact_log`` can swap the file in between.
+    """
+
     path: Path
     seq: int = 0
+    last_game_id: str = ""
+    sidecar_every: int = 256
+    recovered_from: str = "new"
+    encoder: LineEncoder = field(default_factory=lambda: LineEncoder(), repr=False)
+    stamps: StampClock = field(default_factory=lambda: StampClock(), repr=False)
+    _since_sidecar: int = field(default=0, repr=False)
+    _lock: LogLock = field(init=False, repr=False)
 
     def __post_init__(self) -> None:
         self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = LogLock(self.path)
         if not self.path.exists():
             self.path.write_text("LOG_FORMAT v=1\n", encoding="utf-8")
+        elif self.seq == 0:
+            self._recover()
+
+    @property
+    def sidecar_path(self) -> Path:
+        return self.path.with_name(self.path.name + ".seq")
+
+    def _recover(self) -> None:
+        size = self.path.stat().st_size
+        if self._recover_from_sidecar(size):
+            self.recovered_from = "sidecar"
+            return
+        self._recover_from_tail(size)
+        self.recovered_from = "tail"
+
+    def _recover_from_sidecar(self, size: int) -> bool:
+        try:
+            seq_text, size_text, *game = self.sidecar_path.read_text(encoding="utf-8").split()
+            if int(size_text) != size:
+                return False
+            self.seq = int(seq_text)
+        except (FileNotFoundError, ValueError):
+            return False
+        self.last_game_id = game[0] if game else ""
+        return True
+
+    def _recover_from_tail(self, size: int) -> None:
+        partial = 0
+        with self.path.open("rb+") as handle:
+            if size:
+                handle.seek(size - 1)
+                if handle.read(1) != b"\n":
+                    # A crash mid-append left a partial line; terminate it so the
+                    # next event starts on its own line, and do not trust its SEQ.
+                    handle.write(b"\n")
+                    size += 1
+                    partial = 1
+
+            tail = b""
+            position = size
+            while position > 0:
+                step = min(TAIL_BLOCK, position)
+                position -= step
+                handle.seek(position)
+                tail = handle.read(step) + tail
+                lines = tail.split(b"\n")
+                # The first piece may be cut mid-line unless we reached the start.
+                candidates = lines if position == 0 else lines[1:]
+                for raw in reversed(candidates):
+                    if partial and raw:
+                        partial = 0
+                        continue
+                    key = line_key(raw.decode("utf-8", errors="replace"))
+                    if key is not None:
+                        self.seq, self.last_game_id = key
+                        return
+                tail = lines[0]
+
+    def write_sidecar(self, size: int | None = None) -> None:
+        if size is None:
+            size = self.path.stat().st_size
+        self.sidecar_path.write_text(f"{self.seq} {size} {self.last_game_id}\n", encoding="utf-8")
+        self._since_sidecar = 0
+
+    def close(self) -> None:
+        self.write_sidecar()
+        self._lock.close()
+
+    def flush(self) -> None:
+        self.write_sidecar()
 
     def append(self, game_id: str, event: Event) -> str:
-        self.seq += 1
-        stamp = datetime.now(tz=UTC).isoformat(timespec="milliseconds")
-        pairs = " ".join(f"{key}={self._safe(value)}" for key, value in sorted(event.data.items()))
-        line = (
-            f"{stamp} SEQ={self.seq} G={game_id or '-'} EVENT={event.event_type} {pairs}".rstrip()
+        return self.append_batch([(game_id, event)])[0]
+
+    def append_batch(self, batch: Sequence[tuple[str, Event]], *, lines: bool = True) -> list[str]:
+        """Write ``(game_id, event)`` pairs with one open and one write.
+
+        Returns the lines, or an empty list when ``lines`` is false.
+        """
+        if not batch:
+            return []
+        stamp = self.stamps()
+        encode = self.encoder.encode
+        seq = self.seq
+        encoded = []
+        for game_id, event in batch:
+            seq += 1
+            encoded.append(encode(stamp, seq, game_id, event))
+        self.seq = seq
+        with self._lock.hold(), self.path.open("a", encoding="utf-8") as handle:
+            handle.write("\n".join(encoded) + "\n")
+            handle.flush()
+            size = handle.tell()
+        if batch:
+            self.last_game_id = owner_game_id(*batch[-1])
+        self._since_sidecar += len(batch)
+        if self._since_sidecar >= self.sidecar_every:
+            self.write_sidecar(size)
+        return encoded if lines else []
+
+
+class LogLock:
+    """Advisory lock on ``path.lock``: writers share it, a rewrite takes it alone.
+
+    The lock file stays open between uses so a batch pays two ``flock`` calls.
+    Where ``fcntl`` is missing this does nothing, and a log must not be
+    rewritten while a writer is running.
+    """
+
+    __slots__ = ("path", "_fd")
+
+    def __init__(self, log_path: Path):
+        self.path = log_path.with_name(log_path.name + ".lock")
+        self._fd: int | None = None
+
+    @contextmanager
+    def hold(self, *, exclusive: bool = False) -> Iterator[None]:
+        if fcntl is None:
+            yield
+            return
+        if self._fd is None:
+            self._fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+        fcntl.flock(self._fd, fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+        try:
+            yield
+        finally:
+            fcntl.flock(self._fd, fcntl.LOCK_UN)
+
+    def close(self) -> None:
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+
+
+class StampClock:
+    """UTC log stamps with millisecond precision, cheap to take once per dispatch.
+
+    Wall time is ``clock.time()`` at an anchor plus the monotonic time since,
+    re-anchored every ``resync`` seconds. A wall clock that stepped back by
+    at most ``STAMP_HOLD`` seconds is absorbed so stamps stay monotonic; a
+    larger step is taken as is rather than holding stamps until wall time
+    catches up. The text is rebuilt only when the millisecond changes (the
+    date part only when the second does). The output matches ``utc_stamp``.
+    """
+
+    __slots__ = (
+        "_monotonic",
+        "_time",
+        "_resync",
+        "_mono",
+        "_wall",
+        "_ms",
+        "_second",
+        "_prefix",
+        "_stamp",
+    )
+
+    def __init__(self, clock: Clock | None = None, *, resync: float = STAMP_RESYNC):
+        clock = clock or SystemClock()
+        self._monotonic = clock.monotonic
+        self._time = clock.time
+        self._resync = resync
+        self._mono = -float("inf")
+        self._wall = 0.0
+        self._ms = -1
+        self._second = -1
+        self._prefix = ""
+        self._stamp = ""
+
+    def __call__(self) -> str:
+        mono = self._monotonic()
+        if mono - self._mono >= self._resync:
+            wall = self._time()
+            behind = self._ms / 1000 - wall
+            if behind > STAMP_HOLD:
+                self._ms = -1
+            elif behind > 0:
+                wall += behind
+            self._mono = mono
+            self._wall = wall
+        ms = int((self._wall + (mono - self._mono)) * 1000)
+        if ms <= self._ms:
+            return self._stamp
+        self._ms = ms
+        second, millis = divmod(ms, 1000)
+        if second != self._second:
+            self._second = second
+            moment = datetime.fromtimestamp(second, tz=UTC)
+            self._prefix = moment.strftime("%Y-%m-%dT%H:%M:%S")
+        self._stamp = f"{self._prefix}.{millis:03d}+00:00"
+        return self._stamp
+
+
+class LineEncoder:
+    """``format_line`` with the per-event work done once per layout.
+
+    A layout is an event type plus the keys of its payload in insertion order,
+    which is fixed at each ``ev(...)`` call site. Each layout is compiled into
+    a function with the keys pre-sorted into a single f-string; numbers, bools
+    and ``None`` are formatted inline and only strings and containers go
+    through ``_format_value``. The output is byte-identical to ``format_line``.
+    """
+
+    __slots__ = ("_layouts",)
+
+    def __init__(self) -> None:
+        self._layouts: dict[tuple[str, tuple[str, ...]], LayoutEncoder] = {}
+
+    def encode(self, stamp: str, seq: int, game_id: str, event: Event) -> str:
+        data = event.data
+        layout = (event.event_type, tuple(data))
+        encode = self._layouts.get(layout) or self._compile(*layout)
+        return encode(stamp, seq, game_id, data)
+
+    def _compile(self, event_type: str, keys: tuple[str, ...]) -> LayoutEncoder:
+        # Keys and the event type are passed in as globals, never spliced into
+        # the source, so any text is safe.
+        namespace: dict[str, Any] = {
+            "_PLAIN": _PLAIN,
+            "_format": _format_value,
+            "_head": f" EVENT={event_type}",
+        }
+        loads = []
+        parts = ["{stamp} SEQ={seq} G={game_id or '-'}{_head}"]
+        for index, key in enumerate(sorted(keys)):
+            namespace[f"_k{index}"] = key
+            namespace[f"_l{index}"] = f" {key}="
+            loads.append(f"    v{index} = data[_k{index}]\n")
+            value = f"v{index} if type(v{index}) in _PLAIN else _format(v{index})"
+            parts.append(f"{{_l{index}}}{{{value}}}")
+        source = (
+            "def encode(stamp, seq, game_id, data):\n"
+            + "".join(loads)
+            + f'    return f"{"".join(parts)}".rstrip()\n'
         )
-        with self.path.open("a", encoding="utf-8") as handle:
-            handle.write(line + "\n")
-        return line
-
-    @staticmethod
-    def _safe(value: object) -> str:
-        if isinstance(value, list):
-            return '"' + ",".join(str(item) for item in value) + '"'
-        if isinstance(value, dict):
-            packed = ",".join(f"{key}:{val}" for key, val in sorted(value.items()))
-            return '"' + packed + '"'
-        text = str(value)
-        return f'"{text}"' if " " in text else text
+        exec(source, namespace)
+        encode = self._layouts[(event_type, keys)] = namespace["encode"]
+        return encode
+
+
+def utc_stamp() -> str:
+    return datetime.now(tz=UTC).isoformat(timespec="milliseconds")
+
+
+def line_key(line: str) -> tuple[int, str] | None:
+    """SEQ and owning game of a log line, without parsing the payload.
+
+    ``GAME_START`` is logged before the game id is set, so its owner comes from
+    the ``game_id=`` field instead of ``G=``.
+    """
+    parts = line.split(" ", 4)
+    if len(parts) < 4 or not parts[1].startswith("SEQ=") or not parts[2].startswith("G="):
+        return None
+    try:
+        seq = int(parts[1][4:])
+    except ValueError:
+        return None
+    game_id = parts[2][2:]
+    if parts[3] == "EVENT=GAME_START" and len(parts) == 5:
+        for token in parts[4].split(" "):
+            if token.startswith("game_id="):
+                game_id = token[8:]
+                break
+    return seq, "" if game_id == "-" else game_id
+
+
+def owner_game_id(game_id: str, event: Event) -> str:
+    """Game a logged event belongs to; same rule as ``line_key``."""
+    if event.event_type == "GAME_START":
+        return str(event.data.get("game_id", game_id))
+    return game_id
+
+
+def new_game_id(event: Event) -> str | None:
+    """Game that starts after ``event`` when it is a ``new_game`` admin edit."""
+    if event.event_type == "ADMIN_EDIT" and event.data["edit_type"] == "new_game":
+        return str(event.data["payload"]["game_id"])
+    return None
+
+
+def format_line(stamp: str, seq: int, game_id: str, event: Event) -> str:
+    pairs = " ".join(f"{key}={_format_value(value)}" for key, value in sorted(event.data.items()))
+    return f"{stamp} SEQ={seq} G={game_id or '-'} EVENT={event.event_type} {pairs}".rstrip()
+
+
+def _format_value(value: object) -> str:
+    if isinstance(value, list):
+        return '"' + ",".join(str(item) for item in value) + '"'
+    if isinstance(value, dict):
+        packed = ",".join(f"{key}:{val}" for key, val in sorted(value.items()))
+        return '"' + packed + '"'
+    text = str(value)
+    return f'"{text}"' if " " in text else text
@@ -0,0 +1,258 @@
+"""Live table state in shared memory for read-only spectator displays."""
+
+from __future__ import annotations
+
+import struct
+import sys
+import time
+from dataclasses import dataclass
+from functools import lru_cache
+from multiprocessing import resource_tracker, shared_memory
+
+from timebank_app.domain.models import GameState, Mode, TurnPhase
+
+SPECTATOR_LAYOUT = 1
+DEFAULT_CAPACITY = 256
+NAME_BYTES = 40
+NO_PLAYER = 0xFFFF
+
+# version, layout, capacity, name bytes, seats, current seat, mode, phase,
+# then phase_started_mono, turn_started_mono and cooldown.
+_HEAD = struct.Struct("<QHHHHHBBxxxxddd")
+_VERSION = struct.Struct("<Q")
+_MODES = list(Mode)
+_PHASES = list(TurnPhase)
+_MODE_IDS = {value: index for index, value in enumerate(_MODES)}
+_PHASE_IDS = {value: index for index, value in enumerate(_PHASES)}
+
+
+class SpectatorError(RuntimeError):
+    """Raised when a spectator block is missing, foreign or never settles."""
+
+
+@lru_cache(maxsize=64)
+def _seats(count: int, name_bytes: int) -> struct.Struct:
+    return struct.Struct("<" + f"{name_bytes}sd" * count)
+
+
+def _fit(name: str, name_bytes: int) -> bytes:
+    """``name`` as UTF-8, cut to ``name_bytes`` on a character boundary."""
+    raw = name.encode("utf-8")
+    if len(raw) <= name_bytes:
+        return raw
+    return raw[:name_bytes].decode("utf-8", errors="ignore").encode("utf-8")
+
+
+@dataclass(frozen=True, slots=True)
+class LiveSnapshot:
+    version: int
+    mode: Mode
+    phase: TurnPhase
+    current_player: str | None
+    phase_started_mono: float
+    turn_started_mono: float
+    cooldown: float
+    order: tuple[str, ...]
+    banks: tuple[float, ...]
+
+    def bank_at(self, name: str, now_mono: float) -> float:
+        """Bank of ``name`` at ``now_mono``, counting down the running turn.
+
+        ``time.monotonic`` is system-wide, so spectators extrapolate between
+        publishes with their own clock.
+        """
+        bank = self.banks[self.order.index(name)]
+        if self.mode != Mode.RUNNING or name != self.current_player:
+            return bank
+        started = self.phase_started_mono
+        if self.phase == TurnPhase.COOLDOWN:
+            started += self.cooldown
+        return bank - max(0.0, now_mono - started)
+
+
+class SpectatorPublisher:
+    """Writer side; pass it to ``GameController.add_state_listener``.
+
+    Seats beyond ``capacity`` are not published, and names are cut to
+    ``name_bytes`` bytes of UTF-8.
+    """
+
+    def __init__(
+        self,
+        name: str | None = None,
+        *,
+        capacity: int = DEFAULT_CAPACITY,
+        name_bytes: int = NAME_BYTES,
+    ):
+        self.capacity = capacity
+        self.name_bytes = name_bytes
+        size = _HEAD.size + _seats(1, name_bytes).size * capacity
+        self._shm = shared_memory.SharedMemory(name=name, create=True, size=size)
+        self._buf = self._shm.buf
+        self.version = 0
+        self.publishes = 0
+        self._names: tuple[str, ...] = ()
+        self._encoded: tuple[bytes, ...] = ()
+        self._write(GameState())
+
+    @property
+    def name(self) -> str:
+        return self._shm.name
+
+    def __call__(self, state: GameState) -> None:
+        self.publish(state)
+
+    def publish(self, state: GameState) -> None:
+        self._write(state)
+        self.publishes += 1
+
+    def _write(self, state: GameState) -> None:
+        names = state.order.names()
+        if names is not self._names:
+            # Names only change on start and admin edits; encode them once.
+            self._names = names
+            self._encoded = tuple(_fit(name, self.name_bytes) for name in names)
+        encoded = self._encoded[: self.capacity]
+        bank = state.bank
+        seats: list = []
+        for name, raw in zip(names, encoded, strict=False):
+            seats += (raw, bank.get(name, 0.0))
+        current = state.current_player
+        current_seat = NO_PLAYER
+        if current is not None and current in state.order:
+            index = names.index(current)
+            current_seat = index if index < len(encoded) else NO_PLAYER
+
+        turn = state.turn
+        buf = self._buf
+        # Seqlock: the version is odd while writing, and readers retry until
+        # they see the same even version before and after their read.
+        _VERSION.pack_into(buf, 0, self.version + 1)
+        _HEAD.pack_into(
+            buf,
+            0,
+            self.version + 1,
+            SPECTATOR_LAYOUT,
+            self.capacity,
+            self.name_bytes,
+            len(encoded),
+            current_seat,
+            _MODE_IDS[state.mode],
+            _PHASE_IDS[turn.phase],
+            turn.phase_started_mono,
+            turn.turn_started_mono,
+            state.rules.cooldown,
+        )
+        _seats(len(encoded), self.name_bytes).pack_into(buf, _HEAD.size, *seats)
+        self.version += 2
+        _VERSION.pack_into(buf, 0, self.version)
+
+    def close(self, unlink: bool = True) -> None:
+        self._buf = None
+        self._shm.close()
+        if unlink:
+            self._shm.unlink()
+
+
+def _attach(name: str) -> shared_memory.SharedMemory:
+    """Open an existing block without handing it to the resource tracker.
+
+    A tracked block is unlinked when the attaching process exits, which would
+    pull it from under the game and every other spectator. ``track=False`` is
+    only available from Python 3.13; before that registration is skipped.
+    """
+    if sys.version_info >= (3, 13):
+        return shared_memory.SharedMemory(name=name, track=False)
+    register = resource_tracker.register
+    resource_tracker.register = lambda *args: None
+    try:
+        return shared_memory.SharedMemory(name=name)
+    finally:
+        resource_tracker.register = register
+
+
+class SpectatorView:
+    """Reader side: attaches to a publisher's block by name."""
+
+    def __init__(self, name: str):
+        try:
+            self._shm = _attach(name)
+        except FileNotFoundError as exc:
+            raise SpectatorError(f"No spectator block named {name!r}") from exc
+        self._buf = self._shm.buf
+        layout = _HEAD.unpack_from(self._buf)[1]
+        if layout != SPECTATOR_LAYOUT:
+            self.close()
+            raise SpectatorError(f"Unsupported spectator layout {layout}")
+
+    @property
+    def version(self) -> int:
+        """Cheap change check: renderers can skip frames while it stays the same."""
+        return _VERSION.unpack_from(self._buf)[0]
+
+    def read(self, attempts: int = 10_000) -> LiveSnapshot:
+        buf = self._buf
+        for _ in range(attempts):
+            (
+                version,
+                _layout,
+                capacity,
+                name_bytes,
+                count,
+                current,
+                mode,
+                phase,
+                phase_started,
+                turn_started,
+                cooldown,
+            ) = _HEAD.unpack_from(buf)
+            if version & 1 or count > capacity:
+                time.sleep(0)
+                continue
+            seats = _seats(count, name_bytes).unpack_from(buf, _HEAD.size)
+            if _VERSION.unpack_from(buf)[0] != version:
+                time.sleep(0)
+                continue
+            order = tuple(raw.rstrip(b"\0").decode("utf-8") for raw in seats[::2])
+            return LiveSnapshot(
+                version=version,
+                mode=_MODES[mode],
+                phase=_PHASES[phase],
+                current_player=None if current == NO_PLAYER else order[current],
+                phase_started_mono=phase_started,
+                turn_started_mono=turn_started,
+                cooldown=cooldown,
+                order=order,
+                banks=seats[1::2],
+            )
+        raise SpectatorError("Spectator block kept changing during the read")
+
+    def close(self) -> None:
+        self._buf = None
+        self._shm.close()
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = sys.argv[1:] if argv is None else argv
+    if len(args) != 1:
+        print("usage: python -m timebank_app.infra.spectator NAME", file=sys.stderr)
+        return 2
+    view = SpectatorView(args[0])
+    try:
+        while True:
+            live = view.read()
+            now = time.monotonic()
+            board = "  ".join(
+                f"{'>' if name == live.current_player else ' '}{name} {live.bank_at(name, now):.0f}"
+                for name in live.order
+            )
+            print(f"[{live.mode.value}] {board}", flush=True)
+            time.sleep(1.0)
+    except KeyboardInterrupt:
+        return 0
+    finally:
+        view.close()
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,263 @@
+from __future__ import annotations
+
+import math
+import struct
+from collections import deque
+from functools import lru_cache
+
+from timebank_app.domain.models import (
+    GameState,
+    Mode,
+    OrderDir,
+    PlayerConfig,
+    Rules,
+    TurnPhase,
+    TurnRuntime,
+    TurnSnapshot,
+)
+from timebank_app.domain.seating import SeatRing
+
+CODEC_MAGIC = b"TBS"
+CODEC_VERSION = 2
+NONE_ID = 0xFFFF
+
+# magic, version, string-blob length, then the counts that size the body.
+_HEAD = struct.Struct("<3sBIHHHHH")
+_MODES = list(Mode)
+_DIRS = list(OrderDir)
+_PHASES = list(TurnPhase)
+_MODE_IDS = {value: index for index, value in enumerate(_MODES)}
+_DIR_IDS = {value: index for index, value in enumerate(_DIRS)}
+_PHASE_IDS = {value: index for index, value in enumerate(_PHASES)}
+_ADMIN, _STARTED, _LAST_TURN = 1, 2, 4
+
+
+class SnapshotError(ValueError):
+    """Raised when bytes are not a snapshot this codec can read."""
+
+
+@lru_cache(maxsize=256)
+def _body(players: int, order: int, banks: int, snaps: int) -> struct.Struct:
+    """Struct for one state shape; shapes repeat, so each is compiled once."""
+    return struct.Struct(
+        "<BBBBHH"  # mode, order_dir, phase, flags, game_id, current_player
+        "ddqHdd"  # rules
+        "dddq"  # turn runtime
+        "Hddd"  # last_turn_end: player, bank_after, spent, now_mono
+        + "HHHH" * players
+        + "H" * order
+        + "Hd" * banks
+        + "H"  # undo ring maxlen
+        + "Hdd" * snaps  # player, bank_after, spent
+    )
+
+
+def encode_state(state: GameState, *, undo: bool = True) -> bytes:
+    """Pack ``state`` into the versioned binary snapshot format.
+
+    Every string (names, colours, sounds, ids) is stored once in a NUL-separated
+    blob and referenced by a 16-bit index; numbers are fixed-width little-endian.
+    With ``undo=False`` the undo history is left out (spectators do not need it).
+    """
+    strings: dict[str, int] = {}
+    intern = strings.setdefault
+    rules = state.rules
+    turn = state.turn
+    last = state.last_turn_end
+    current = state.current_player
+    flags = (
+        (_ADMIN if state.admin_mode else 0)
+        | (_STARTED if state.game_started else 0)
+        | (_LAST_TURN if last else 0)
+    )
+    values: list = [
+        _MODE_IDS[state.mode],
+        _DIR_IDS[state.order_dir],
+        _PHASE_IDS[turn.phase],
+        flags,
+        intern(state.game_id, len(strings)),
+        NONE_ID if current is None else intern(current, len(strings)),
+        rules.bank_initial,
+        rules.cooldown,
+        rules.warn_every,
+        intern(rules.warn_sound, len(strings)),
+        rules.blink_min_hz,
+        rules.blink_max_hz,
+        turn.turn_started_mono,
+        turn.phase_started_mono,
+        turn.elapsed_no_cooldown,
+        turn.warn_count,
+    ]
+    if last:
+        values += (
+            intern(last["player"], len(strings)),
+            last["bank_after"],
+            last.get("spent_no_cooldown", 0.0),
+            last.get("now_mono", math.nan),
+        )
+    else:
+        values += (NONE_ID, 0.0, 0.0, math.nan)
+    for player in state.players:
+        values += (
+            intern(player.name, len(strings)),
+            intern(player.color, len(strings)),
+            intern(player.sound_tap, len(strings)),
+            intern(player.sound_warn, len(strings)),
+        )
+    values += [intern(name, len(strings)) for name in state.order]
+    for name, bank in state.bank.items():
+        values += (intern(name, len(strings)), bank)
+
+    ring = state.undo_ring if undo else ()
+    values.append(state.undo_ring.maxlen or 0)
+    for snap in ring:
+        values += (intern(snap.player, len(strings)), snap.bank_after, snap.spent_no_cooldown)
+
+    if len(strings) >= NONE_ID:
+        raise SnapshotError("Too many distinct strings for a snapshot")
+    text = "\0".join(strings)
+    if text.count("\0") != max(0, len(strings) - 1):
+        raise SnapshotError("Strings with NUL characters cannot be encoded")
+    blob = text.encode("utf-8")
+    n_players = len(state.players)
+    n_order = len(state.order)
+    n_banks = len(state.bank)
+    n_snaps = len(ring)
+    body = _body(n_players, n_order, n_banks, n_snaps)
+    head = _HEAD.pack(
+        CODEC_MAGIC,
+        CODEC_VERSION,
+        len(blob),
+        len(strings),
+        n_players,
+        n_order,
+        n_banks,
+        n_snaps,
+    )
+    return b"".join((head, blob, body.pack(*values)))
+
+
+def decode_state(data: bytes) -> GameState:
+    """Rebuild a ``GameState`` from ``encode_state`` output; raises ``SnapshotError``."""
+    try:
+        (
+            magic,
+            version,
+            blob_len,
+            n_strings,
+            n_players,
+            n_order,
+            n_banks,
+            n_snaps,
+        ) = _HEAD.unpack_from(data)
+    except struct.error as exc:
+        raise SnapshotError("Snapshot is truncated") from exc
+    if magic != CODEC_MAGIC:
+        raise SnapshotError("Not a GameState snapshot")
+    if version != CODEC_VERSION:
+        raise SnapshotError(f"Unsupported snapshot version {version}")
+
+    # Every count sizes a fixed-width field, so check them all against the
+    # input before building a format string or allocating anything.
+    offset = _HEAD.size
+    least = 2 * (4 * n_players + n_order) + 10 * n_banks + 18 * n_snaps
+    if offset + blob_len + least > len(data):
+        raise SnapshotError("Snapshot is truncated")
+    try:
+        blob = data[offset : offset + blob_len].decode("utf-8")
+    except UnicodeDecodeError as exc:
+        raise SnapshotError("Snapshot string table is corrupt") from exc
+    strings = blob.split("\0") if n_strings else []
+    if len(strings) != n_strings:
+        raise SnapshotError("Snapshot string table is corrupt")
+    offset += blob_len
+    body = _body(n_players, n_order, n_banks, n_snaps)
+    try:
+        values = body.unpack_from(data, offset)
+    except struct.error as exc:
+        raise SnapshotError("Snapshot is truncated") from exc
+    try:
+        return _assemble(values, strings, n_players, n_order, n_banks)
+    except (IndexError, TypeError, ValueError) as exc:
+        raise SnapshotError("Snapshot is corrupt") from exc
+
+
+def _assemble(
+    values: tuple,
+    strings: list[str],
+    n_players: int,
+    n_order: int,
+    n_banks: int,
+) -> GameState:
+    (
+        mode,
+        order_dir,
+        phase,
+        flags,
+        game_id,
+        current,
+        bank_initial,
+        cooldown,
+        warn_every,
+        warn_sound,
+        blink_min,
+        blink_max,
+        turn_started,
+        phase_started,
+        elapsed,
+        warn_count,
+        last_player,
+        last_bank,
+        last_spent,
+        last_mono,
+    ) = values[:20]
+    pos = 20
+
+    end = pos + 4 * n_players
+    lookup = strings.__getitem__
+    names = list(map(lookup, values[pos:end]))
+    players = [PlayerConfig(*names[i : i + 4]) for i in range(0, len(names), 4)]
+    pos = end
+    order = SeatRing(map(lookup, values[pos : pos + n_order]))
+    pos += n_order
+    end = pos + 2 * n_banks
+    bank = dict(zip(map(lookup, values[pos:end:2]), values[pos + 1 : end : 2], strict=True))
+    pos = end
+
+    maxlen = values[pos] or None
+    pos += 1
+    ring: deque[TurnSnapshot] = deque(
+        map(
+            TurnSnapshot,
+            map(lookup, values[pos::3]),
+            values[pos + 1 :: 3],
+            values[pos + 2 :: 3],
+        ),
+        maxlen=maxlen,
+    )
+
+    last_turn_end = None
+    if flags & _LAST_TURN:
+        last_turn_end = {
+            "player": strings[last_player],
+            "bank_after": last_bank,
+            "spent_no_cooldown": last_spent,
+        }
+        if not math.isnan(last_mono):
+            last_turn_end["now_mono"] = last_mono
+
+    return GameState(
+        game_id=strings[game_id],
+        mode=_MODES[mode],
+        players=players,
+        order=order,
+        order_dir=_DIRS[order_dir],
+        rules=Rules(bank_initial, cooldown, warn_every, strings[warn_sound], blink_min, blink_max),
+        bank=bank,
+        current_player=None if current == NONE_ID else strings[current],
+        turn=TurnRuntime(turn_started, phase_started, _PHASES[phase], elapsed, warn_count),
+        admin_mode=bool(flags & _ADMIN),
+        game_started=bool(flags & _STARTED),
+        last_turn_end=last_turn_end,
+        undo_ring=ring,
+    )
@@ -1,67 +1,216 @@
 from __future__ import annotations
 
+import io
+import os
+import threading
+import time
 from configparser import ConfigParser
-from dataclasses import asdict
+from dataclasses import asdict, replace
 from pathlib import Path
 
 from timebank_app.domain.models import OrderDir, PlayerConfig, Rules
 
+Sections = dict[str, dict[str, str]]
+GAME_SECTIONS = ("meta", "game", "rules")
+PLAYER_PREFIX = "player:"
+
+
+def atomic_write_text(path: Path, text: str) -> None:
+    """Replace ``path`` with ``text`` so readers see either the old or new file."""
+    tmp_path = path.with_name(path.name + ".tmp")
+    with tmp_path.open("w", encoding="utf-8") as handle:
+        handle.write(text)
+        handle.flush()
+        os.fsync(handle.fileno())
+    os.replace(tmp_path, path)
+
+
+def _is_game_section(name: str) -> bool:
+    return name in GAME_SECTIONS or name.startswith(PLAYER_PREFIX)
+
 
 class ConfigStore:
-    def __init__(self, path: Path):
+    """ini-backed game config with dirty tracking, debounce and atomic writes.
+
+    ``save_game_config`` only records the wanted sections. They are written by
+    ``flush`` - immediately when ``debounce`` is 0, otherwise once the edits
+    have been quiet for ``debounce`` seconds - and only if a section actually
+    differs from what is on disk. Sections the store does not own are kept.
+
+    Reads are served from an in-memory copy that is revalidated by mtime and
+    size at most every ``check_interval`` seconds, so a hub with many table
+    configs does not reparse ini files on every load.
+    """
+
+    def __init__(self, path: Path, debounce: float = 0.0, check_interval: float = 1.0):
         self.path = path
         self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.debounce = debounce
+        self.check_interval = check_interval
+        self.writes = 0
+        self.parses = 0
+        self.last_dirty: set[str] = set()
+        self._lock = threading.RLock()
+        self._written: Sections | None = None
+        self._signature: tuple[int, int] | None = None
+        self._checked_at = 0.0
+        self._pending: Sections | None = None
+        self._timer: threading.Timer | None = None
+        self._model: dict | None = None
+        self._model_source: Sections | None = None
 
     def load(self) -> ConfigParser:
         parser = ConfigParser()
-        if self.path.exists():
-            parser.read(self.path, encoding="utf-8")
+        with self._lock:
+            sections = self._pending if self._pending is not None else self._disk_sections()
+        parser.read_dict(sections)
         return parser
 
-    def save_game_config(
-        self,
+    def _stat_signature(self) -> tuple[int, int] | None:
+        try:
+            stat = self.path.stat()
+        except FileNotFoundError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def _disk_sections(self) -> Sections:
+        """Sections as stored on disk, parsed only when the file has changed.
+
+        Within ``check_interval`` seconds of the last validation the cached
+        sections are returned without touching the disk; after that a single
+        ``stat`` (mtime + size) decides whether the file needs parsing again.
+        """
+        now = time.monotonic()
+        if self._written is not None and now - self._checked_at < self.check_interval:
+            return self._written
+        signature = self._stat_signature()
+        self._checked_at = now
+        if self._written is not None and signature == self._signature:
+            return self._written
+
+        parser = ConfigParser()
+        if signature is not None:
+            parser.read(self.path, encoding="utf-8")
+            self.parses += 1
+        self._written = {name: dict(parser[name]) for name in parser.sections()}
+        self._signature = signature
+        return self._written
+
+    @staticmethod
+    def game_sections(
         *,
         players: list[PlayerConfig],
         order: list[str],
         order_dir: OrderDir,
         rules: Rules,
-    ) -> None:
-        parser = self.load()
-        parser["meta"] = {"config_version": "2"}
-        parser["game"] = {
-            "order": ",".join(order),
-            "order_dir": order_dir.value,
+    ) -> Sections:
+        sections: Sections = {
+            "meta": {"config_version": "2"},
+            "game": {
+                "order": ",".join(order),
+                "order_dir": order_dir.value,
+            },
+            "rules": {key: str(value) for key, value in asdict(rules).items()},
         }
-        parser["rules"] = {key: str(value) for key, value in asdict(rules).items()}
-
-        for section in list(parser.sections()):
-            if section.startswith("player:"):
-                parser.remove_section(section)
-
         for player in players:
-            parser[f"player:{player.name}"] = {
+            sections[f"{PLAYER_PREFIX}{player.name}"] = {
                 "name": player.name,
                 "color": player.color,
                 "sound_tap": player.sound_tap,
                 "sound_warn": player.sound_warn,
             }
+        return sections
+
+    def save_game_config(
+        self,
+        *,
+        players: list[PlayerConfig],
+        order: list[str],
+        order_dir: OrderDir,
+        rules: Rules,
+    ) -> None:
+        wanted = self.game_sections(players=players, order=order, order_dir=order_dir, rules=rules)
+        with self._lock:
+            base = self._pending if self._pending is not None else self._disk_sections()
+            merged = {
+                name: dict(values) for name, values in base.items() if not _is_game_section(name)
+            }
+            merged.update(wanted)
+            self._pending = merged
+            if self.debounce <= 0:
+                self.flush()
+                return
+            if self._timer is not None:
+                self._timer.cancel()
+            self._timer = threading.Timer(self.debounce, self.flush)
+            self._timer.daemon = True
+            self._timer.start()
+
+    def flush(self) -> bool:
+        """Write pending edits now; returns whether the file was rewritten."""
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            pending, self._pending = self._pending, None
+            if pending is None:
+                return False
+            written = self._disk_sections()
+            dirty = {
+                name
+                for name in pending.keys() | written.keys()
+                if pending.get(name) != written.get(name)
+            }
+            self.last_dirty = dirty
+            if not dirty:
+                return False
+
+            parser = ConfigParser()
+            parser.read_dict(pending)
+            buffer = io.StringIO()
+            parser.write(buffer)
+            atomic_write_text(self.path, buffer.getvalue())
+            self._written = pending
+            self._signature = self._stat_signature()
+            self._checked_at = time.monotonic()
+            self.writes += 1
+            return True
 
-        with self.path.open("w", encoding="utf-8") as handle:
-            parser.write(handle)
+    def close(self) -> None:
+        self.flush()
 
     def load_game_config(self) -> dict | None:
-        parser = self.load()
+        """Typed config, served from memory until the sections behind it change."""
+        with self._lock:
+            sections = self._pending if self._pending is not None else self._disk_sections()
+            if sections is not self._model_source:
+                self._model = self._parse_game_config(sections)
+                self._model_source = sections
+            model = self._model
+        if model is None:
+            return None
+        return {
+            "players": [replace(player) for player in model["players"]],
+            "order": list(model["order"]),
+            "order_dir": model["order_dir"],
+            "rules": replace(model["rules"]),
+        }
+
+    @staticmethod
+    def _parse_game_config(sections: Sections) -> dict | None:
+        parser = ConfigParser()
+        parser.read_dict(sections)
         if "game" not in parser or "rules" not in parser:
             return None
 
         players: list[PlayerConfig] = []
         for section in parser.sections():
-            if not section.startswith("player:"):
+            if not section.startswith(PLAYER_PREFIX):
                 continue
             block = parser[section]
             players.append(
                 PlayerConfig(
-                    name=block.get("name", section.removeprefix("player:")),
+                    name=block.get("name", section.removeprefix(PLAYER_PREFIX)),
                     color=block.get("color", "#FFFFFF"),
                     sound_tap=block.get("sound_tap", ""),
                     sound_warn=block.get("sound_warn", ""),
@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+
+from timebank_app.domain.models import GameState, Mode, Rules, TurnPhase
+
+HALF_PULSE = 0.5
+BLINK_BANDS = 20
+MAX_TICK = 1.0
+WAKE_SLACK = 0.005
+
+
+def blink_hz(rules: Rules, bank: float, bands: int = BLINK_BANDS) -> float:
+    """Blink rate for ``bank``, quantised to ``bands`` steps of the spent fraction.
+
+    The rate only changes when the bank crosses a band edge, so the schedule
+    is not retuned on every tick.
+    """
+    if rules.bank_initial <= 0:
+        fraction = 0.0
+    else:
+        fraction = 1.0 - min(1.0, max(0.0, bank) / rules.bank_initial)
+    fraction = math.floor(fraction * bands) / bands
+    return rules.blink_min_hz + fraction * (rules.blink_max_hz - rules.blink_min_hz)
+
+
+@dataclass(frozen=True, slots=True)
+class BlinkSchedule:
+    """Square wave at ``hz`` whose phase is 0 at ``anchor`` (monotonic seconds).
+
+    The second half of every period is lit. ``next_toggle`` gives the exact
+    time of the next flip, so the UI can sleep until then instead of sampling
+    the wave on a fixed tick and missing flips at high rates.
+    """
+
+    hz: float = 0.0
+    anchor: float = 0.0
+
+    def phase(self, now: float) -> float:
+        return ((now - self.anchor) * self.hz) % 1.0
+
+    def lit(self, now: float) -> bool:
+        return self.phase(now) >= HALF_PULSE
+
+    def next_toggle(self, now: float) -> float:
+        if self.hz <= 0:
+            return math.inf
+        phase = self.phase(now)
+        edge = HALF_PULSE if phase < HALF_PULSE else 1.0
+        return now + (edge - phase) / self.hz
+
+    def retune(self, hz: float, now: float) -> BlinkSchedule:
+        """Same wave at a new rate, continuing from the current phase."""
+        if hz == self.hz:
+            return self
+        if hz <= 0:
+            return BlinkSchedule(0.0, now)
+        return BlinkSchedule(hz, now - self.phase(now) / hz)
+
+
+def next_tick_delay(state: GameState, now_mono: float) -> float:
+    """Seconds until the running game shows or decides something new.
+
+    That is the next whole second of the current bank on the timer, the end
+    of the cooldown or the next long-turn warning, capped at ``MAX_TICK``.
+    The state is assumed to be synced to ``now_mono`` by a tick.
+    """
+    current = state.current_player
+    if state.mode != Mode.RUNNING or current is None:
+        return MAX_TICK
+    turn = state.turn
+    if turn.phase == TurnPhase.COOLDOWN:
+        delay = turn.phase_started_mono + state.rules.cooldown - now_mono
+    else:
+        bank = state.bank.get(current, 0.0)
+        if bank > 0:
+            delay = bank - math.floor(bank)
+        else:
+            delay = math.ceil(-bank) + bank
+        delay = delay or 1.0
+        warn_every = max(1, state.rules.warn_every)
+        warn_at = (turn.warn_count + 1) * warn_every
+        delay = min(delay, warn_at - turn.elapsed_no_cooldown)
+    return min(MAX_TICK, max(0.0, delay))
@@ -1,9 +1,10 @@
 from __future__ import annotations
 
+import argparse
 import asyncio
+import functools
 import importlib
 import importlib.util
-import time
 from collections.abc import Callable
 from pathlib import Path
 from typing import Any
@@ -11,6 +12,7 @@ from typing import Any
 import flet as ft
 
 from timebank_app.app.controller import GameController
+from timebank_app.app.replay import ReplayDriver, parse_speed, replay_steps
 from timebank_app.domain.commands import (
     CmdAdminAuth,
     CmdAdminEdit,
@@ -23,22 +25,43 @@ from timebank_app.domain.commands import (
 )
 from timebank_app.domain.engine import CommandError, Decider
 from timebank_app.domain.models import Mode, OrderDir, PlayerConfig, Rules
+from timebank_app.infra.clock import Clock, SystemClock
 from timebank_app.infra.effects import EffectSink, SoundRepo
+from timebank_app.infra.event_store import EventStore, MemoryEventStore, SqliteEventStore
+from timebank_app.infra.log_reader import iter_log_records
 from timebank_app.infra.logging import LogWriter
+from timebank_app.infra.spectator import SpectatorPublisher
 from timebank_app.infra.storage import ConfigStore
+from timebank_app.ui.blink import WAKE_SLACK, BlinkSchedule, blink_hz, next_tick_delay
 from timebank_app.ui.formatting import format_mm_ss
+from timebank_app.ui.screens import KeyedControls, ScreenPool
+from timebank_app.ui.setup_rows import RowChange, SetupRowModel, sound_choices, visible_range
 
-HALF_PULSE = 0.5
+DARK = "#000000"
 PANEL_WIDTH = 960
 ADMIN_PASSWORD = "password"
+CONFIG_DEBOUNCE = 0.5
+SETUP_ROW_HEIGHT = 64
+SETUP_VIEWPORT = 420
+RECENT_TURNS = 10
 
 
-def create_controller(data_dir: Path) -> GameController:
+def create_event_store(data_dir: Path, kind: str = "log") -> EventStore:
+    if kind == "memory":
+        return MemoryEventStore()
+    if kind == "sqlite":
+        return SqliteEventStore(data_dir / "logs" / "events.sqlite3")
+    return LogWriter(data_dir / "logs" / "events.log")
+
+
+def create_controller(data_dir: Path, store: str = "log") -> GameController:
     return GameController(
         decider=Decider(ADMIN_PASSWORD),
-        log_writer=LogWriter(data_dir / "logs" / "events.log"),
+        log_writer=create_event_store(data_dir, store),
         effects=EffectSink(),
         sound_repo=SoundRepo(data_dir / "sounds"),
+        threaded_effects=True,
+        keep_log_lines=False,
     )
 
 
@@ -68,6 +91,10 @@ def _is_background_lifecycle_state(event_data: Any) -> bool:
     return any(keyword in text for keyword in ("pause", "inactive", "hide", "background"))
 
 
+def _is_exit_lifecycle_state(event_data: Any) -> bool:
+    return "detach" in str(event_data).lower()
+
+
 def _center_alignment() -> Any:
     alignment_module = getattr(ft, "alignment", None)
     if alignment_module is not None and hasattr(alignment_module, "center"):
@@ -121,21 +148,175 @@ def _dropdown(
     return control
 
 
-def run_flet_app() -> None:
+def _try_update(control: ft.Control) -> None:
+    try:
+        control.update()
+    except (AssertionError, RuntimeError):
+        # Not mounted yet; the next page.update() will send it.
+        pass
+
+
+class _SetupRowControls:
+    __slots__ = ("container", "index_text", "name_field", "preview", "sound_field", "bank_text")
+
+    def __init__(self, **controls: Any):
+        for name, control in controls.items():
+            setattr(self, name, control)
+
+
+class SetupListView:
+    """Virtualised setup table over a ``SetupRowModel``.
+
+    Only rows in the scrolled window (plus overscan) exist as Flet controls;
+    spacers stand in for the rest. Model edits patch the touched row, and
+    inserts/removals re-render just the window, so cost does not grow with the
+    number of players.
+    """
+
+    def __init__(
+        self,
+        model: SetupRowModel,
+        *,
+        sound_choices: Callable[[], tuple[tuple[str, str], ...]],
+        bank_label: Callable[[], str],
+        on_color: Callable[[int], None],
+        on_remove: Callable[[int], None],
+    ):
+        self.model = model
+        self.sound_choices = sound_choices
+        self.bank_label = bank_label
+        self.on_color = on_color
+        self.on_remove = on_remove
+        self.rows_built = 0
+        self._built: dict[int, _SetupRowControls] = {}
+        self._range = (0, 0)
+        self._offset = 0.0
+        self._top = ft.Container(height=0)
+        self._bottom = ft.Container(height=0)
+        self.view = ft.ListView(
+            controls=[self._top, self._bottom],
+            height=SETUP_VIEWPORT,
+            spacing=0,
+            on_scroll=self._on_scroll,
+        )
+        model.listeners.append(self._on_change)
+
+    def _build_row(self, key: int) -> _SetupRowControls:
+        player = self.model.row(key).player
+        name_field = ft.TextField(value=player.name, width=160)
+        sound_field = _dropdown(
+            options=[ft.dropdown.Option(value, label) for value, label in self.sound_choices()],
+            value=player.sound_tap,
+            width=180,
+        )
+        name_field.on_change = lambda event: self.model.update(
+            key, name=event.control.value.strip()
+        )
+        sound_field.on_change = lambda event: self.model.update(
+            key, sound_tap=event.control.value or ""
+        )
+        preview = ft.Container(width=26, height=26, bgcolor=player.color, border_radius=6)
+        index_text = ft.Text("", width=32)
+        bank_text = ft.Text(self.bank_label(), width=90)
+        container = ft.Container(
+            height=SETUP_ROW_HEIGHT,
+            content=ft.Row(
+                [
+                    index_text,
+                    name_field,
+                    ft.Row([preview, _button("Цвет", lambda _: self.on_color(key))]),
+                    sound_field,
+                    bank_text,
+                    _button("Удалить", lambda _: self.on_remove(key)),
+                ],
+                vertical_alignment=ft.CrossAxisAlignment.CENTER,
+            ),
+        )
+        self.rows_built += 1
+        return _SetupRowControls(
+            container=container,
+            index_text=index_text,
+            name_field=name_field,
+            preview=preview,
+            sound_field=sound_field,
+            bank_text=bank_text,
+        )
+
+    def render(self) -> None:
+        total = len(self.model)
+        start, stop = visible_range(self._offset, SETUP_VIEWPORT, SETUP_ROW_HEIGHT, total)
+        self._range = (start, stop)
+        visible: dict[int, _SetupRowControls] = {}
+        for index, row in self.model.window(start, stop):
+            controls = self._built.get(row.key) or self._build_row(row.key)
+            controls.index_text.value = str(index + 1)
+            visible[row.key] = controls
+        self._built = visible
+        self._top.height = start * SETUP_ROW_HEIGHT
+        self._bottom.height = (total - stop) * SETUP_ROW_HEIGHT
+        self.view.controls = [
+            self._top,
+            *(controls.container for controls in visible.values()),
+            self._bottom,
+        ]
+
+    def _on_scroll(self, event: Any) -> None:
+        self._offset = float(getattr(event, "pixels", 0.0) or 0.0)
+        total = len(self.model)
+        if visible_range(self._offset, SETUP_VIEWPORT, SETUP_ROW_HEIGHT, total) != self._range:
+            self.render()
+            _try_update(self.view)
+
+    def _on_change(self, change: RowChange) -> None:
+        if change.kind == "update":
+            controls = self._built.get(change.key)
+            if controls is None:
+                return
+            player = self.model.row(change.key).player
+            if controls.preview.bgcolor == player.color:
+                # Name and sound edits come from the row's own fields.
+                return
+            controls.preview.bgcolor = player.color
+            _try_update(controls.preview)
+            return
+        self.render()
+        _try_update(self.view)
+
+    def refresh_bank_labels(self) -> None:
+        label = self.bank_label()
+        for controls in self._built.values():
+            controls.bank_text.value = label
+
+
+def run_flet_app(target: Callable[[ft.Page], None] | None = None) -> None:
+    target = target or app_main
     run_fn = getattr(ft, "run", None)
     if callable(run_fn):
-        run_fn(app_main)
+        run_fn(target)
         return
 
     app_fn = getattr(ft, "app", None)
     if callable(app_fn):
-        app_fn(target=app_main)
+        app_fn(target=target)
         return
 
     raise RuntimeError("Flet module has no run() or app() entrypoint")
 
 
-def app_main(page: ft.Page) -> None:
+def app_main(
+    page: ft.Page,
+    clock: Clock | None = None,
+    replay_log: Path | None = None,
+    replay_speed: float = 1.0,
+    publish: str | None = None,
+    store: str = "log",
+) -> None:
+    """Build the app; with ``replay_log`` the logged games are played back read-only.
+
+    With ``publish`` the live state is also shared under that name for
+    spectator displays (see ``infra/spectator.py``). ``store`` picks the event
+    store: the text log or ``sqlite``.
+    """
     page.title = "Таймбанк ходов"
     page.vertical_alignment = ft.MainAxisAlignment.CENTER
     page.horizontal_alignment = ft.CrossAxisAlignment.CENTER
@@ -146,8 +327,21 @@ def app_main(page: ft.Page) -> None:
     data_dir.mkdir(exist_ok=True)
     (data_dir / "sounds").mkdir(exist_ok=True)
 
-    store = ConfigStore(data_dir / "config.ini")
-    controller = create_controller(data_dir)
+    config_store = ConfigStore(data_dir / "config.ini", debounce=CONFIG_DEBOUNCE)
+    # A replay must not append to the live log it may be reading.
+    controller = create_controller(data_dir, "memory" if replay_log is not None else store)
+    publisher = None
+    if publish:
+        publisher = SpectatorPublisher(publish)
+        controller.add_state_listener(publisher)
+    replay_driver = (
+        None
+        if replay_log is None
+        else ReplayDriver(controller, speed=replay_speed, on_step=lambda _: redraw_game())
+    )
+    if replay_driver is not None:
+        clock = replay_driver.clock
+    clock = clock or SystemClock()
     feedback = ft.Text(color=ft.Colors.RED_300)
     color_picker_parts = _load_color_picker_parts()
 
@@ -176,15 +370,17 @@ def app_main(page: ft.Page) -> None:
     )
 
     game_visible = False
-    setup_players = [
-        PlayerConfig(name="Alice", color="#FFC107"),
-        PlayerConfig(name="Bob", color="#03A9F4"),
-        PlayerConfig(name="Carol", color="#8BC34A"),
-    ]
+    setup_rows = SetupRowModel(
+        [
+            PlayerConfig(name="Alice", color="#FFC107"),
+            PlayerConfig(name="Bob", color="#03A9F4"),
+            PlayerConfig(name="Carol", color="#8BC34A"),
+        ]
+    )
 
-    saved = store.load_game_config()
+    saved = config_store.load_game_config()
     if saved:
-        setup_players = saved["players"]
+        setup_rows.reset(saved["players"])
         direction.value = saved["order_dir"].value
         rules = saved["rules"]
         rules_bank.value = str(int(rules.bank_initial))
@@ -198,8 +394,8 @@ def app_main(page: ft.Page) -> None:
             order_dir_value = controller.state.order_dir
             rules_value = controller.state.rules
         else:
-            players = setup_players
-            order = [player.name for player in setup_players]
+            players = setup_rows.players()
+            order = [player.name for player in players]
             order_dir_value = OrderDir(direction.value)
             rules_value = Rules(
                 bank_initial=float(rules_bank.value or 0),
@@ -207,20 +403,18 @@ def app_main(page: ft.Page) -> None:
                 warn_every=int(rules_warn.value or 1),
             )
 
-        store.save_game_config(
+        config_store.save_game_config(
             players=players,
             order=order,
             order_dir=order_dir_value,
             rules=rules_value,
         )
 
+    def current_sound_choices() -> tuple[tuple[str, str], ...]:
+        return sound_choices(tuple(controller.sound_repo.list_files()))
+
     def sound_options() -> list[ft.dropdown.Option]:
-        files = controller.sound_repo.list_files()
-        options = [ft.dropdown.Option("", "—")]
-        if files:
-            options.append(ft.dropdown.Option("__random__", "Случайный звук"))
-        options.extend(ft.dropdown.Option(name) for name in files)
-        return options
+        return [ft.dropdown.Option(value, label) for value, label in current_sound_choices()]
 
     def open_color_picker(
         player_name: str,
@@ -272,12 +466,16 @@ def app_main(page: ft.Page) -> None:
     def refresh_tick() -> None:
         if not game_visible:
             return
-        if controller.state.mode != Mode.RUNNING:
+        if controller.state.mode != Mode.RUNNING or replay_driver is not None:
             return
-        controller.dispatch(CmdTick(now_mono=time.monotonic()))
+        controller.dispatch(CmdTick(now_mono=clock.monotonic()))
         redraw_game()
 
+    blink = BlinkSchedule()
+    blink_color = DARK
+
     def redraw_game() -> None:
+        nonlocal blink, blink_color
         current = controller.state.current_player
         if not current:
             return
@@ -288,116 +486,67 @@ def app_main(page: ft.Page) -> None:
         phase_text.value = f"Фаза: {controller.state.turn.phase.value}"
         exhausted_text.value = "БАНК ИСЧЕРПАН" if bank <= 0 else ""
 
-        color = "#000000"
+        color = DARK
         for cfg in controller.state.players:
             if cfg.name == current:
                 color = cfg.color
                 break
 
-        left = max(0.0, bank)
-        fraction = (
-            0.0
-            if controller.state.rules.bank_initial <= 0
-            else 1.0 - min(1.0, left / controller.state.rules.bank_initial)
-        )
-        hz = controller.state.rules.blink_min_hz + fraction * (
-            controller.state.rules.blink_max_hz - controller.state.rules.blink_min_hz
-        )
-        pulse = (time.time() * hz) % 1.0
-        page.bgcolor = color if pulse > HALF_PULSE else "#000000"
+        now = clock.monotonic()
+        blink = blink.retune(blink_hz(controller.state.rules, bank), now)
+        blink_color = color
+        page.bgcolor = color if blink.lit(now) else DARK
         page.update()
 
-    def build_setup_table() -> ft.DataTable:
-        rows: list[ft.DataRow] = []
-
-        for idx, player in enumerate(setup_players):
-            name_field = ft.TextField(value=player.name, width=160)
-            sound_field = _dropdown(
-                options=sound_options(),
-                value=player.sound_tap,
-                width=180,
-            )
-
-            def on_name_change(event: ft.ControlEvent, index: int = idx) -> None:
-                setup_players[index].name = event.control.value.strip()
-
-            def on_sound_change(event: ft.ControlEvent, index: int = idx) -> None:
-                setup_players[index].sound_tap = event.control.value or ""
-
-            name_field.on_change = on_name_change
-            sound_field.on_change = on_sound_change
-
-            color_preview = ft.Container(width=26, height=26, bgcolor=player.color, border_radius=6)
-
-            def on_color_selected(
-                value: str,
-                index: int = idx,
-                preview: ft.Container = color_preview,
-            ) -> None:
-                setup_players[index].color = value
-                preview.bgcolor = value
-                page.update()
-
-            current_name = player.name
-            current_color = player.color
-            color_button = _button(
-                "Цвет",
-                lambda _, name=current_name, color=current_color: open_color_picker(
-                    name,
-                    color,
-                    lambda selected, n=name: on_color_selected_by_name(n, selected),
-                ),
-            )
-
-            rows.append(
-                ft.DataRow(
-                    cells=[
-                        ft.DataCell(ft.Text(str(idx + 1))),
-                        ft.DataCell(name_field),
-                        ft.DataCell(ft.Row([color_preview, color_button])),
-                        ft.DataCell(sound_field),
-                        ft.DataCell(ft.Text(format_mm_ss(float(rules_bank.value or 0)))),
-                        ft.DataCell(
-                            _button("Удалить", lambda _, index=idx: remove_setup_player(index))
-                        ),
-                    ]
-                )
-            )
+    def refresh_blink(now: float) -> None:
+        lit_color = blink_color if blink.lit(now) else DARK
+        if page.bgcolor != lit_color:
+            page.bgcolor = lit_color
+            page.update()
 
-        return ft.DataTable(
-            columns=[
-                ft.DataColumn(ft.Text("#")),
-                ft.DataColumn(ft.Text("Имя")),
-                ft.DataColumn(ft.Text("Цвет")),
-                ft.DataColumn(ft.Text("Звук")),
-                ft.DataColumn(ft.Text("Банк времени")),
-                ft.DataColumn(ft.Text("Действия")),
-            ],
-            rows=rows,
+    def open_setup_color_picker(key: int) -> None:
+        player = setup_rows.row(key).player
+        open_color_picker(
+            player.name,
+            player.color,
+            lambda selected: setup_rows.update(key, color=selected),
         )
 
-    def on_color_selected_by_name(player_name: str, selected_color: str) -> None:
-        for player in setup_players:
-            if player.name == player_name:
-                player.color = selected_color
-                break
-        show_setup()
-
-    def remove_setup_player(index: int) -> None:
-        if len(setup_players) <= 1:
+    def remove_setup_player(key: int) -> None:
+        if len(setup_rows) <= 1:
             feedback.value = "Нужен хотя бы один игрок"
             page.update()
             return
-        setup_players.pop(index)
-        show_setup()
-
-    def show_setup() -> None:
-        nonlocal game_visible
-        game_visible = False
-        page.clean()
-        feedback.value = ""
+        setup_rows.remove(key)
+
+    setup_list = SetupListView(
+        setup_rows,
+        sound_choices=current_sound_choices,
+        bank_label=lambda: format_mm_ss(float(rules_bank.value or 0)),
+        on_color=open_setup_color_picker,
+        on_remove=remove_setup_player,
+    )
 
-        table = build_setup_table()
+    def on_rules_bank_change(_: ft.ControlEvent) -> None:
+        try:
+            setup_list.refresh_bank_labels()
+        except ValueError:
+            return
+        _try_update(setup_list.view)
+
+    rules_bank.on_change = on_rules_bank_change
+
+    def build_setup_screen() -> ft.Control:
+        header = ft.Row(
+            [
+                ft.Text("#", width=32),
+                ft.Text("Имя", width=160),
+                ft.Text("Цвет", width=110),
+                ft.Text("Звук", width=180),
+                ft.Text("Банк времени", width=90),
+                ft.Text("Действия"),
+            ]
+        )
 
         def do_add_player(_: ft.ControlEvent) -> None:
             name = new_player_name.value.strip()
@@ -405,17 +554,21 @@ def app_main(page: ft.Page) -> None:
                 feedback.value = "Введите имя игрока"
                 page.update()
                 return
-            if any(item.name == name for item in setup_players):
+            if setup_rows.has_name(name):
                 feedback.value = "Имена игроков должны быть уникальны"
                 page.update()
                 return
-            setup_players.append(PlayerConfig(name=name, color="#FFFFFF"))
+            setup_rows.add(PlayerConfig(name=name, color="#FFFFFF"))
             new_player_name.value = ""
+            feedback.value = ""
             persist_current_config()
-            show_setup()
+            page.update()
 
         def on_start(_: ft.ControlEvent) -> None:
+            if replay_driver is not None:
+                return
             try:
+                setup_players = setup_rows.players()
                 names = [player.name.strip() for player in setup_players if player.name.strip()]
                 if len(names) != len(setup_players):
                     feedback.value = "Имя игрока не может быть пустым"
@@ -441,8 +594,8 @@ def app_main(page: ft.Page) -> None:
                 )
                 controller.dispatch(
                     CmdStartGame(
-                        now_mono=time.monotonic(),
-                        game_id=str(int(time.time())),
+                        now_mono=clock.monotonic(),
+                        game_id=str(int(clock.time())),
                         players=players,
                         order=[player.name for player in players],
                         order_dir=OrderDir(direction.value),
@@ -455,30 +608,33 @@ def app_main(page: ft.Page) -> None:
                 feedback.value = str(exc)
                 page.update()
 
-        page.add(
-            _panel(
-                ft.Text("Настройки (до старта)", size=24),
-                table,
-                ft.Row([new_player_name, _button("Добавить игрока", do_add_player)]),
-                ft.ResponsiveRow(
-                    controls=[
-                        ft.Container(rules_bank, col={"sm": 12, "md": 3}),
-                        ft.Container(rules_cooldown, col={"sm": 12, "md": 3}),
-                        ft.Container(rules_warn, col={"sm": 12, "md": 3}),
-                        ft.Container(direction, col={"sm": 12, "md": 3}),
-                    ]
-                ),
-                _button("Старт игры", on_start),
-                feedback,
-                title="Setup",
-            )
+        return _panel(
+            ft.Text("Настройки (до старта)", size=24),
+            header,
+            setup_list.view,
+            ft.Row([new_player_name, _button("Добавить игрока", do_add_player)]),
+            ft.ResponsiveRow(
+                controls=[
+                    ft.Container(rules_bank, col={"sm": 12, "md": 3}),
+                    ft.Container(rules_cooldown, col={"sm": 12, "md": 3}),
+                    ft.Container(rules_warn, col={"sm": 12, "md": 3}),
+                    ft.Container(direction, col={"sm": 12, "md": 3}),
+                ]
+            ),
+            _button("Старт игры", on_start),
+            title="Setup",
         )
 
-    def apply_pause_edit(player_name: str, edit_type: str, payload: dict) -> None:
+    def bind_setup_screen() -> None:
+        setup_list.render()
+
+    def apply_pause_edit(edit_type: str, payload: dict) -> None:
+        if replay_driver is not None:
+            return
         try:
             controller.dispatch(
                 CmdAdminEdit(
-                    now_mono=time.monotonic(),
+                    now_mono=clock.monotonic(),
                     edit_type=edit_type,
                     payload=payload,
                 )
@@ -489,135 +645,138 @@ def app_main(page: ft.Page) -> None:
             feedback.value = str(exc)
             page.update()
 
-    def pause_player_row(player_name: str) -> ft.DataRow:
-        cfg = next(item for item in controller.state.players if item.name == player_name)
-        bank_seconds = controller.state.bank.get(player_name, 0.0)
-        editable = controller.state.admin_mode
-
-        if editable:
-            name_control: ft.Control = ft.TextField(
-                value=cfg.name,
-                width=160,
-                on_submit=lambda e: apply_pause_edit(
-                    player_name,
-                    "rename_player",
-                    {"old": player_name, "new": e.control.value.strip()},
-                ),
-            )
-            sound_control: ft.Control = _dropdown(
-                width=180,
-                options=sound_options(),
-                value=cfg.sound_tap,
-                on_change=lambda e: apply_pause_edit(
-                    player_name,
-                    "set_sound_tap",
-                    {"player": player_name, "value": e.control.value or ""},
-                ),
-            )
-            bank_field = ft.TextField(
-                value=str(int(bank_seconds)),
-                width=120,
+    class PauseRow:
+        """Controls of one pause-table row; rebound to fresh data on every entry."""
+
+        def __init__(self, player_name: str):
+            self.player_name = player_name
+            self.name_field = ft.TextField(width=160, on_submit=self.on_rename)
+            self.name_text = ft.Text()
+            self.sound_field = _dropdown(width=180, options=[], on_change=self.on_sound)
+            self.sound_text = ft.Text()
+            self.sound_key: tuple[tuple[str, str], ...] = ()
+            self.bank_field = ft.TextField(width=120, on_submit=self.on_bank, on_blur=self.on_bank)
+            self.bank_edit = ft.Row([self.bank_field, _button("OK", self.on_bank)])
+            self.bank_text = ft.Text()
+            self.preview = ft.Container(width=26, height=26, border_radius=6)
+            self.color_button = _button("Цвет", self.on_color)
+            self.color_text = ft.Text()
+            self.remove_button = _button("Удалить", self.on_remove)
+            self.no_action = ft.Text("—")
+            self.row = ft.DataRow(
+                cells=[
+                    ft.DataCell(ft.Row([self.name_field, self.name_text])),
+                    ft.DataCell(ft.Row([self.preview, self.color_button, self.color_text])),
+                    ft.DataCell(ft.Row([self.sound_field, self.sound_text])),
+                    ft.DataCell(ft.Row([self.bank_edit, self.bank_text])),
+                    ft.DataCell(ft.Row([self.remove_button, self.no_action])),
+                ]
             )
 
-            def apply_bank(_=None) -> None:
-                apply_pause_edit(
-                    player_name,
-                    "set_bank",
-                    {"player": player_name, "value": float(bank_field.value)},
-                )
-
-            bank_field.on_submit = apply_bank
-            bank_field.on_blur = apply_bank
-            bank_control: ft.Control = ft.Row([bank_field, _button("OK", apply_bank)])
-
-            color_button = _button(
-                "Цвет",
-                lambda _, name=player_name, color=cfg.color: open_color_picker(
-                    name,
-                    color,
-                    lambda selected: apply_pause_edit(
-                        name,
-                        "set_color",
-                        {"player": name, "value": selected},
-                    ),
-                ),
-            )
-            color_control: ft.Control = ft.Row(
-                [
-                    ft.Container(
-                        width=26,
-                        height=26,
-                        bgcolor=cfg.color,
-                        border_radius=6,
-                    ),
-                    color_button,
-                ]
+        def bind(self) -> ft.DataRow:
+            name = self.player_name
+            cfg = next(item for item in controller.state.players if item.name == name)
+            bank_seconds = controller.state.bank.get(name, 0.0)
+            editable = controller.state.admin_mode
+            for control in (self.name_field, self.sound_field, self.bank_edit):
+                control.visible = editable
+            for control in (self.color_button, self.remove_button):
+                control.visible = editable
+            for control in (self.name_text, self.sound_text, self.bank_text, self.color_text):
+                control.visible = not editable
+            self.no_action.visible = not editable
+
+            self.preview.bgcolor = cfg.color
+            if editable:
+                self.name_field.value = cfg.name
+                choices = current_sound_choices()
+                if choices != self.sound_key:
+                    self.sound_field.options = [
+                        ft.dropdown.Option(value, label) for value, label in choices
+                    ]
+                    self.sound_key = choices
+                self.sound_field.value = cfg.sound_tap
+                self.bank_field.value = str(int(bank_seconds))
+            else:
+                self.name_text.value = cfg.name
+                self.sound_text.value = cfg.sound_tap or "—"
+                self.bank_text.value = f"{format_mm_ss(bank_seconds)} ({int(bank_seconds)}s)"
+                self.color_text.value = cfg.color
+            return self.row
+
+        def on_rename(self, event: ft.ControlEvent) -> None:
+            new = event.control.value.strip()
+            apply_pause_edit("rename_player", {"old": self.player_name, "new": new})
+
+        def on_sound(self, event: ft.ControlEvent) -> None:
+            apply_pause_edit(
+                "set_sound_tap", {"player": self.player_name, "value": event.control.value or ""}
             )
-            action_control: ft.Control = _button(
-                "Удалить",
-                lambda _: apply_pause_edit(
-                    player_name,
-                    "remove_player",
-                    {"player": player_name},
-                ),
+
+        def on_bank(self, _: Any = None) -> None:
+            apply_pause_edit(
+                "set_bank", {"player": self.player_name, "value": float(self.bank_field.value)}
             )
-        else:
-            name_control = ft.Text(cfg.name)
-            sound_control = ft.Text(cfg.sound_tap or "—")
-            bank_control = ft.Text(f"{format_mm_ss(bank_seconds)} ({int(bank_seconds)}s)")
-            color_control = ft.Row(
-                [
-                    ft.Container(
-                        width=26,
-                        height=26,
-                        bgcolor=cfg.color,
-                        border_radius=6,
-                    ),
-                    ft.Text(cfg.color),
-                ]
+
+        def on_color(self, _: ft.ControlEvent) -> None:
+            name = self.player_name
+            open_color_picker(
+                name,
+                self.preview.bgcolor or "#FFFFFF",
+                lambda selected: apply_pause_edit("set_color", {"player": name, "value": selected}),
             )
-            action_control = ft.Text("—")
-
-        return ft.DataRow(
-            cells=[
-                ft.DataCell(name_control),
-                ft.DataCell(color_control),
-                ft.DataCell(sound_control),
-                ft.DataCell(bank_control),
-                ft.DataCell(action_control),
-            ]
-        )
 
-    def show_pause() -> None:
-        nonlocal game_visible
-        game_visible = False
-        page.clean()
-        feedback.value = ""
+        def on_remove(self, _: ft.ControlEvent) -> None:
+            apply_pause_edit("remove_player", {"player": self.player_name})
+
+    pause_rows: KeyedControls[str, PauseRow] = KeyedControls(PauseRow)
+    pause_table = ft.DataTable(
+        columns=[
+            ft.DataColumn(ft.Text("Имя")),
+            ft.DataColumn(ft.Text("Цвет")),
+            ft.DataColumn(ft.Text("Звук")),
+            ft.DataColumn(ft.Text("Банк времени")),
+            ft.DataColumn(ft.Text("Действия")),
+        ],
+        rows=[],
+    )
+    pause_current = ft.Text()
+    pause_phase = ft.Text()
+    pause_direction = ft.Text()
+    pause_undo_depth = ft.Text()
+    pause_recent = [ft.Text(visible=False) for _ in range(RECENT_TURNS)]
 
+    def build_pause_screen() -> ft.Control:
         def do_continue(_: ft.ControlEvent) -> None:
-            controller.dispatch(CmdPauseOff(now_mono=time.monotonic()))
+            if replay_driver is not None:
+                return
+            controller.dispatch(CmdPauseOff(now_mono=clock.monotonic()))
             show_game()
 
         def do_admin_auth(_: ft.ControlEvent) -> None:
+            if replay_driver is not None:
+                return
             controller.dispatch(
                 CmdAdminAuth(
-                    now_mono=time.monotonic(),
+                    now_mono=clock.monotonic(),
                     password=admin_password.value,
                 )
             )
+            show_pause()
             feedback.value = (
                 "Режим администратора включен"
                 if controller.state.admin_mode
                 else "Неверный пароль администратора"
             )
             page.update()
-            show_pause()
 
         def do_reverse(_: ft.ControlEvent) -> None:
+            if replay_driver is not None:
+                return
             try:
                 controller.dispatch(
                     CmdAdminEdit(
-                        now_mono=time.monotonic(),
+                        now_mono=clock.monotonic(),
                         edit_type="reverse",
                         payload={"old": controller.state.order_dir.value},
                     )
@@ -628,13 +787,31 @@ def app_main(page: ft.Page) -> None:
                 feedback.value = str(exc)
                 page.update()
 
+        def do_undo(_: ft.ControlEvent) -> None:
+            if replay_driver is not None:
+                return
+            try:
+                controller.dispatch(
+                    CmdAdminEdit(
+                        now_mono=clock.monotonic(),
+                        edit_type="undo",
+                        payload={"steps": 1},
+                    )
+                )
+                show_pause()
+            except CommandError as exc:
+                feedback.value = str(exc)
+                page.update()
+
         def do_new_game(_: ft.ControlEvent) -> None:
+            if replay_driver is not None:
+                return
             try:
                 controller.dispatch(
                     CmdAdminEdit(
-                        now_mono=time.monotonic(),
+                        now_mono=clock.monotonic(),
                         edit_type="new_game",
-                        payload={"game_id": str(int(time.time()))},
+                        payload={"game_id": str(int(clock.time()))},
                     )
                 )
                 persist_current_config()
@@ -643,95 +820,195 @@ def app_main(page: ft.Page) -> None:
                 feedback.value = str(exc)
                 page.update()
 
-        rows = [pause_player_row(name) for name in controller.state.order]
-
-        table = ft.DataTable(
-            columns=[
-                ft.DataColumn(ft.Text("Имя")),
-                ft.DataColumn(ft.Text("Цвет")),
-                ft.DataColumn(ft.Text("Звук")),
-                ft.DataColumn(ft.Text("Банк времени")),
-                ft.DataColumn(ft.Text("Действия")),
-            ],
-            rows=rows,
+        return _panel(
+            ft.Text("Таблица игроков", size=20),
+            pause_table,
+            ft.Divider(),
+            pause_current,
+            pause_phase,
+            pause_direction,
+            _button("Продолжить", do_continue),
+            admin_password,
+            _button("Войти в режим администратора", do_admin_auth),
+            _button("Сменить направление", do_reverse),
+            ft.Row([_button("Отменить ход", do_undo), pause_undo_depth]),
+            ft.Text("Последние ходы", size=20),
+            ft.Column(pause_recent, spacing=2),
+            _button("Новая игра", do_new_game),
+            title="Tech Pause",
         )
 
-        page.add(
-            _panel(
-                ft.Text("Таблица игроков", size=20),
-                table,
-                ft.Divider(),
-                ft.Text(f"Текущий: {controller.state.current_player}"),
-                ft.Text(f"Фаза: {controller.state.turn.phase.value}"),
-                ft.Text(f"Направление: {controller.state.order_dir.value}"),
-                _button("Продолжить", do_continue),
-                admin_password,
-                _button("Войти в режим администратора", do_admin_auth),
-                _button("Сменить направление", do_reverse),
-                _button("Новая игра", do_new_game),
-                feedback,
-                title="Tech Pause",
-            )
+    def bind_pause_screen() -> None:
+        order = list(controller.state.order)
+        pause_rows.retain(set(order))
+        pause_table.rows = [pause_rows.get(name).bind() for name in order]
+        pause_current.value = f"Текущий: {controller.state.current_player}"
+        pause_phase.value = f"Фаза: {controller.state.turn.phase.value}"
+        pause_direction.value = f"Направление: {controller.state.order_dir.value}"
+        pause_undo_depth.value = f"{len(controller.state.undo_ring)} в истории"
+        turns = controller.history.last_turns(RECENT_TURNS, game_id=controller.state.game_id)
+        for index, text in enumerate(pause_recent):
+            entry = turns[index] if index < len(turns) else None
+            text.visible = entry is not None
+            if entry is not None:
+                text.value = (
+                    f"#{entry.seq} {entry.player}: {format_mm_ss(entry.spent or 0.0)}"
+                    f" (осталось {format_mm_ss(entry.bank or 0.0)})"
+                )
+
+    def do_tap(_: ft.ControlEvent) -> None:
+        if replay_driver is not None:
+            return
+        try:
+            controller.dispatch(CmdTap(now_mono=clock.monotonic()))
+            redraw_game()
+        except CommandError as exc:
+            feedback.value = str(exc)
+            page.update()
+
+    def do_pause(_: ft.ControlEvent) -> None:
+        if replay_driver is not None:
+            return
+        controller.dispatch(CmdPauseOn(now_mono=clock.monotonic(), cause="manual"))
+        show_pause()
+
+    def on_lifecycle_change(event: ft.ControlEvent) -> None:
+        if _is_exit_lifecycle_state(event.data):
+            shutdown()
+        elif replay_driver is None and _is_background_lifecycle_state(event.data) and game_visible:
+            controller.dispatch(CmdBackground(now_mono=clock.monotonic()))
+            config_store.flush()
+            controller.log_writer.flush()
+            show_pause()
+
+    closed = False
+
+    def shutdown(_: Any = None) -> None:
+        nonlocal closed
+        if closed:
+            return
+        closed = True
+        config_store.close()
+        controller.log_writer.close()
+        if publisher is not None:
+            controller.remove_state_listener(publisher)
+            publisher.close()
+
+    page.on_app_lifecycle_state_change = on_lifecycle_change
+    page.on_disconnect = shutdown
+    page.on_close = shutdown
+
+    big_button = ft.Container(
+        border_radius=24,
+        bgcolor=ft.Colors.BLACK,
+        alignment=_center_alignment(),
+        padding=24,
+        content=ft.Column(
+            [player_text, timer_text, phase_text, exhausted_text],
+            alignment=ft.MainAxisAlignment.CENTER,
+            horizontal_alignment=ft.CrossAxisAlignment.CENTER,
+        ),
+        on_click=do_tap,
+        ink=True,
+    )
+    game_controls = ft.Row(
+        [_button("Пауза", do_pause)],
+        alignment=ft.MainAxisAlignment.SPACE_BETWEEN,
+    )
+
+    def build_game_screen() -> ft.Control:
+        return ft.Column(
+            [big_button, game_controls],
+            horizontal_alignment=ft.CrossAxisAlignment.CENTER,
         )
 
-    def show_game() -> None:
+    def bind_game_screen() -> None:
+        width = min(page.width or 900, 900)
+        big_button.width = width
+        big_button.height = (page.height or 800) * 0.7
+        game_controls.width = width
+
+    screens_host = ft.Column(horizontal_alignment=ft.CrossAxisAlignment.CENTER)
+    screens = ScreenPool(attach=screens_host.controls.append)
+    screens.register("setup", build_setup_screen, bind_setup_screen)
+    screens.register("pause", build_pause_screen, bind_pause_screen)
+    screens.register("game", build_game_screen, bind_game_screen)
+    page.add(screens_host, feedback)
+
+    def show_screen(name: str) -> None:
         nonlocal game_visible
-        game_visible = True
-        page.clean()
+        game_visible = name == "game"
         feedback.value = ""
+        screens.show(name)
+        page.update()
 
-        def do_tap(_: ft.ControlEvent) -> None:
-            try:
-                controller.dispatch(CmdTap(now_mono=time.monotonic()))
-                redraw_game()
-            except CommandError as exc:
-                feedback.value = str(exc)
-                page.update()
-
-        def do_pause(_: ft.ControlEvent) -> None:
-            controller.dispatch(CmdPauseOn(now_mono=time.monotonic(), cause="manual"))
-            show_pause()
+    def show_setup() -> None:
+        show_screen("setup")
 
-        def on_lifecycle_change(event: ft.ControlEvent) -> None:
-            if _is_background_lifecycle_state(event.data):
-                controller.dispatch(CmdBackground(now_mono=time.monotonic()))
-                show_pause()
+    def show_pause() -> None:
+        show_screen("pause")
 
-        page.on_app_lifecycle_state_change = on_lifecycle_change
-
-        big_button = ft.Container(
-            width=min(page.width or 900, 900),
-            height=(page.height or 800) * 0.7,
-            border_radius=24,
-            bgcolor=ft.Colors.BLACK,
-            alignment=_center_alignment(),
-            padding=24,
-            content=ft.Column(
-                [player_text, timer_text, phase_text, exhausted_text],
-                alignment=ft.MainAxisAlignment.CENTER,
-                horizontal_alignment=ft.CrossAxisAlignment.CENTER,
-            ),
-            on_click=do_tap,
-            ink=True,
-        )
-        page.add(
-            big_button,
-            ft.Row(
-                [_button("Пауза", do_pause), feedback],
-                width=min(page.width or 900, 900),
-                alignment=ft.MainAxisAlignment.SPACE_BETWEEN,
-            ),
-        )
-        page.run_task(_ticker_loop)
+    def show_game() -> None:
+        show_screen("game")
+        start_ticker()
         redraw_game()
 
+    ticker_running = False
+
+    def start_ticker() -> None:
+        nonlocal ticker_running
+        if not ticker_running:
+            ticker_running = True
+            page.run_task(_ticker_loop)
+
     async def _ticker_loop() -> None:
-        while game_visible:
-            refresh_tick()
-            await asyncio.sleep(0.25)
+        # Wakes for the next timer second, cooldown end or warning (a tick) and
+        # for the exact blink flips in between, not on a fixed period.
+        nonlocal ticker_running
+        next_tick = clock.monotonic()
+        try:
+            while game_visible:
+                now = clock.monotonic()
+                if now >= next_tick:
+                    refresh_tick()
+                    next_tick = now + next_tick_delay(controller.state, now)
+                else:
+                    refresh_blink(now)
+                wake = min(next_tick, blink.next_toggle(now))
+                await asyncio.sleep(max(0.0, wake - clock.monotonic()) + WAKE_SLACK)
+        finally:
+            ticker_running = False
+
+    async def _replay_task() -> None:
+        assert replay_driver is not None and replay_log is not None
+        report = await replay_driver.run_async(replay_steps(iter_log_records(replay_log)))
+        feedback.value = f"Replay finished: {report.summary()}"
+        page.update()
 
-    show_setup()
+    if replay_driver is None:
+        show_setup()
+    else:
+        show_game()
+        page.run_task(_replay_task)
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Timebank app")
+    parser.add_argument("--replay", type=Path, help="play back a log instead of a live game")
+    parser.add_argument("--speed", default="1", help="replay speed: 1, 10x, ... or max")
+    parser.add_argument("--publish", metavar="NAME", help="share live state for spectators")
+    parser.add_argument("--store", choices=("log", "sqlite"), default="log", help="event store")
+    args = parser.parse_args(argv)
+    run_flet_app(
+        functools.partial(
+            app_main,
+            replay_log=args.replay,
+            replay_speed=parse_speed(args.speed),
+            publish=args.publish,
+            store=args.store,
+        )
+    )
 
 
 if __name__ == "__main__":
-    run_flet_app()
+    main()
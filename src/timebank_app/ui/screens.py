@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any, Generic, TypeVar
+
+K = TypeVar("K")
+T = TypeVar("T")
+
+
+@dataclass(slots=True)
+class _Screen:
+    build: Callable[[], Any]
+    bind: Callable[[], None] | None
+    root: Any = None
+
+
+class ScreenPool:
+    """Screens built once and switched by visibility.
+
+    ``register`` only records how to build a screen. The first ``show`` builds
+    its control tree and hands it to ``attach`` (e.g. appends it to the page);
+    later switches just flip ``visible`` and call the screen's ``bind`` so it
+    can refresh the data it displays. Nothing is rebuilt or re-sent per switch.
+    """
+
+    def __init__(self, attach: Callable[[Any], None]):
+        self.attach = attach
+        self.current: str | None = None
+        self.builds = 0
+        self._screens: dict[str, _Screen] = {}
+
+    def register(
+        self, name: str, build: Callable[[], Any], bind: Callable[[], None] | None = None
+    ) -> None:
+        self._screens[name] = _Screen(build=build, bind=bind)
+
+    def root(self, name: str) -> Any:
+        screen = self._screens[name]
+        if screen.root is None:
+            screen.root = screen.build()
+            screen.root.visible = False
+            self.builds += 1
+            self.attach(screen.root)
+        return screen.root
+
+    def show(self, name: str) -> Any:
+        root = self.root(name)
+        for other_name, other in self._screens.items():
+            if other.root is not None and other_name != name:
+                other.root.visible = False
+        screen = self._screens[name]
+        if screen.bind is not None:
+            screen.bind()
+        root.visible = True
+        self.current = name
+        return root
+
+
+class KeyedControls(Generic[K, T]):
+    """Per-key control groups reused across screen entries.
+
+    ``retain`` drops groups for keys that are gone (removed or renamed
+    players), so the pool never outgrows the current table.
+    """
+
+    def __init__(self, build: Callable[[K], T]):
+        self.build = build
+        self.builds = 0
+        self._items: dict[K, T] = {}
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def get(self, key: K) -> T:
+        item = self._items.get(key)
+        if item is None:
+            item = self.build(key)
+            self._items[key] = item
+            self.builds += 1
+        return item
+
+    def retain(self, keys: set[K]) -> None:
+        for key in [key for key in self._items if key not in keys]:
+            del self._items[key]
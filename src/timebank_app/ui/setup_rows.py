@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Literal
+
+from timebank_app.domain.models import PlayerConfig
+from timebank_app.infra.effects import RANDOM_SOUND
+
+RANDOM_SOUND_LABEL = "Случайный звук"
+
+
+@dataclass(slots=True)
+class SetupRow:
+    key: int
+    player: PlayerConfig
+
+
+@dataclass(frozen=True, slots=True)
+class RowChange:
+    kind: Literal["insert", "remove", "update", "reset"]
+    key: int = -1
+    index: int = -1
+
+
+RowListener = Callable[[RowChange], None]
+
+
+class SetupRowModel:
+    """Setup players keyed by a stable row key.
+
+    Every edit notifies listeners with the single row it touched, so a view can
+    patch one row instead of rebuilding the table. Keys never change when rows
+    before them are removed or when a player is renamed.
+    """
+
+    def __init__(self, players: Iterable[PlayerConfig] = ()):
+        self._rows: list[SetupRow] = []
+        self._next_key = 0
+        self.listeners: list[RowListener] = []
+        for player in players:
+            self._rows.append(self._new_row(player))
+
+    def _new_row(self, player: PlayerConfig) -> SetupRow:
+        row = SetupRow(key=self._next_key, player=player)
+        self._next_key += 1
+        return row
+
+    def _notify(self, change: RowChange) -> None:
+        for listener in self.listeners:
+            listener(change)
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def rows(self) -> list[SetupRow]:
+        return list(self._rows)
+
+    def players(self) -> list[PlayerConfig]:
+        return [row.player for row in self._rows]
+
+    def index_of(self, key: int) -> int:
+        for index, row in enumerate(self._rows):
+            if row.key == key:
+                return index
+        raise KeyError(key)
+
+    def row(self, key: int) -> SetupRow:
+        return self._rows[self.index_of(key)]
+
+    def window(self, start: int, stop: int) -> list[tuple[int, SetupRow]]:
+        start = max(0, start)
+        return list(enumerate(self._rows[start:stop], start=start))
+
+    def has_name(self, name: str) -> bool:
+        return any(row.player.name == name for row in self._rows)
+
+    def add(self, player: PlayerConfig) -> int:
+        row = self._new_row(player)
+        self._rows.append(row)
+        self._notify(RowChange("insert", row.key, len(self._rows) - 1))
+        return row.key
+
+    def remove(self, key: int) -> None:
+        index = self.index_of(key)
+        del self._rows[index]
+        self._notify(RowChange("remove", key, index))
+
+    def update(self, key: int, **changes: str) -> None:
+        index = self.index_of(key)
+        player = self._rows[index].player
+        for field_name, value in changes.items():
+            if not hasattr(player, field_name):
+                raise AttributeError(field_name)
+            setattr(player, field_name, value)
+        self._notify(RowChange("update", key, index))
+
+    def reset(self, players: Iterable[PlayerConfig]) -> None:
+        self._rows = [self._new_row(player) for player in players]
+        self._notify(RowChange("reset"))
+
+
+def visible_range(
+    offset: float,
+    viewport: float,
+    row_height: float,
+    total: int,
+    overscan: int = 4,
+) -> tuple[int, int]:
+    """Rows ``[start, stop)`` to materialise for a scroll ``offset`` in pixels."""
+    if total <= 0 or row_height <= 0:
+        return 0, 0
+    first = int(max(0.0, offset) // row_height)
+    shown = int(max(0.0, viewport) // row_height) + 2
+    start = max(0, min(first, total - 1) - overscan)
+    stop = min(total, first + shown + overscan)
+    return start, stop
+
+
+@lru_cache(maxsize=8)
+def sound_choices(files: tuple[str, ...]) -> tuple[tuple[str, str], ...]:
+    """``(value, label)`` pairs for a tap sound dropdown, shared by all rows."""
+    choices = [("", "—")]
+    if files:
+        choices.append((RANDOM_SOUND, RANDOM_SOUND_LABEL))
+    choices.extend((name, name) for name in files)
+    return tuple(choices)
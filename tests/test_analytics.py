@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from timebank_app.app.controller import GameController
+from timebank_app.domain.commands import CmdStartGame, CmdTap, CmdTick
+from timebank_app.domain.engine import Decider
+from timebank_app.domain.models import OrderDir, PlayerConfig, Rules
+from timebank_app.infra.effects import EffectSink, SoundRepo
+from timebank_app.infra.logging import LogWriter
+
+np = pytest.importorskip("numpy")
+analytics = pytest.importorskip("timebank_app.app.analytics")
+
+
+def play(log_path: Path, game_id: str) -> None:
+    controller = GameController(
+        decider=Decider("pw"),
+        log_writer=LogWriter(log_path),
+        effects=EffectSink(),
+        sound_repo=SoundRepo(log_path.parent / "sounds"),
+    )
+    controller.dispatch(
+        CmdStartGame(
+            now_mono=0.0,
+            game_id=game_id,
+            players=[PlayerConfig(name="A"), PlayerConfig(name="B")],
+            order=["A", "B"],
+            order_dir=OrderDir.CLOCKWISE,
+            rules=Rules(bank_initial=100, cooldown=5, warn_every=10),
+        )
+    )
+    controller.dispatch(CmdTap(now_mono=27.0))  # A: 22s countdown, 2 warns
+    controller.dispatch(CmdTap(now_mono=30.0))  # B: cooldown only
+    controller.dispatch(CmdTick(now_mono=36.0))
+    controller.dispatch(CmdTap(now_mono=38.0))  # A: 3s countdown
+
+
+def test_player_and_game_aggregates(tmp_path: Path):
+    log = tmp_path / "events.log"
+    play(log, "g1")
+    play(log, "g2")
+    columns = analytics.load_columns([log])
+
+    players = analytics.player_aggregates(columns)
+    stats = {name: idx for idx, name in enumerate(players.names)}
+    a, b = stats["A"], stats["B"]
+    assert players.turns[a] == 4
+    assert players.turns[b] == 2
+    assert players.countdown_seconds[a] == pytest.approx(2 * (22 + 3))
+    assert players.countdown_seconds[b] == pytest.approx(0)
+    assert players.cooldown_seconds[a] == pytest.approx(2 * (5 + 5))
+    assert players.mean_turn_seconds[a] == pytest.approx((27 + 8) / 2)
+    assert players.warns[a] == 4
+
+    games = analytics.game_aggregates(columns)
+    assert games.game_ids == ["g1", "g2"]
+    assert list(games.turns) == [3, 3]
+    assert list(games.warns) == [2, 2]
+    assert games.last_mono[0] == pytest.approx(38.0)
+
+
+def test_final_banks_take_last_turn_end(tmp_path: Path):
+    log = tmp_path / "events.log"
+    play(log, "g1")
+    columns = analytics.load_columns([log])
+    banks = analytics.final_banks(columns)
+    result = {
+        columns.player_names[player]: bank
+        for player, bank in zip(banks.player, banks.bank_after, strict=True)
+    }
+    assert result["A"] == pytest.approx(100 - 22 - 3)
+    assert result["B"] == pytest.approx(100)
+
+
+def test_aggregates_scale_to_thousands_of_games():
+    rng = np.random.default_rng(0)
+    games, turns = 5000, 40
+    rows = games * turns * 2
+    columns = analytics.EventColumns(
+        game_ids=[f"g{idx}" for idx in range(games)],
+        player_names=[f"p{idx}" for idx in range(6)],
+        seq=np.arange(rows, dtype=np.int64),
+        kind=np.tile(np.array([0, 1], dtype=np.int8), games * turns),
+        game=np.repeat(np.arange(games, dtype=np.int32), turns * 2),
+        player=np.repeat(rng.integers(0, 6, games * turns, dtype=np.int32), 2),
+        mono=np.cumsum(rng.random(rows)),
+        spent_no_cooldown=rng.random(rows),
+        bank_after=rng.random(rows),
+    )
+    players = analytics.player_aggregates(columns)
+    assert int(players.turns.sum()) == games * turns
+    assert len(analytics.final_banks(columns).bank_after) <= games * 6
+
+
+def test_parallel_scan_matches_sequential(tmp_path: Path):
+    log = tmp_path / "events.log"
+    for index in range(6):
+        play(log, f"g{index}")
+    ranges = analytics.split_log(log, chunk_bytes=700)
+    assert len(ranges) > 5
+    data = log.read_bytes()
+    assert all(start == 0 or data[start - 1 : start] == b"\n" for start, _ in ranges)
+    assert [end for _, end in ranges[:-1]] == [start for start, _ in ranges[1:]]
+
+    sequential = analytics.load_columns([log])
+    parallel = analytics.load_columns_parallel([log], workers=2, chunk_bytes=700)
+    assert parallel.game_ids == sequential.game_ids
+    assert parallel.player_names == sequential.player_names
+    for name in ("seq", "kind", "game", "player", "mono", "spent_no_cooldown", "bank_after"):
+        np.testing.assert_array_equal(getattr(parallel, name), getattr(sequential, name))
+    assert list(analytics.player_aggregates(parallel).turns) == list(
+        analytics.player_aggregates(sequential).turns
+    )
+    assert len(analytics.load_columns_parallel([], workers=2)) == 0
@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from timebank_app.app.simulator import SimulationProfile, run_simulation
+from timebank_app.infra.archive import CODECS, ArchiveReader, archive_log
+from timebank_app.infra.log_reader import iter_log_records
+from timebank_app.infra.logging import line_key
+
+
+@pytest.fixture(scope="module")
+def season_log(tmp_path_factory) -> Path:
+    out = tmp_path_factory.mktemp("season")
+    profile = SimulationProfile(players=4, mean_turn=20.0, tick_interval=1.0)
+    run_simulation(tables=3, hours=0.3, out_dir=out, profile=profile)
+    merged = out / "season.log"
+    with merged.open("w", encoding="utf-8") as handle:
+        handle.write("LOG_FORMAT v=1\n")
+        for table in sorted(out.glob("table-*.log")):
+            lines = table.read_text(encoding="utf-8").splitlines(keepends=True)
+            handle.writelines(lines[1:])
+    return merged
+
+
+def game_lines(path: Path, game_id: str) -> list[str]:
+    with path.open(encoding="utf-8") as handle:
+        return [line for line in handle if (key := line_key(line)) and key[1] == game_id]
+
+
+@pytest.mark.parametrize("codec", sorted(CODECS))
+def test_archive_roundtrip_and_block_pruning(season_log: Path, tmp_path: Path, codec: str):
+    archive = tmp_path / "season.tba"
+    blocks = archive_log(season_log, archive, codec=codec, block_bytes=16 * 1024)
+    assert len(blocks) > 3
+    assert archive.stat().st_size < season_log.stat().st_size
+
+    reader = ArchiveReader(archive)
+    everything = list(reader.iter_lines())
+    assert everything == season_log.read_text(encoding="utf-8").splitlines(keepends=True)[1:]
+
+    reader = ArchiveReader(archive)
+    assert list(reader.iter_lines(game_id="t1-g0")) == game_lines(season_log, "t1-g0")
+    assert 0 < reader.blocks_read < len(blocks)
+
+
+def test_log_reader_reads_archives_by_game(season_log: Path, tmp_path: Path):
+    archive = tmp_path / "season.tba"
+    archive_log(season_log, archive, block_bytes=16 * 1024)
+    from_archive = list(iter_log_records(archive, game_id="t2-g0", event_types={"TURN_END"}))
+    from_log = list(iter_log_records(season_log, game_id="t2-g0", event_types={"TURN_END"}))
+    assert from_archive == from_log
+    assert from_archive
@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+import math
+
+import pytest
+
+from timebank_app.domain.models import GameState, Mode, Rules, TurnPhase, TurnRuntime
+from timebank_app.ui.blink import MAX_TICK, BlinkSchedule, blink_hz, next_tick_delay
+
+
+def test_rate_only_changes_at_band_edges():
+    rules = Rules(bank_initial=100, blink_min_hz=0.0, blink_max_hz=2.0)
+    assert blink_hz(rules, 100) == 0.0
+    assert blink_hz(rules, 96) == blink_hz(rules, 95.5) == 0.0
+    assert blink_hz(rules, 95) == pytest.approx(0.1)
+    assert blink_hz(rules, -5) == blink_hz(rules, 0) == 2.0
+    assert len({blink_hz(rules, bank / 10) for bank in range(1001)}) == 21
+
+
+def test_schedule_flips_exactly_at_next_toggle():
+    schedule = BlinkSchedule(hz=3.0, anchor=10.0)
+    now = 10.05
+    flips = 0
+    lit = schedule.lit(now)
+    while now < 20.0:
+        now = schedule.next_toggle(now) + 1e-9
+        assert schedule.lit(now) != lit
+        lit = not lit
+        flips += 1
+    # Two flips per period, none lost however fast the rate.
+    assert flips == 2 * 3 * 10
+    assert BlinkSchedule().next_toggle(5.0) == math.inf
+
+
+def test_retune_keeps_the_phase():
+    schedule = BlinkSchedule(hz=0.5, anchor=0.0)
+    faster = schedule.retune(2.0, 1.5)
+    assert faster.phase(1.5) == pytest.approx(schedule.phase(1.5))
+    assert faster.lit(1.5) == schedule.lit(1.5)
+    assert schedule.retune(0.5, 9.0) is schedule
+
+
+def running(phase: TurnPhase, bank: float, **turn) -> GameState:
+    return GameState(
+        mode=Mode.RUNNING,
+        rules=Rules(bank_initial=600, cooldown=5, warn_every=60),
+        bank={"A": bank},
+        current_player="A",
+        turn=TurnRuntime(phase=phase, **turn),
+    )
+
+
+def test_ticks_wake_for_timer_seconds_cooldown_and_warnings():
+    assert next_tick_delay(running(TurnPhase.COUNTDOWN, 12.25), 0.0) == pytest.approx(0.25)
+    assert next_tick_delay(running(TurnPhase.COUNTDOWN, -2.75), 0.0) == pytest.approx(0.25)
+    assert next_tick_delay(running(TurnPhase.COUNTDOWN, 12.0), 0.0) == MAX_TICK
+    state = running(TurnPhase.COUNTDOWN, 12.5, elapsed_no_cooldown=59.9)
+    assert next_tick_delay(state, 0.0) == pytest.approx(0.1)
+    state = running(TurnPhase.COOLDOWN, 12.5, phase_started_mono=10.0)
+    assert next_tick_delay(state, 14.7) == pytest.approx(0.3)
+    assert next_tick_delay(GameState(), 0.0) == MAX_TICK
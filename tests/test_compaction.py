@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+import os
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+
+from test_controller_infra import make_controller, start
+
+from timebank_app.app import compaction
+from timebank_app.app.compaction import compact_log
+from timebank_app.app.time_travel import replay_games, state_summary
+from timebank_app.domain.commands import (
+    CmdAdminAuth,
+    CmdAdminEdit,
+    CmdPauseOff,
+    CmdPauseOn,
+    CmdTap,
+    CmdTick,
+)
+from timebank_app.domain.events import ev
+from timebank_app.infra.log_reader import iter_log_records
+from timebank_app.infra.logging import LogLock, LogWriter
+
+
+def play_two_games(tmp_path: Path) -> Path:
+    controller = make_controller(tmp_path)
+    start(controller)
+    now = 0.0
+    for turn in range(8):
+        for _ in range(20):
+            now += 0.25
+            controller.dispatch(CmdTick(now_mono=now))
+        if turn == 3:
+            controller.dispatch(CmdPauseOn(now_mono=now, cause="manual"))
+            controller.dispatch(CmdPauseOff(now_mono=now + 30))
+            now += 30
+        controller.dispatch(CmdTap(now_mono=now))
+    controller.dispatch(CmdPauseOn(now_mono=now, cause="manual"))
+    controller.dispatch(CmdAdminAuth(now_mono=now, password="pw"))
+    controller.dispatch(CmdAdminEdit(now_mono=now, edit_type="new_game", payload={"game_id": "g2"}))
+    controller.dispatch(CmdPauseOff(now_mono=now))
+    for _ in range(10):
+        now += 0.25
+        controller.dispatch(CmdTick(now_mono=now))
+    return controller.log_writer.path
+
+
+def records_by_type(path: Path, game_id: str, event_type: str) -> list[str]:
+    return [
+        f"{record.seq}:{record.fields}"
+        for record in iter_log_records(path)
+        if record.game_id == game_id and record.event_type == event_type
+    ]
+
+
+def test_compaction_drops_redundant_syncs_of_closed_games(tmp_path: Path):
+    path = play_two_games(tmp_path)
+    before = {
+        game: state_summary(state) for game, state in replay_games(iter_log_records(path)).items()
+    }
+    turn_ends = records_by_type(path, "g1", "TURN_END")
+    open_syncs = records_by_type(path, "g2", "RUNTIME_SYNC")
+    syncs_before = len(records_by_type(path, "g1", "RUNTIME_SYNC"))
+
+    report = compact_log(path)
+
+    assert report.written is True
+    assert report.closed_games == ["g1"]
+    assert report.bytes_after < report.bytes_before
+    after = {
+        game: state_summary(state) for game, state in replay_games(iter_log_records(path)).items()
+    }
+    assert after == before
+    assert records_by_type(path, "g1", "TURN_END") == turn_ends
+    assert records_by_type(path, "g2", "RUNTIME_SYNC") == open_syncs
+    syncs_after = len(records_by_type(path, "g1", "RUNTIME_SYNC"))
+    assert syncs_after < syncs_before
+    assert syncs_before - syncs_after == report.dropped_syncs
+
+
+def test_compaction_dry_run_and_idempotence(tmp_path: Path):
+    path = play_two_games(tmp_path)
+    original = path.read_bytes()
+    assert compact_log(path, dry_run=True).dropped_syncs > 0
+    assert path.read_bytes() == original
+
+    compact_log(path)
+    again = compact_log(path)
+    assert again.dropped_syncs == 0
+    assert again.written is False
+
+
+def test_compaction_keeps_lines_appended_during_the_rewrite(tmp_path: Path, monkeypatch):
+    path = play_two_games(tmp_path)
+    writer = LogWriter(path)
+    real_hold = LogLock.hold
+    real_replace = os.replace
+    blocked = []
+
+    @contextmanager
+    def hold_after_an_append(lock: LogLock, *, exclusive: bool = False):
+        if exclusive:
+            writer.append("g2", ev("WARN_LONG_TURN", player="A", count=1))
+        with real_hold(lock, exclusive=exclusive):
+            yield
+
+    def replace_while_writing(src, dst):
+        late = threading.Thread(target=writer.append, args=("g2", ev("TICK")))
+        late.start()
+        late.join(0.2)
+        blocked.append(late)
+        real_replace(src, dst)
+
+    monkeypatch.setattr(LogLock, "hold", hold_after_an_append)
+    monkeypatch.setattr(compaction.os, "replace", replace_while_writing)
+    report = compact_log(path)
+    late = blocked[0]
+    assert late.is_alive()  # the writer waited for the swap
+    late.join(5)
+
+    assert report.written is True
+    seqs = [record.seq for record in iter_log_records(path)]
+    assert seqs == sorted(seqs) and seqs[-2:] == [writer.seq - 1, writer.seq]
@@ -1,12 +1,14 @@
 from __future__ import annotations
 
+import threading
 from pathlib import Path
 
 from timebank_app.app.controller import GameController
 from timebank_app.domain.commands import CmdPauseOn, CmdStartGame, CmdTap
 from timebank_app.domain.engine import Decider
 from timebank_app.domain.models import OrderDir, PlayerConfig, Rules
-from timebank_app.infra.effects import EffectSink, SoundRepo
+from timebank_app.infra.effects import EffectSink, EffectWorker, KeepAwake, SoundRepo, WarnSound
+from timebank_app.infra.log_reader import iter_log_records, parse_log_line
 from timebank_app.infra.logging import LogWriter
 from timebank_app.infra.storage import ConfigStore
 
@@ -105,3 +107,176 @@ def test_log_file_has_header(tmp_path: Path):
     writer.append("g", type("Evt", (), {"event_type": "X", "data": {}})())
     text2 = (tmp_path / "l.log").read_text(encoding="utf-8")
     assert "EVENT=X" in text2
+
+
+def test_log_reader_parses_written_lines(tmp_path: Path):
+    controller = make_controller(tmp_path)
+    start(controller)
+    controller.dispatch(CmdTap(now_mono=3.0))
+    records = list(iter_log_records(tmp_path / "events.log"))
+    assert [record.event_type for record in records][:2] == ["GAME_START", "TURN_START"]
+    assert records[0].game_id == ""
+    assert records[0].fields["order"] == "A,B"
+    turn_end = next(record for record in records if record.event_type == "TURN_END")
+    assert turn_end.game_id == "g1"
+    assert float(turn_end.fields["bank_after"]) == 28.0
+
+    only_ends = list(iter_log_records(tmp_path / "events.log", event_types={"TURN_END"}))
+    assert [record.seq for record in only_ends] == [turn_end.seq]
+    assert parse_log_line("LOG_FORMAT v=1\n") is None
+
+
+def test_config_store_skips_clean_writes_and_keeps_foreign_sections(tmp_path: Path):
+    path = tmp_path / "config.ini"
+    path.write_text("[auth]\npassword = secret\n", encoding="utf-8")
+    cfg = ConfigStore(path)
+    kwargs = {
+        "players": [PlayerConfig(name="A")],
+        "order": ["A"],
+        "order_dir": OrderDir.CLOCKWISE,
+        "rules": Rules(),
+    }
+    cfg.save_game_config(**kwargs)
+    cfg.save_game_config(**kwargs)
+    assert cfg.writes == 1
+    assert "[auth]" in path.read_text(encoding="utf-8")
+    assert not (tmp_path / "config.ini.tmp").exists()
+
+    kwargs["players"] = [PlayerConfig(name="A", color="#000000")]
+    cfg.save_game_config(**kwargs)
+    assert cfg.writes == 2
+    assert cfg.last_dirty == {"player:A"}
+
+
+def test_config_store_debounces_bursts(tmp_path: Path):
+    cfg = ConfigStore(tmp_path / "config.ini", debounce=60.0)
+    for idx in range(20):
+        cfg.save_game_config(
+            players=[PlayerConfig(name="A", color=f"#0000{idx:02d}")],
+            order=["A"],
+            order_dir=OrderDir.CLOCKWISE,
+            rules=Rules(),
+        )
+    assert cfg.writes == 0
+    assert cfg.load_game_config()["players"][0].color == "#000019"
+    assert cfg.flush() is True
+    assert cfg.writes == 1
+    assert ConfigStore(tmp_path / "config.ini").load_game_config()["players"][0].color == "#000019"
+
+
+def test_config_store_caches_parsed_model_until_file_changes(tmp_path: Path):
+    path = tmp_path / "config.ini"
+    ConfigStore(path).save_game_config(
+        players=[PlayerConfig(name="A")],
+        order=["A"],
+        order_dir=OrderDir.CLOCKWISE,
+        rules=Rules(bank_initial=90),
+    )
+    cfg = ConfigStore(path, check_interval=0.0)
+    first = cfg.load_game_config()
+    first["players"][0].name = "mutated"
+    assert cfg.load_game_config()["players"][0].name == "A"
+    assert cfg.parses == 1
+
+    path.write_text(path.read_text(encoding="utf-8").replace("= 90", "= 120"), encoding="utf-8")
+    assert cfg.load_game_config()["rules"].bank_initial == 120
+    assert cfg.parses == 2
+
+    lazy = ConfigStore(path, check_interval=3600.0)
+    lazy.load_game_config()
+    path.unlink()
+    assert lazy.load_game_config()["rules"].bank_initial == 120
+
+
+def test_log_writer_resumes_seq_after_restart(tmp_path: Path):
+    controller = make_controller(tmp_path)
+    start(controller)
+    controller.dispatch(CmdTap(now_mono=3.0))
+    path = tmp_path / "events.log"
+    last_seq = controller.log_writer.seq
+
+    resumed = LogWriter(path)
+    assert resumed.recovered_from == "tail"
+    assert (resumed.seq, resumed.last_game_id) == (last_seq, "g1")
+
+    resumed.append("g1", type("Evt", (), {"event_type": "X", "data": {}})())
+    resumed.close()
+    again = LogWriter(path)
+    assert again.recovered_from == "sidecar"
+    assert again.seq == last_seq + 1
+
+    seqs = [record.seq for record in iter_log_records(path)]
+    assert seqs == sorted(set(seqs))
+
+
+def test_log_writer_tail_scan_ignores_partial_last_line(tmp_path: Path):
+    path = tmp_path / "events.log"
+    writer = LogWriter(path)
+    event = type("Evt", (), {"event_type": "X", "data": {"note": "x" * 5000}})()
+    for _ in range(3):
+        writer.append("g", event)
+    with path.open("a", encoding="utf-8") as handle:
+        handle.write("2026-01-01T00:00:00.000+00:00 SEQ=99 G=g EVE")
+
+    resumed = LogWriter(path)
+    assert resumed.seq == 3
+    resumed.append("g", type("Evt", (), {"event_type": "Y", "data": {}})())
+    assert path.read_text(encoding="utf-8").splitlines()[-1].split(" ")[1] == "SEQ=4"
+
+
+def test_effects_coalesce_keep_awake_and_repeated_warns(tmp_path: Path):
+    sink = EffectSink()
+    worker = EffectWorker(sink, SoundRepo(tmp_path))
+    (tmp_path / "warn.wav").write_text("dummy", encoding="utf-8")
+    worker.submit(
+        [KeepAwake(True), KeepAwake(False), KeepAwake(True)] + [WarnSound("warn.wav")] * 4
+    )
+    assert sink.keep_awake is True
+    assert sink.played_sounds == ["warn.wav"]
+    assert worker.coalesced == 5
+
+
+def test_threaded_effects_do_not_block_dispatch(tmp_path: Path):
+    release = threading.Event()
+
+    class SlowSink(EffectSink):
+        def play_sound(self, path: Path | None) -> None:
+            release.wait(5)
+            super().play_sound(path)
+
+    sounds = tmp_path / "sounds"
+    sounds.mkdir()
+    (sounds / "tap.wav").write_text("dummy", encoding="utf-8")
+    controller = GameController(
+        decider=Decider("pw"),
+        log_writer=LogWriter(tmp_path / "events.log"),
+        effects=SlowSink(),
+        sound_repo=SoundRepo(sounds),
+        threaded_effects=True,
+    )
+    start(controller)
+    controller.dispatch(CmdTap(now_mono=3.0))
+    assert controller.state.current_player == "B"
+    assert controller.effects.played_sounds == []
+
+    release.set()
+    assert controller.effect_worker.drain(timeout=5)
+    assert controller.effects.played_sounds == ["tap.wav"]
+    controller.effect_worker.close()
+
+
+def test_threaded_effects_survive_a_failing_sink(tmp_path: Path):
+    class ClosedPageSink(EffectSink):
+        def set_keep_awake(self, enabled: bool) -> None:
+            raise RuntimeError("page is closed")
+
+    (tmp_path / "warn.wav").write_text("dummy", encoding="utf-8")
+    sink = ClosedPageSink()
+    worker = EffectWorker(sink, SoundRepo(tmp_path), threaded=True)
+    worker.submit([KeepAwake(True), WarnSound("warn.wav")])
+    assert worker.drain(timeout=5)
+    worker.submit([KeepAwake(False), WarnSound("warn.wav")])
+    assert worker.drain(timeout=5)
+    assert sink.played_sounds == ["warn.wav", "warn.wav"]
+    assert sink.errors == ["page is closed", "page is closed"]
+    worker.close()
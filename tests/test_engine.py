@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import pytest
+
 from timebank_app.domain.commands import (
     CmdAdminAuth,
     CmdAdminEdit,
@@ -9,7 +11,15 @@ from timebank_app.domain.commands import (
     CmdTick,
 )
 from timebank_app.domain.engine import CommandError, Decider, apply_event
-from timebank_app.domain.models import GameState, OrderDir, PlayerConfig, Rules, TurnPhase
+from timebank_app.domain.models import (
+    UNDO_DEPTH,
+    GameState,
+    OrderDir,
+    PlayerConfig,
+    Rules,
+    TurnPhase,
+    TurnSnapshot,
+)
 
 
 def evolve(state: GameState, events):
@@ -126,3 +136,81 @@ def test_tick_advances_runtime_without_tap():
     assert state.current_player == "A"
     assert state.turn.phase == TurnPhase.COUNTDOWN
     assert state.bank["A"] == 78
+
+
+def test_ticks_accumulate_countdown_and_warns():
+    decider = Decider("pw")
+    state = evolve(GameState(), decider.decide(GameState(), mk_start()))
+    warns = []
+    for step in range(1, 111):
+        events = decider.decide(state, CmdTick(now_mono=step * 0.25))
+        warns.extend(event for event in events if event.event_type == "WARN_LONG_TURN")
+        state = evolve(state, events)
+    assert state.turn.elapsed_no_cooldown == 22.5
+    assert state.bank["A"] == 77.5
+    assert [event.data["warn_no"] for event in warns] == [1, 2]
+
+
+def play_turns(decider: Decider, turns: int, turn_length: float = 15.0):
+    state = evolve(GameState(), decider.decide(GameState(), mk_start()))
+    for idx in range(1, turns + 1):
+        state = evolve(state, decider.decide(state, CmdTap(now_mono=idx * turn_length)))
+    return state
+
+
+def test_multi_step_undo_restores_banks_and_player():
+    decider = Decider("pw")
+    state = play_turns(decider, 3)
+    assert state.bank == {"A": 80, "B": 90}
+    state = evolve(state, decider.decide(state, CmdAdminAuth(now_mono=46.0, password="pw")))
+    state = evolve(
+        state,
+        decider.decide(state, CmdAdminEdit(now_mono=47.0, edit_type="undo", payload={"steps": 2})),
+    )
+    assert state.current_player == "B"
+    assert state.bank == {"A": 90, "B": 90}
+    assert state.turn.phase == TurnPhase.COUNTDOWN
+    assert state.turn.elapsed_no_cooldown == 10
+    assert state.last_turn_end["player"] == "A"
+    assert len(state.undo_ring) == 1
+
+
+def test_undo_deeper_than_history_is_rejected():
+    decider = Decider("pw")
+    state = play_turns(decider, 2)
+    state = evolve(state, decider.decide(state, CmdAdminAuth(now_mono=31.0, password="pw")))
+    with pytest.raises(CommandError, match="2 turns"):
+        decider.decide(state, CmdAdminEdit(now_mono=32.0, edit_type="undo", payload={"steps": 3}))
+
+
+def test_undo_ring_is_bounded():
+    decider = Decider("pw")
+    state = play_turns(decider, UNDO_DEPTH + 10, turn_length=6.0)
+    assert len(state.undo_ring) == UNDO_DEPTH
+    assert state.undo_ring[0] == TurnSnapshot("A", 100 - 6, 1.0)
+
+
+def test_single_step_undo_restores_only_the_last_player():
+    decider = Decider("pw")
+    state = play_turns(decider, 2)
+    for command in (
+        CmdAdminAuth(now_mono=40.0, password="pw"),
+        CmdAdminEdit(now_mono=41.0, edit_type="undo", payload={}),
+    ):
+        state = evolve(state, decider.decide(state, command))
+    # As with the original one-level undo, the interrupted turn keeps its spent time.
+    assert state.current_player == "B"
+    assert state.bank == {"A": 84, "B": 90}
+
+
+def test_undo_survives_rename():
+    decider = Decider("pw")
+    state = play_turns(decider, 2)
+    state = evolve(state, decider.decide(state, CmdAdminAuth(now_mono=31.0, password="pw")))
+    for command in (
+        CmdAdminEdit(now_mono=32.0, edit_type="rename_player", payload={"old": "A", "new": "Ann"}),
+        CmdAdminEdit(now_mono=33.0, edit_type="undo", payload={"steps": 2}),
+    ):
+        state = evolve(state, decider.decide(state, command))
+    assert state.current_player == "Ann"
+    assert state.bank == {"Ann": 90, "B": 100}
@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+
+from test_controller_infra import start
+
+from timebank_app.app.controller import GameController
+from timebank_app.domain.commands import (
+    CmdAdminAuth,
+    CmdAdminEdit,
+    CmdPauseOff,
+    CmdPauseOn,
+    CmdTap,
+    CmdTick,
+)
+from timebank_app.domain.engine import Decider
+from timebank_app.infra.effects import EffectSink, SoundRepo
+from timebank_app.infra.event_store import EventStore, MemoryEventStore, SqliteEventStore
+from timebank_app.infra.log_reader import decode_event, iter_log_records
+from timebank_app.infra.logging import LogWriter
+
+
+def play(tmp_path: Path, store: EventStore) -> list[str]:
+    controller = GameController(
+        decider=Decider("pw"),
+        log_writer=store,
+        effects=EffectSink(),
+        sound_repo=SoundRepo(tmp_path / "sounds"),
+    )
+    start(controller)
+    lines = []
+    for now in (3.0, 4.0, 9.0, 9.5, 12.0):
+        lines += controller.dispatch(CmdTap(now_mono=now)).log_lines
+    lines += controller.dispatch(CmdTick(now_mono=12.5)).log_lines
+    controller.dispatch(CmdPauseOn(now_mono=13.0, cause="manual"))
+    controller.dispatch(CmdAdminAuth(now_mono=13.0, password="pw"))
+    controller.dispatch(
+        CmdAdminEdit(now_mono=13.0, edit_type="new_game", payload={"game_id": "g2"})
+    )
+    controller.dispatch(CmdPauseOff(now_mono=14.0))
+    lines += controller.dispatch(CmdTap(now_mono=20.0)).log_lines
+    return [line.split(" ", 1)[1] for line in lines]
+
+
+def test_backends_log_the_same_lines(tmp_path: Path):
+    text = play(tmp_path, LogWriter(tmp_path / "events.log"))
+    memory = MemoryEventStore()
+    assert play(tmp_path, memory) == text
+    sqlite = SqliteEventStore(tmp_path / "events.sqlite3")
+    assert play(tmp_path, sqlite) == text
+
+    records = list(iter_log_records(tmp_path / "events.log"))
+    stored = sqlite.query()
+    assert [item.seq for item in stored] == [record.seq for record in records]
+    assert [item.event.event_type for item in stored] == [r.event_type for r in records]
+    assert stored[0].game_id == "g1" and stored[-1].game_id == "g2"
+    assert [item.event for item in stored] == [item.event for item in memory.events]
+    assert [decode_event(record).data for record in records if record.event_type == "TURN_END"] == [
+        item.event.data for item in stored if item.event.event_type == "TURN_END"
+    ]
+    sqlite.close()
+
+
+def test_sqlite_lookups_use_indexes_and_survive_reopen(tmp_path: Path):
+    path = tmp_path / "events.sqlite3"
+    store = SqliteEventStore(path)
+    play(tmp_path, store)
+    now = datetime.now(tz=UTC)
+    month = {"since": now - timedelta(days=30), "until": now + timedelta(minutes=1)}
+
+    ends = store.query(event_types=["TURN_END"], player="A", **month)
+    assert ends and all(item.event.data["player"] == "A" for item in ends)
+    assert store.query(event_types=["TURN_END"], player="A", until=now - timedelta(days=1)) == []
+    assert "events_type" in store.query_plan(event_types=["TURN_END"], player="A", **month)
+    assert "events_game" in store.query_plan(game_id="g2")
+    assert [item.event.event_type for item in store.query(game_id="g2", limit=1)] == [
+        "TECH_PAUSE_OFF"
+    ]
+    seq = store.seq
+    store.close()
+
+    reopened = SqliteEventStore(path)
+    assert (reopened.seq, reopened.last_game_id) == (seq, "g2")
+    reopened.flush()
+    reopened.close()
+
+
+def test_log_writer_batch_is_one_write(tmp_path: Path):
+    writer = LogWriter(tmp_path / "events.log")
+    evt = type("Evt", (), {"event_type": "X", "data": {}})()
+    assert writer.append_batch([]) == []
+    lines = writer.append_batch([("g", evt), ("g", evt)])
+    assert [line.split(" ")[1] for line in lines] == ["SEQ=1", "SEQ=2"]
+    assert (tmp_path / "events.log").read_text(encoding="utf-8").count("EVENT=X") == 2
@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+
+import pytest
+from test_analytics import play
+
+from timebank_app.infra.archive import archive_log
+from timebank_app.infra.log_reader import iter_log_records
+
+np = pytest.importorskip("numpy")
+analytics = pytest.importorskip("timebank_app.app.analytics")
+export = pytest.importorskip("timebank_app.app.export")
+
+
+def test_incremental_export_matches_the_log(tmp_path: Path):
+    log = tmp_path / "events.log"
+    out = tmp_path / "export"
+    play(log, "g1")
+    first = export.export_logs([log], out)
+    assert first == sum(1 for _ in iter_log_records(log))
+    assert export.export_logs([log], out) == 0
+
+    play(log, "g2")
+    second = export.export_logs([log], out)
+    records = list(iter_log_records(log))
+    assert first + second == len(records)
+
+    manifest = json.loads((out / export.MANIFEST).read_text(encoding="utf-8"))
+    dictionary = json.loads((out / export.DICTIONARY).read_text(encoding="utf-8"))
+    assert [part["rows"] for part in manifest["parts"]] == [first, second]
+    assert dictionary["event_types"][:3] == list(analytics.EVENT_KINDS)
+
+    columns = export.load_export(out)
+    assert columns.seq.tolist() == [record.seq for record in records]
+    assert [dictionary["event_types"][code] for code in columns.kind] == [
+        record.event_type for record in records
+    ]
+    starts = columns.kind == dictionary["event_types"].index("GAME_START")
+    assert [columns.game_ids[code] for code in columns.game[starts]] == ["g1", "g2"]
+
+    turns = export.load_export(out, event_types=analytics.EVENT_KINDS, mmap=False)
+    expected = analytics.player_aggregates(analytics.load_columns([log]))
+    players = analytics.player_aggregates(turns)
+    for name in ("A", "B"):
+        got, want = players.names.index(name), expected.names.index(name)
+        assert players.turns[got] == expected.turns[want]
+        assert players.countdown_seconds[got] == pytest.approx(expected.countdown_seconds[want])
+        assert players.warns[got] == expected.warns[want]
+
+
+def test_single_game_export_is_memory_mapped(tmp_path: Path):
+    log = tmp_path / "events.log"
+    play(log, "g1")
+    play(log, "g2")
+    out = tmp_path / "g2"
+    rows = export.export_logs([log], out, game_id="g2")
+    columns = export.load_export(out)
+    assert isinstance(columns.seq, np.memmap) and len(columns) == rows
+    assert columns.game_ids == ["g2"] and set(columns.game.tolist()) == {0}
+    with pytest.raises(export.ExportError):
+        export.export_logs([log], out)
+
+
+def test_rewritten_archive_is_not_exported_twice(tmp_path: Path):
+    log = tmp_path / "events.log"
+    archive = tmp_path / "season.tba"
+    out = tmp_path / "export"
+    play(log, "g1")
+    archive_log(log, archive)
+    rows = export.export_logs([archive], out)
+    assert rows == sum(1 for _ in iter_log_records(log))
+
+    play(log, "g2")
+    rewritten = tmp_path / "season.tba.new"
+    archive_log(log, rewritten)
+    os.replace(rewritten, archive)
+    added = export.export_logs([archive], out)
+    assert rows + added == sum(1 for _ in iter_log_records(log))
+    assert export.load_export(out).seq.tolist() == [r.seq for r in iter_log_records(log)]
@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from test_controller_infra import make_controller, start
+
+from timebank_app.app.history import EventHistory
+from timebank_app.domain.commands import CmdAdminAuth, CmdAdminEdit, CmdTap
+from timebank_app.domain.events import ev
+from timebank_app.infra.clock import VirtualClock
+
+
+def test_controller_history_answers_recent_turn_queries(tmp_path: Path):
+    controller = make_controller(tmp_path)
+    start(controller)
+    for now in (3.0, 6.0, 10.0):
+        controller.dispatch(CmdTap(now_mono=now))
+    controller.dispatch(CmdAdminAuth(now_mono=10.0, password="pw"))
+    controller.dispatch(
+        CmdAdminEdit(now_mono=10.0, edit_type="rename_player", payload={"old": "A", "new": "Ann"})
+    )
+
+    turns = controller.history.last_turns(2)
+    assert [entry.player for entry in turns] == ["Ann", "B"]
+    assert turns[0].seq > turns[1].seq
+    assert turns[0].spent == 3.0 and turns[0].game_id == "g1"
+    assert len(controller.history.query(player="Ann", event_types={"TURN_END"})) == 2
+    assert controller.history.query(player="A") == []
+
+
+def test_history_is_bounded_and_filters_by_time_window():
+    clock = VirtualClock(wall=1000.0)
+    history = EventHistory(capacity=64, clock=clock)
+    size = history.nbytes()
+    for seq in range(1, 12 * 3600):
+        clock.advance(1.0)
+        history.record(
+            "g", seq, ev("TURN_END", player=f"P{seq % 7}", bank_after=1.0, spent_no_cooldown=2.0)
+        )
+
+    assert len(history) == 64
+    assert history.nbytes() == size
+    newest = history.query(limit=1)[0]
+    assert newest.seq == 12 * 3600 - 1
+    window = history.query(since=clock.time() - 9.5, until=clock.time() - 4.5)
+    assert [entry.seq for entry in window] == list(range(newest.seq - 5, newest.seq - 10, -1))
+    assert {entry.player for entry in history.query(player="P3")} == {"P3"}
+
+
+def test_name_tables_are_pruned_and_renames_merge():
+    history = EventHistory(capacity=8, clock=VirtualClock(wall=1000.0))
+    for seq in range(1, 1001):
+        history.record(f"g{seq}", seq, ev("TURN_END", player=f"P{seq}", bank_after=1.0))
+    assert len(history._players.names) <= 8 and len(history._games.names) <= 8
+
+    history.record("g", 1001, ev("TURN_END", player="Ann", bank_after=1.0))
+    history.record("g", 1002, ev("TURN_END", player="Bob", bank_after=1.0))
+    history.record(
+        "g", 1003, ev("ADMIN_EDIT", edit_type="rename_player", payload={"old": "Bob", "new": "Ann"})
+    )
+    assert [entry.seq for entry in history.query(player="Ann")] == [1002, 1001]
+    assert history.query(player="Bob") == []
@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import random
+from datetime import UTC, datetime
+from pathlib import Path
+
+from test_controller_infra import make_controller, start
+
+from timebank_app.domain.commands import CmdTap
+from timebank_app.domain.events import Event
+from timebank_app.domain.models import Mode
+from timebank_app.infra.clock import VirtualClock
+from timebank_app.infra.logging import LineEncoder, StampClock, format_line
+
+VALUES = [0, -3, 7.25, 1e-07, True, None, "A", "Player 1", "", "a\tb", "x{y}", Mode.RUNNING]
+
+
+def random_value(rng: random.Random) -> object:
+    kind = rng.random()
+    if kind < 0.15:
+        return [rng.choice(VALUES) for _ in range(rng.randrange(4))]
+    if kind < 0.25:
+        return {rng.choice("zab"): rng.choice(VALUES) for _ in range(rng.randrange(3))}
+    return rng.choice(VALUES)
+
+
+def test_encoder_matches_format_line():
+    rng = random.Random(48)
+    encoder = LineEncoder()
+    for _ in range(2000):
+        keys = rng.sample(["player", "bank_after", "now_mono", "b", "a{", "tail"], rng.randrange(5))
+        event = Event(rng.choice(["TURN_END", "X", "{T}"]), {k: random_value(rng) for k in keys})
+        game_id = rng.choice(["", "g1", "game 2"])
+        seq = rng.randrange(1, 10**9)
+        expected = format_line("2026-03-01T12:00:00.000+00:00", seq, game_id, event)
+        assert encoder.encode("2026-03-01T12:00:00.000+00:00", seq, game_id, event) == expected
+
+
+def test_stamp_clock_follows_monotonic_time():
+    clock = VirtualClock(mono=10.0, wall=1_772_366_400.0)
+    stamps = StampClock(clock, resync=60.0)
+
+    def expected() -> str:
+        return datetime.fromtimestamp(clock.wall, tz=UTC).isoformat(timespec="milliseconds")
+
+    assert stamps() == expected() == "2026-03-01T12:00:00.000+00:00"
+    for step in (0.0004, 0.0007, 0.25, 0.999, 1.5, 59.0):
+        clock.advance(step)
+        assert stamps() == expected()
+    clock.advance(1.0)
+    assert stamps() == expected()
+    before = stamps()
+    clock.wall -= 0.5  # steps of the wall clock only show up at the next re-anchor
+    assert stamps() == before
+    clock.mono += 60.0
+    assert stamps() == before  # and a small step back is absorbed
+    clock.advance(0.75)
+    assert before == "2026-03-01T12:01:02.750+00:00"
+    assert stamps() == "2026-03-01T12:01:03.500+00:00"  # 0.5 s ahead until the next re-anchor
+    clock.wall -= 3600.0
+    clock.mono += 60.0
+    assert stamps() == expected()  # a large one is followed instead of freezing stamps
+    clock.advance(0.25)
+    assert stamps() == expected()
+
+
+def test_controller_can_skip_log_lines(tmp_path: Path):
+    (tmp_path / "kept").mkdir()
+    (tmp_path / "skipped").mkdir()
+    kept = make_controller(tmp_path / "kept")
+    skipped = make_controller(tmp_path / "skipped")
+    skipped.keep_log_lines = False
+    for controller in (kept, skipped):
+        start(controller)
+    assert kept.dispatch(CmdTap(now_mono=3.0)).log_lines
+    assert skipped.dispatch(CmdTap(now_mono=3.0)).log_lines == []
+
+    def body(path: Path) -> list[str]:
+        lines = path.read_text(encoding="utf-8").splitlines()
+        return [line.split(" ", 1)[-1] for line in lines]
+
+    assert body(tmp_path / "kept" / "events.log") == body(tmp_path / "skipped" / "events.log")
@@ -0,0 +1,131 @@
+from __future__ import annotations
+
+import os
+import shutil
+import threading
+from pathlib import Path
+
+from test_controller_infra import make_controller, start
+
+from timebank_app.domain.commands import CmdTap
+from timebank_app.infra.log_follower import LogFollower
+from timebank_app.infra.logging import LogWriter
+
+
+def event(name: str):
+    return type("Evt", (), {"event_type": name, "data": {}})()
+
+
+def test_poll_returns_only_new_complete_lines(tmp_path: Path):
+    controller = make_controller(tmp_path)
+    path = tmp_path / "events.log"
+    follower = LogFollower(path)
+    assert follower.poll() == []
+
+    start(controller)
+    assert [record.event_type for record in follower.poll()] == ["GAME_START", "TURN_START"]
+    reads = follower.reads
+    assert follower.poll() == [] and follower.reads == reads
+
+    controller.dispatch(CmdTap(now_mono=3.0))
+    assert "TURN_END" in [record.event_type for record in follower.poll()]
+
+    seq = controller.log_writer.seq
+    with path.open("a", encoding="utf-8") as handle:
+        handle.write(f"2026-01-01T00:00:00.000+00:00 SEQ={seq + 1} G=g1 EVENT=PAU")
+    assert follower.poll() == []
+    with path.open("a", encoding="utf-8") as handle:
+        handle.write("SE_ON cause=manual\n")
+    [record] = follower.poll()
+    assert (record.seq, record.event_type) == (seq + 1, "PAUSE_ON")
+    follower.close()
+
+
+def test_checkpoint_resumes_after_restart(tmp_path: Path):
+    path = tmp_path / "events.log"
+    checkpoint = tmp_path / "follower.pos"
+    writer = LogWriter(path)
+    for name in ("A", "B"):
+        writer.append("g", event(name))
+
+    follower = LogFollower(path, checkpoint=checkpoint, checkpoint_interval=3600)
+    assert [record.seq for record in follower.poll()] == [1, 2]
+    follower.close()
+
+    writer.append("g", event("C"))
+    resumed = LogFollower(path, checkpoint=checkpoint)
+    assert [record.event_type for record in resumed.poll()] == ["C"]
+    assert resumed.position.seq == 3 and resumed.reopens == 0
+
+
+def test_crash_before_processing_replays_the_batch(tmp_path: Path):
+    path = tmp_path / "events.log"
+    checkpoint = tmp_path / "follower.pos"
+    writer = LogWriter(path)
+    for name in ("A", "B"):
+        writer.append("g", event(name))
+
+    crashed = LogFollower(path, checkpoint=checkpoint, checkpoint_interval=0)
+    assert [record.seq for record in crashed.poll()] == [1, 2]
+    # The process dies before handling the batch: no close, no further poll.
+    crashed.close_file()
+
+    resumed = LogFollower(path, checkpoint=checkpoint, checkpoint_interval=0)
+    assert [record.seq for record in resumed.poll()] == [1, 2]
+    writer.append("g", event("C"))
+    assert [record.seq for record in resumed.poll()] == [3]
+    resumed.close_file()
+
+    again = LogFollower(path, checkpoint=checkpoint)
+    assert [record.seq for record in again.poll()] == [3]
+    again.commit()
+    again.close_file()
+    assert [record.seq for record in LogFollower(path, checkpoint=checkpoint).poll()] == []
+
+
+def test_rotation_and_truncation_do_not_repeat_or_lose_events(tmp_path: Path):
+    path = tmp_path / "events.log"
+    writer = LogWriter(path)
+    for name in ("A", "B"):
+        writer.append("g", event(name))
+    follower = LogFollower(path)
+    assert len(follower.poll()) == 2
+
+    # Replaced by a rewritten copy (as compact_log does) that keeps the SEQs.
+    writer.append("g", event("C"))
+    shutil.copy(path, tmp_path / "copy.log")
+    os.replace(tmp_path / "copy.log", path)
+    writer.append("g", event("D"))
+    assert [record.event_type for record in follower.poll()] == ["C", "D"]
+    assert follower.reopens == 1
+
+    # Truncated and started over: SEQ numbering restarts, everything is new.
+    path.unlink()
+    (tmp_path / "events.log.seq").unlink(missing_ok=True)
+    fresh = LogWriter(path)
+    fresh.append("g2", event("E"))
+    assert [(record.seq, record.event_type) for record in follower.poll()] == [(1, "E")]
+
+
+def test_follow_streams_until_stopped(tmp_path: Path):
+    path = tmp_path / "events.log"
+    writer = LogWriter(path)
+    follower = LogFollower(path, event_types={"KEEP"}, min_sleep=0.001, max_sleep=0.01)
+    stop = threading.Event()
+    seen: list[int] = []
+
+    def consume() -> None:
+        for record in follower.follow(stop):
+            seen.append(record.seq)
+            if len(seen) == 5:
+                stop.set()
+
+    reader = threading.Thread(target=consume)
+    reader.start()
+    for _ in range(5):
+        writer.append("g", event("SKIP"))
+        writer.append("g", event("KEEP"))
+    reader.join(timeout=5)
+    assert not reader.is_alive()
+    assert seen == [2, 4, 6, 8, 10]
+    assert follower.position.seq == 10
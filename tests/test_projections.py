@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from test_controller_infra import make_controller, start
+
+from timebank_app.app.projections import (
+    LeaderboardProjection,
+    PlayerStatsProjection,
+    ProjectionSet,
+)
+from timebank_app.app.time_travel import replay_games
+from timebank_app.domain.commands import CmdAdminAuth, CmdAdminEdit, CmdTap
+from timebank_app.infra.log_reader import decode_event, iter_log_records
+
+
+def test_projections_follow_dispatch(tmp_path: Path):
+    controller = make_controller(tmp_path)
+    projections = ProjectionSet([PlayerStatsProjection(), LeaderboardProjection()])
+    controller.subscribe(projections)
+    start(controller)
+    controller.dispatch(CmdTap(now_mono=13.0))  # A: 12s countdown, 2 warns
+    controller.dispatch(CmdTap(now_mono=15.0))  # B: 1s cooldown + 1s countdown
+
+    stats = projections.get("player_stats")
+    assert stats.players["A"].turns == 1
+    assert stats.players["A"].time_used == 12.0
+    assert stats.players["A"].warns == 2
+    assert stats.players["B"].mean_turn == 1.0
+    assert projections.last_seq == controller.log_writer.seq
+
+    board = projections.get("leaderboard").leaderboard()
+    assert [row.player for row in board] == ["B", "A"]
+    assert board[1].mean_bank_left == 18.0
+
+    controller.dispatch(CmdAdminAuth(now_mono=16.0, password="pw"))
+    controller.dispatch(
+        CmdAdminEdit(now_mono=17.0, edit_type="rename_player", payload={"old": "A", "new": "Ann"})
+    )
+    assert "Ann" in stats.players and "A" not in stats.players
+
+
+def test_projection_checkpoint_roundtrip(tmp_path: Path):
+    controller = make_controller(tmp_path)
+    checkpoint = tmp_path / "projections.json"
+    projections = ProjectionSet(
+        [PlayerStatsProjection(), LeaderboardProjection()],
+        checkpoint_path=checkpoint,
+        checkpoint_every=1,
+    )
+    controller.subscribe(projections)
+    start(controller)
+    controller.dispatch(CmdTap(now_mono=4.0))
+    assert checkpoint.exists()
+
+    restored = ProjectionSet(
+        [PlayerStatsProjection(), LeaderboardProjection()], checkpoint_path=checkpoint
+    )
+    assert restored.restore() == controller.log_writer.seq
+    assert restored.get("player_stats").players["A"].time_used == 3.0
+    assert restored.get("leaderboard").leaderboard()[0].player == "B"
+
+
+def test_leaderboard_follows_admin_edits_like_a_rebuild(tmp_path: Path):
+    controller = make_controller(tmp_path)
+    live = LeaderboardProjection()
+    controller.subscribe(ProjectionSet([live]))
+    start(controller)
+    for now in (3.0, 6.0, 10.0):
+        controller.dispatch(CmdTap(now_mono=now))
+    controller.dispatch(CmdAdminAuth(now_mono=11.0, password="pw"))
+    for edit_type, payload in (
+        ("rename_player", {"old": "A", "new": "Ann"}),
+        ("undo", {"steps": 2}),
+        ("new_game", {"game_id": "g2"}),
+        ("remove_player", {"player": "B"}),
+    ):
+        controller.dispatch(CmdAdminEdit(now_mono=12.0, edit_type=edit_type, payload=payload))
+    controller.dispatch(CmdTap(now_mono=20.0))
+
+    path = controller.log_writer.path
+    rebuilt = LeaderboardProjection()
+    for record in iter_log_records(path):
+        rebuilt.apply(record.game_id, record.seq, decode_event(record))
+    states = replay_games(iter_log_records(path))
+
+    # A replayed game's state continues into the new_game edit that ends it.
+    assert live.banks["g2"] == states["g2"].bank == {"Ann": 23.0}
+    assert rebuilt.banks == live.banks
+    assert rebuilt.leaderboard() == live.leaderboard()
+    assert live.banks["g1"] == {"Ann": 28.0, "B": 28.0}
+    assert list(live.undo["g2"]) == [("Ann", 23.0, 7.0)]
+    assert [(row.player, row.games) for row in live.leaderboard()] == [("B", 1), ("Ann", 2)]
+    restored = LeaderboardProjection()
+    restored.restore(live.snapshot())
+    assert restored.leaderboard() == live.leaderboard() and restored.undo == live.undo
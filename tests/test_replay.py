@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+from test_controller_infra import make_controller, start
+
+from timebank_app.app.replay import (
+    MAX_SPEED,
+    ReplayDriver,
+    ReplayStep,
+    parse_speed,
+    replay_controller,
+    replay_steps,
+)
+from timebank_app.app.time_travel import state_summary
+from timebank_app.domain.commands import CmdPauseOn, CmdTap, CmdTick
+from timebank_app.domain.events import ev
+from timebank_app.infra.clock import VirtualClock
+from timebank_app.infra.log_reader import iter_log_records
+
+
+def test_parse_speed():
+    assert parse_speed("1") == 1.0
+    assert parse_speed("10x") == 10.0
+    assert parse_speed("MAX") == MAX_SPEED
+    with pytest.raises(ValueError):
+        parse_speed("0")
+
+
+def test_replay_at_max_speed_reproduces_state(tmp_path: Path):
+    controller = make_controller(tmp_path)
+    start(controller)
+    controller.dispatch(CmdTick(now_mono=2.0))
+    controller.dispatch(CmdTap(now_mono=3.0))
+    controller.dispatch(CmdTap(now_mono=9.5))
+    controller.dispatch(CmdPauseOn(now_mono=10.0, cause="manual"))
+
+    replayed = replay_controller(tmp_path / "sounds", tmp_path / "scratch.log")
+    seen: list[int] = []
+    replayed.subscribe(lambda _game, seq, _event: seen.append(seq))
+    driver = ReplayDriver(replayed, speed=MAX_SPEED)
+    report = driver.run(replay_steps(iter_log_records(tmp_path / "events.log")))
+
+    assert state_summary(replayed.state) == state_summary(controller.state)
+    assert report.events == len(seen) == controller.log_writer.seq
+    assert seen == sorted(seen)
+    assert driver.clock.monotonic() == 10.0
+    assert replayed.effects.played_sounds == controller.effects.played_sounds
+    assert (tmp_path / "scratch.log").read_text(encoding="utf-8") == "LOG_FORMAT v=1\n"
+
+
+def test_replay_paces_by_log_time(tmp_path: Path):
+    controller = make_controller(tmp_path)
+    real = VirtualClock()
+    slept: list[float] = []
+
+    def sleep(seconds: float) -> None:
+        slept.append(seconds)
+        real.advance(seconds)
+
+    steps = [
+        ReplayStep(seq=1, event=ev("NOOP"), wall=1000.0),
+        ReplayStep(seq=2, event=ev("NOOP"), wall=1010.0),
+        ReplayStep(seq=3, event=ev("NOOP"), wall=1060.0),
+    ]
+    driver = ReplayDriver(controller, speed=10.0, real_clock=real)
+    report = driver.run(steps, sleep=sleep)
+    assert slept == pytest.approx([1.0, 5.0])
+    assert report.log_seconds == 60.0
+    assert report.wall_seconds == pytest.approx(6.0)
+    assert driver.clock.monotonic() == 60.0
@@ -0,0 +1,158 @@
+from __future__ import annotations
+
+import multiprocessing
+import threading
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+import pytest
+from test_controller_infra import start
+
+from timebank_app.app.controller import GameController
+from timebank_app.app.replication import (
+    ReplicationError,
+    ReplicationFollower,
+    ReplicationLeader,
+)
+from timebank_app.domain.commands import CmdAdminAuth, CmdAdminEdit, CmdPauseOn, CmdTap
+from timebank_app.domain.engine import Decider
+from timebank_app.domain.models import OrderDir, TurnPhase
+from timebank_app.infra.clock import VirtualClock
+from timebank_app.infra.effects import EffectSink, SoundRepo
+from timebank_app.infra.event_store import MemoryEventStore
+
+
+def memory_controller(sounds: Path) -> GameController:
+    return GameController(
+        decider=Decider("pw"),
+        log_writer=MemoryEventStore(),
+        effects=EffectSink(),
+        sound_repo=SoundRepo(sounds),
+    )
+
+
+def wait_for(condition: Callable[[], bool], timeout: float = 5.0) -> None:
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "timed out"
+        time.sleep(0.001)
+
+
+def follow_and_tap(address: tuple[str, int], sounds: Path, results) -> None:
+    """Follower process: catch up, tap once and report what it sees."""
+    controller = memory_controller(sounds)
+    turn_ended = threading.Event()
+    controller.subscribe(
+        lambda _game, _seq, event: event.event_type == "TURN_END" and turn_ended.set()
+    )
+    follower = ReplicationFollower(controller, address).start()
+    follower.wait_synced(5.0)
+    caught_up = (follower.seq, follower.snapshots, dict(controller.state.bank))
+    started = time.perf_counter()
+    follower.tap()
+    turn_ended.wait(5.0)
+    latency = time.perf_counter() - started
+    wait_for(lambda: controller.state.turn.phase == TurnPhase.COOLDOWN)
+    state = controller.state
+    results.put((caught_up, follower.seq, state.current_player, dict(state.bank), latency))
+    follower.close()
+
+
+def test_follower_process_mirrors_the_leader_and_forwards_taps(tmp_path: Path):
+    leader_clock = VirtualClock(mono=0.0)
+    controller = memory_controller(tmp_path)
+    leader = ReplicationLeader(controller, host="127.0.0.1", port=0, clock=leader_clock)
+    start(controller)
+    started = controller.log_writer.seq
+    leader_clock.mono = 3.0
+
+    context = multiprocessing.get_context("fork")
+    results = context.Queue()
+    child = context.Process(target=follow_and_tap, args=(leader.address, tmp_path, results))
+    child.start()
+    caught_up, seq, current, bank, latency = results.get(timeout=10)
+    child.join(5)
+    leader.close()
+
+    assert caught_up == (started, 1, {"A": 30.0, "B": 30.0})
+    # The follower's tap landed at the leader's 3.0 s whatever its own clock says.
+    assert leader.forwarded == 1 and controller.state.bank == {"A": 28.0, "B": 30.0}
+    assert (seq, current, bank) == (controller.log_writer.seq, "B", controller.state.bank)
+    assert latency < 0.5
+
+
+def test_reconnect_resumes_from_last_seq_or_snapshot(tmp_path: Path):
+    controller = memory_controller(tmp_path)
+    leader = ReplicationLeader(controller, host="127.0.0.1", port=0, backlog=4)
+    start(controller)
+    mirror = memory_controller(tmp_path)
+
+    first = ReplicationFollower(mirror, leader.address).start()
+    assert first.wait_synced(5.0) and first.snapshots == 1
+    first.close()
+    leader.dispatch(CmdTap(now_mono=3.0))
+
+    resumed = ReplicationFollower(mirror, leader.address, seq=first.seq, epoch=first.epoch)
+    resumed.start()
+    assert resumed.wait_synced(5.0)
+    assert resumed.snapshots == 0 and resumed.applied == controller.log_writer.seq - first.seq
+    assert mirror.state.bank == controller.state.bank
+    resumed.close()
+
+    for now in (6.0, 9.0, 12.0):
+        leader.dispatch(CmdTap(now_mono=now))
+    late = ReplicationFollower(mirror, leader.address, seq=resumed.seq, epoch=resumed.epoch)
+    late.start()
+    assert late.wait_synced(5.0)
+    assert late.snapshots == 1 and late.seq == controller.log_writer.seq
+    assert mirror.state.bank == controller.state.bank
+    assert mirror.state.current_player == controller.state.current_player
+
+    leader.dispatch(CmdTap(now_mono=15.0))
+    wait_for(lambda: late.seq == controller.log_writer.seq)
+    assert mirror.state.bank == controller.state.bank
+    with pytest.raises(ValueError):
+        late.forward(CmdAdminAuth(now_mono=0.0, password="pw"))
+    late.close()
+    leader.close()
+    with pytest.raises(ReplicationError):
+        late.forward(CmdTap(now_mono=0.0))
+
+
+def test_rejected_command_keeps_the_follower_connected(tmp_path: Path):
+    controller = memory_controller(tmp_path)
+    leader = ReplicationLeader(controller, host="127.0.0.1", port=0)
+    start(controller)
+    leader.dispatch(CmdPauseOn(now_mono=1.0, cause="manual"))
+    follower = ReplicationFollower(memory_controller(tmp_path), leader.address).start()
+    assert follower.wait_synced(5.0)
+
+    follower.tap()
+    wait_for(lambda: follower.rejected)
+    assert follower.connects == 1 and follower.synced.is_set() and leader.followers == 1
+    follower.close()
+    leader.close()
+
+
+def test_follower_joining_during_a_dispatch_gets_a_consistent_state(tmp_path: Path):
+    controller = memory_controller(tmp_path)
+    leader = ReplicationLeader(controller, host="127.0.0.1", port=0)
+    start(controller)
+    leader.dispatch(CmdAdminAuth(now_mono=1.0, password="pw"))
+    mirror = memory_controller(tmp_path)
+    joined = []
+
+    def join_mid_dispatch(_game_id, _seq, event) -> None:
+        if event.event_type == "ADMIN_EDIT" and not joined:
+            joined.append(ReplicationFollower(mirror, leader.address, epoch="other").start())
+            time.sleep(0.2)  # let the follower register while the edit is half applied
+
+    controller.subscribe(join_mid_dispatch)
+    leader.dispatch(CmdAdminEdit(now_mono=2.0, edit_type="reverse", payload={}))
+    follower = joined[0]
+    assert follower.wait_synced(5.0)
+    wait_for(lambda: follower.seq == controller.log_writer.seq)
+    assert mirror.state.order_dir == controller.state.order_dir == OrderDir.COUNTERCLOCKWISE
+    follower.close()
+    leader.close()
@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+from timebank_app.ui.screens import KeyedControls, ScreenPool
+
+
+class FakeControl:
+    def __init__(self, name: str):
+        self.name = name
+        self.visible = True
+
+
+def test_screens_are_built_once_and_switched_by_visibility():
+    attached: list[FakeControl] = []
+    binds: list[str] = []
+    pool = ScreenPool(attach=attached.append)
+    for name in ("setup", "game", "pause"):
+        pool.register(
+            name, lambda name=name: FakeControl(name), lambda name=name: binds.append(name)
+        )
+
+    pool.show("setup")
+    for _ in range(300):
+        pool.show("game")
+        pool.show("pause")
+
+    assert pool.builds == 3
+    assert [control.name for control in attached] == ["setup", "game", "pause"]
+    assert [control.visible for control in attached] == [False, False, True]
+    assert pool.current == "pause"
+    assert binds.count("pause") == 300
+
+
+def test_keyed_controls_reuse_and_evict():
+    pool: KeyedControls[str, FakeControl] = KeyedControls(FakeControl)
+    first = pool.get("A")
+    assert pool.get("A") is first
+    pool.get("B")
+    pool.retain({"B", "C"})
+    assert len(pool) == 1
+    assert pool.get("A") is not first
+    assert pool.builds == 3
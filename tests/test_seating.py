@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+from copy import deepcopy
+
+from timebank_app.domain.commands import CmdAdminAuth, CmdAdminEdit, CmdStartGame, CmdTap
+from timebank_app.domain.engine import Decider, apply_event
+from timebank_app.domain.models import GameState, OrderDir, PlayerConfig, Rules
+from timebank_app.domain.seating import SeatRing
+
+
+def test_ring_behaves_like_the_name_list():
+    ring = SeatRing(["A", "B", "C"])
+    assert ring == ["A", "B", "C"]
+    assert list(ring) == ["A", "B", "C"]
+    assert len(ring) == 3 and "B" in ring and "Z" not in ring
+    assert ring[0] == "A" and ring[-1] == "C"
+    assert ",".join(ring) == "A,B,C"
+    assert [ring.next("C"), ring.prev("A")] == ["A", "C"]
+
+
+def test_ring_remove_and_rename_keep_neighbours():
+    ring = SeatRing(["A", "B", "C", "D"])
+    ring.remove("A")
+    assert ring == ["B", "C", "D"]
+    assert ring.prev("B") == "D"
+    ring.rename("C", "X")
+    assert ring == ["B", "X", "D"]
+    assert (ring.next("B"), ring.prev("D")) == ("X", "X")
+    ring.rename("X", "D")
+    assert ring == ["B", "D"]
+    ring.remove("B")
+    ring.rename("D", "Solo")
+    assert ring == ["Solo"] and ring.next("Solo") == "Solo"
+    ring.remove("Solo")
+    assert ring == [] and ring.first() is None
+
+
+def test_ring_copies_are_independent():
+    ring = SeatRing(["A", "B", "C"])
+    clone = deepcopy(ring)
+    clone.remove("B")
+    ring.rename("A", "Z")
+    assert ring == ["Z", "B", "C"]
+    assert clone == ["A", "C"]
+
+
+def test_large_table_rotates_both_ways_and_survives_edits():
+    names = [f"P{index:03d}" for index in range(200)]
+    decider = Decider("pw")
+    state = GameState()
+    commands = [
+        CmdStartGame(
+            now_mono=0.0,
+            game_id="big",
+            players=[PlayerConfig(name=name) for name in names],
+            order=names,
+            order_dir=OrderDir.CLOCKWISE,
+            rules=Rules(bank_initial=600, cooldown=0),
+        ),
+        CmdAdminAuth(now_mono=0.0, password="pw"),
+        CmdTap(now_mono=1.0),
+        CmdTap(now_mono=2.0),
+        CmdAdminEdit(now_mono=2.0, edit_type="remove_player", payload={"player": "P003"}),
+        CmdAdminEdit(
+            now_mono=2.0, edit_type="rename_player", payload={"old": "P001", "new": "Wolf"}
+        ),
+        CmdAdminEdit(now_mono=2.0, edit_type="reverse", payload={}),
+        CmdTap(now_mono=3.0),
+        CmdTap(now_mono=4.0),
+    ]
+    players = []
+    for command in commands:
+        for event in decider.decide(state, command):
+            state = apply_event(state, event)
+            if event.event_type == "TURN_START":
+                players.append(event.data["player"])
+
+    assert players == ["P000", "P001", "P002", "Wolf", "P000"]
+    assert len(state.order) == 199 and "P003" not in state.order
+    assert [snap.player for snap in state.undo_ring] == ["P002", "Wolf"]
@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from timebank_app.domain.models import PlayerConfig
+from timebank_app.infra.effects import RANDOM_SOUND, SoundRepo
+from timebank_app.ui.setup_rows import RowChange, SetupRowModel, sound_choices, visible_range
+
+
+def test_row_model_emits_single_row_changes_with_stable_keys():
+    model = SetupRowModel([PlayerConfig(name="A"), PlayerConfig(name="B")])
+    changes: list[RowChange] = []
+    model.listeners.append(changes.append)
+
+    key_c = model.add(PlayerConfig(name="C"))
+    key_a = model.rows()[0].key
+    model.remove(key_a)
+    model.update(key_c, color="#123456", name="Cid")
+
+    assert changes == [
+        RowChange("insert", key_c, 2),
+        RowChange("remove", key_a, 0),
+        RowChange("update", key_c, 1),
+    ]
+    assert [player.name for player in model.players()] == ["B", "Cid"]
+    assert model.row(key_c).player.color == "#123456"
+    assert model.has_name("B") and not model.has_name("A")
+
+
+def test_visible_range_is_bounded_by_viewport_not_row_count():
+    assert visible_range(0, 420, 64, 0) == (0, 0)
+    assert visible_range(0, 420, 64, 3) == (0, 3)
+    small = visible_range(0, 420, 64, 5000)
+    assert small == (0, 12)
+    start, stop = visible_range(64 * 1000, 420, 64, 5000)
+    assert (start, stop) == (996, 1012)
+    assert visible_range(10**9, 420, 64, 5000)[1] == 5000
+
+
+def test_sound_choices_are_cached_and_repo_listing_follows_mtime(tmp_path: Path):
+    repo = SoundRepo(tmp_path)
+    (tmp_path / "a.wav").write_text("x", encoding="utf-8")
+    first = sound_choices(tuple(repo.list_files()))
+    assert first == (("", "—"), (RANDOM_SOUND, "Случайный звук"), ("a.wav", "a.wav"))
+    assert sound_choices(tuple(repo.list_files())) is first
+    assert sound_choices(()) == (("", "—"),)
+    (tmp_path / "b.wav").write_text("x", encoding="utf-8")
+    assert repo.list_files() == ["a.wav", "b.wav"]
@@ -0,0 +1,30 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from timebank_app.app.simulator import SimulationProfile, run_simulation
+
+
+def small_profile() -> SimulationProfile:
+    return SimulationProfile(players=3, mean_turn=20.0, tick_interval=1.0, pause_chance=0.5)
+
+
+def test_simulation_drives_all_tables(tmp_path: Path):
+    report = run_simulation(tables=3, hours=0.2, out_dir=tmp_path, profile=small_profile())
+    assert report.commands > 0
+    assert report.events_by_type["GAME_START"] == 3
+    assert report.events_by_type["TURN_END"] > 0
+    assert report.events_by_type["TECH_PAUSE_ON"] > 0
+    assert report.log_lines == report.events + 3
+    assert len(list(tmp_path.glob("table-*.log"))) == 3
+
+
+def test_simulation_is_deterministic_for_seed(tmp_path: Path):
+    first = run_simulation(
+        tables=2, hours=0.2, out_dir=tmp_path / "a", profile=small_profile(), seed=7
+    )
+    second = run_simulation(
+        tables=2, hours=0.2, out_dir=tmp_path / "b", profile=small_profile(), seed=7
+    )
+    assert first.events_by_type == second.events_by_type
+    assert first.commands == second.commands
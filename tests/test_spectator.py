@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+import multiprocessing
+import time
+from dataclasses import replace
+from pathlib import Path
+
+import pytest
+from test_controller_infra import make_controller, start
+
+from timebank_app.domain.commands import CmdPauseOn, CmdTap, CmdTick
+from timebank_app.domain.models import GameState, Mode, TurnPhase
+from timebank_app.domain.seating import SeatRing
+from timebank_app.infra.spectator import SpectatorError, SpectatorPublisher, SpectatorView
+
+
+@pytest.fixture
+def publisher():
+    publisher = SpectatorPublisher(capacity=8, name_bytes=16)
+    yield publisher
+    publisher.close()
+
+
+def test_controller_publishes_once_per_changing_dispatch(tmp_path: Path, publisher):
+    controller = make_controller(tmp_path)
+    controller.add_state_listener(publisher)
+    view = SpectatorView(publisher.name)
+    assert view.read().order == ()
+
+    start(controller)
+    controller.dispatch(CmdTap(now_mono=3.0))
+    live = view.read()
+    assert (live.mode, live.current_player, live.phase) == (Mode.RUNNING, "B", TurnPhase.COOLDOWN)
+    assert live.order == ("A", "B") and live.banks == (28.0, 30.0)
+    assert live.phase_started_mono == 3.0 and live.cooldown == 1.0
+    assert live.bank_at("B", 3.5) == 30.0 and live.bank_at("B", 6.0) == 28.0
+    assert live.bank_at("A", 6.0) == 28.0
+
+    published = publisher.publishes
+    version = view.version
+    controller.dispatch(CmdTick(now_mono=3.5))
+    assert publisher.publishes == published and view.version == version
+    controller.dispatch(CmdPauseOn(now_mono=10.0, cause="manual"))
+    assert view.read().mode == Mode.TECH_PAUSE
+    assert view.version == version + 2
+    view.close()
+
+
+def test_long_names_and_extra_seats_are_cut(publisher):
+    names = [f"seat-{index}-ёёёёё" for index in range(12)]
+    state = GameState(
+        mode=Mode.RUNNING,
+        order=SeatRing(names),
+        bank=dict.fromkeys(names, 5.0),
+        current_player=names[10],
+    )
+    publisher.publish(state)
+    view = SpectatorView(publisher.name)
+    live = view.read()
+    assert len(live.order) == 8
+    assert live.order[0] == "seat-0-ёёёё"
+    assert live.current_player is None
+    view.close()
+
+
+def _read_many(name: str, count: int, results) -> None:
+    view = SpectatorView(name)
+    torn = 0
+    seen = set()
+    for _ in range(count):
+        live = view.read()
+        seen.add(live.version)
+        torn += len(set(live.banks)) > 1 or live.phase_started_mono != live.banks[0]
+    view.close()
+    results.put((torn, len(seen)))
+
+
+def test_concurrent_readers_never_see_a_half_written_state(publisher):
+    names = [f"P{index}" for index in range(8)]
+    state = GameState(order=SeatRing(names), bank=dict.fromkeys(names, 0.0))
+    publisher.publish(state)
+    context = multiprocessing.get_context("fork")
+    results = context.Queue()
+    readers = [
+        context.Process(target=_read_many, args=(publisher.name, 20_000, results)) for _ in range(2)
+    ]
+    for reader in readers:
+        reader.start()
+    value = 0.0
+    while any(reader.is_alive() for reader in readers):
+        time.sleep(0.0002)
+        value += 1.0
+        publisher.publish(
+            replace(
+                state,
+                bank=dict.fromkeys(names, value),
+                turn=replace(state.turn, phase_started_mono=value),
+            )
+        )
+    outcomes = [results.get(timeout=10) for _ in readers]
+    assert all(torn == 0 for torn, _ in outcomes)
+    assert all(versions > 1 for _, versions in outcomes)
+
+    # Readers exiting must not remove the block.
+    SpectatorView(publisher.name).close()
+
+
+def test_missing_block_raises():
+    with pytest.raises(SpectatorError):
+        SpectatorView("timebank-no-such-block")
@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+import random
+from collections import deque
+
+import pytest
+
+from timebank_app.domain.models import (
+    GameState,
+    Mode,
+    OrderDir,
+    PlayerConfig,
+    Rules,
+    TurnPhase,
+    TurnRuntime,
+    TurnSnapshot,
+)
+from timebank_app.domain.seating import SeatRing
+from timebank_app.infra.state_codec import SnapshotError, decode_state, encode_state
+
+NAMES = ["Ann", "Bob", "Ёжик", "玩家", "Zoë 2", "", "x" * 40, "🎲"]
+
+
+def random_state(rng: random.Random) -> GameState:
+    names = rng.sample(NAMES, rng.randint(0, len(NAMES)))
+    order = rng.sample(names, len(names))
+    players = [
+        PlayerConfig(name, rng.choice(["#FFFFFF", "#FF0000"]), rng.choice(["", "tap.wav"]))
+        for name in names
+    ]
+    ring: deque[TurnSnapshot] = deque(maxlen=rng.choice([None, 4, 32]))
+    for _ in range(rng.randint(0, 40)):
+        ring.append(
+            TurnSnapshot(
+                player=rng.choice(order) if order else "renamed",
+                bank_after=rng.uniform(-50, 600),
+                spent_no_cooldown=rng.uniform(0, 60),
+            )
+        )
+    last_turn_end = None
+    if order and rng.random() < 0.7:
+        last_turn_end = {"player": order[0], "bank_after": 12.5, "spent_no_cooldown": 3.0}
+        if rng.random() < 0.5:
+            last_turn_end["now_mono"] = rng.uniform(0, 1e6)
+    return GameState(
+        game_id=f"g{rng.randint(0, 999)}",
+        mode=rng.choice(list(Mode)),
+        players=players,
+        order=SeatRing(order),
+        order_dir=rng.choice(list(OrderDir)),
+        rules=Rules(rng.uniform(1, 3600), rng.uniform(0, 10), rng.randint(0, 120), "warn.wav"),
+        bank={name: rng.uniform(-100, 3600) for name in order},
+        current_player=rng.choice(order) if order and rng.random() < 0.8 else None,
+        turn=TurnRuntime(
+            rng.uniform(0, 1e6), rng.uniform(0, 1e6), rng.choice(list(TurnPhase)), 1.5, 7
+        ),
+        admin_mode=rng.random() < 0.5,
+        game_started=rng.random() < 0.5,
+        last_turn_end=last_turn_end,
+        undo_ring=ring,
+    )
+
+
+@pytest.mark.parametrize("seed", range(50))
+def test_random_states_round_trip(seed: int):
+    state = random_state(random.Random(seed))
+    decoded = decode_state(encode_state(state))
+    assert decoded == state
+    assert decoded.undo_ring.maxlen == state.undo_ring.maxlen
+    assert list(decoded.order) == list(state.order)
+    assert decode_state(encode_state(decoded)) == decoded
+
+
+def test_live_snapshot_drops_undo_history_but_keeps_its_depth():
+    state = random_state(random.Random(3))
+    state.undo_ring.append(TurnSnapshot("Ann", 1.0, 2.0))
+    live = decode_state(encode_state(state, undo=False))
+    assert not live.undo_ring
+    assert live.undo_ring.maxlen == state.undo_ring.maxlen
+    assert live.bank == state.bank and live.order == state.order
+    assert len(encode_state(state, undo=False)) < len(encode_state(state))
+
+
+def test_undo_snapshots_do_not_grow_with_the_table():
+    order = tuple(f"P{index}" for index in range(10))
+    state = GameState(order=SeatRing(order))
+    one = len(encode_state(state))
+    for _ in range(2):
+        state.undo_ring.append(TurnSnapshot("P0", 1.0, 1.0))
+    # Each snapshot is a player ref, its bank and its spent time, whatever the seat count.
+    assert len(encode_state(state)) == one + 2 * (2 + 8 + 8)
+
+
+def test_bad_input_raises_snapshot_error():
+    data = encode_state(random_state(random.Random(1)))
+    with pytest.raises(SnapshotError):
+        decode_state(b"XYZ" + data[3:])
+    with pytest.raises(SnapshotError):
+        decode_state(data[:3] + bytes([99]) + data[4:])
+    with pytest.raises(SnapshotError):
+        decode_state(data[:-1])
+    with pytest.raises(SnapshotError):
+        decode_state(b"TB")
+    with pytest.raises(SnapshotError):
+        encode_state(GameState(game_id="a\0b"))
+    assert isinstance(SnapshotError("x"), ValueError)
+
+
+def test_corrupt_bytes_raise_only_snapshot_error():
+    data = encode_state(random_state(random.Random(7)))
+    for index in range(len(data)):
+        for value in (0x00, 0x7F, 0xFF, data[index] ^ 0x01):
+            corrupt = data[:index] + bytes([value]) + data[index + 1 :]
+            try:
+                decode_state(corrupt)
+            except SnapshotError:
+                pass
+    for size in range(len(data)):
+        with pytest.raises(SnapshotError):
+            decode_state(data[:size])
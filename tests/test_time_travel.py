@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+import shutil
+from pathlib import Path
+
+from test_controller_infra import make_controller, start
+
+from timebank_app.app import time_travel
+from timebank_app.app.time_travel import LogTimeMachine, main, state_at, state_summary
+from timebank_app.domain.commands import (
+    CmdAdminAuth,
+    CmdAdminEdit,
+    CmdPauseOff,
+    CmdPauseOn,
+    CmdTap,
+    CmdTick,
+)
+from timebank_app.infra.log_reader import parse_log_line
+
+
+def record_session(tmp_path: Path):
+    controller = make_controller(tmp_path)
+    seen: dict[tuple[str, int], dict] = {}
+
+    def run(command) -> None:
+        result = controller.dispatch(command)
+        if result.log_lines:
+            last = parse_log_line(result.log_lines[-1])
+            seen[(last.game_id, last.seq)] = state_summary(controller.state)
+
+    start(controller)
+    now = 0.0
+    for turn in range(12):
+        for _ in range(6):
+            now += 0.5
+            run(CmdTick(now_mono=now))
+        now += 0.25
+        run(CmdTap(now_mono=now))
+        if turn == 5:
+            run(CmdPauseOn(now_mono=now, cause="manual"))
+            run(CmdAdminAuth(now_mono=now, password="pw"))
+            run(CmdAdminEdit(now_mono=now, edit_type="reorder", payload={"new_order": ["B", "A"]}))
+            run(
+                CmdAdminEdit(
+                    now_mono=now, edit_type="set_bank", payload={"player": "A", "value": 12.5}
+                )
+            )
+            run(CmdAdminEdit(now_mono=now, edit_type="undo", payload={"steps": 2}))
+            run(CmdAdminEdit(now_mono=now, edit_type="new_game", payload={"game_id": "g2"}))
+            run(CmdPauseOff(now_mono=now))
+    return controller, seen
+
+
+def test_state_at_matches_live_states(tmp_path: Path):
+    controller, seen = record_session(tmp_path)
+    machine = LogTimeMachine(controller.log_writer.path, snapshot_every=7)
+    assert set(machine.seqs("g2"))
+    for (game_id, seq), expected in seen.items():
+        assert state_summary(machine.state_at(game_id, seq)) == expected, (game_id, seq)
+
+
+def test_state_at_cli(tmp_path: Path, capsys):
+    controller, seen = record_session(tmp_path)
+    game_id, seq = next(key for key in seen if key[0] == "g1")
+    assert main([str(controller.log_writer.path), game_id, str(seq)]) == 0
+    assert '"game_id": "g1"' in capsys.readouterr().out
+    assert main([str(controller.log_writer.path)]) == 0
+    assert "g2 events=" in capsys.readouterr().out
+
+
+def test_saved_index_limits_a_query_to_the_nearest_snapshot(tmp_path: Path, monkeypatch):
+    controller, seen = record_session(tmp_path)
+    path = controller.log_writer.path
+    first = LogTimeMachine.load(path, snapshot_every=7)
+    first.refresh()
+    first.save()
+    assert first.index_path.exists()
+
+    parsed = []
+    parse = time_travel.parse_log_line
+    monkeypatch.setattr(time_travel, "parse_log_line", lambda line: parsed.append(1) or parse(line))
+    for (game_id, seq), expected in seen.items():
+        parsed.clear()
+        machine = LogTimeMachine.load(path, snapshot_every=7)
+        assert state_summary(machine.state_at(game_id, seq)) == expected, (game_id, seq)
+        assert len(parsed) < 7
+
+    before = controller.log_writer.seq
+    controller.dispatch(CmdTap(now_mono=100.0))
+    seq = controller.log_writer.seq
+    parsed.clear()
+    machine = LogTimeMachine.load(path, snapshot_every=7)
+    machine.refresh()
+    assert len(parsed) == seq - before  # only the appended lines are scanned
+    assert state_summary(machine.state_at("g2", seq)) == state_summary(controller.state)
+
+    # A rewritten log is a new file, so its index is rebuilt rather than trusted.
+    shutil.copy(path, tmp_path / "copy.log")
+    (tmp_path / "copy.log").replace(path)
+    parsed.clear()
+    assert state_summary(state_at(path, "g2", seq)) == state_summary(controller.state)
+    assert len(parsed) > 10
@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+ui_main = pytest.importorskip("timebank_app.ui.main", exc_type=ImportError)
+
+from timebank_app.infra.event_store import MemoryEventStore, SqliteEventStore  # noqa: E402
+
+
+class Built(Exception):
+    pass
+
+
+def built_store(tmp_path: Path, monkeypatch, argv: list[str]):
+    monkeypatch.chdir(tmp_path)
+    built = []
+
+    def create_controller(data_dir: Path, store: str = "log"):
+        built.append(real_create(data_dir, store))
+        raise Built
+
+    real_create = ui_main.create_controller
+    monkeypatch.setattr(ui_main, "create_controller", create_controller)
+    monkeypatch.setattr(ui_main, "run_flet_app", lambda target: target(SimpleNamespace()))
+    with pytest.raises(Built):
+        ui_main.main(argv)
+    return built[0].log_writer
+
+
+def test_store_option_reaches_the_controller(tmp_path: Path, monkeypatch):
+    store = built_store(tmp_path, monkeypatch, ["--store", "sqlite"])
+    assert isinstance(store, SqliteEventStore)
+    store.close()
+
+
+def test_replay_never_writes_to_the_live_log(tmp_path: Path, monkeypatch):
+    log = tmp_path / "appdata" / "logs" / "events.log"
+    store = built_store(tmp_path, monkeypatch, ["--replay", str(log)])
+    assert isinstance(store, MemoryEventStore)
+    assert not log.exists()